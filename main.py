@@ -9,26 +9,61 @@ KISA TTPs → Caldera Adversary Pipeline
 import argparse
 import sys
 import json
+import threading
 from pathlib import Path
 from datetime import datetime
 
-# 모듈 임포트
-from modules.steps.step1_pdf_processing import PDFProcessor
-from modules.steps.step2_abstract_flow import AbstractFlowExtractor
-from modules.steps.step3_concrete_flow import ConcreteFlowGenerator
-from modules.steps.step4_ability_generator import AbilityGenerator
-from modules.steps.step5_self_correcting import OfflineCorrector
-from modules.caldera.uploader import CalderaUploader
-from modules.caldera.executor import CalderaExecutor
-from modules.caldera.reporter import CalderaReporter
-from modules.caldera.agent_manager import AgentManager
-from modules.core.config import get_caldera_url, get_caldera_api_key, get_llm_provider
+# 모듈 임포트 (Step/Caldera/VM/LLM SDK 모듈은 선택된 Step에서만 임포트하여 기동 시간 단축)
+from modules.core.config import get_caldera_url, get_caldera_api_key, get_llm_provider, get_llm_model
 from modules.core.metrics import init_metrics, get_metrics_tracker
-from modules.ai.factory import get_llm_client
-from scripts import vm_reload
 import yaml
 
 
+def get_vm_controller():
+    """VirtualBox 컨트롤러 생성 (paramiko는 VM을 다룰 때만 로드)"""
+    from scripts import vm_reload
+
+    return vm_reload.VBoxController()
+
+
+def shutdown_vms(reason):
+    """중단/오류 시 VM 종료 시도 (실패는 무시)"""
+    try:
+        print(f"\n[VM 종료] {reason} VM을 종료합니다...")
+        get_vm_controller().shutdown_all()
+    except Exception:
+        pass
+
+
+def wait_for_operation(executor, operation_id, timeout=None):
+    """Operation 완료 대기 (기한 초과 시 Operation을 중지하고 진행)."""
+    if executor.wait_for_completion(operation_id, timeout=timeout):
+        progress = executor.last_progress
+        print(f"  [OK] Operation 완료 ({progress.finished_links} links, {progress.elapsed:.0f}초, 상태 조회 {progress.polls}회, link 조회 {progress.link_fetches}회)")
+        return True
+
+    print(f"  [WARNING] Operation 완료 대기 시간 초과 ({timeout:.0f}초): Operation을 중지하고 현재까지의 결과를 수집합니다.")
+    try:
+        executor.stop_operation(operation_id)
+    except Exception as e:
+        print(f"  [WARNING] Operation 중지 실패: {e}")
+    return False
+
+
+def delete_retry_adversary(adversary_id):
+    """재시도용 임시 Adversary 삭제 (실패해도 파이프라인은 계속 진행)."""
+    from modules.caldera.client import get_caldera_client
+
+    try:
+        response = get_caldera_client().delete(f"/api/v2/adversaries/{adversary_id}")
+        if response.status_code in (200, 204, 404):
+            print(f"  [OK] 재시도용 Adversary 삭제: {adversary_id}")
+        else:
+            print(f"  [WARNING] 재시도용 Adversary 삭제 실패: {adversary_id} (HTTP {response.status_code})")
+    except Exception as e:
+        print(f"  [WARNING] 재시도용 Adversary 삭제 실패: {adversary_id} ({e})")
+
+
 def parse_step_range(step_arg):
     """
     --step 인자 파싱
@@ -132,6 +167,122 @@ def main():
         help="중간 결과 저장 디렉토리 (기본: data/processed)"
     )
 
+    parser.add_argument(
+        "--pdf-workers",
+        type=int,
+        default=1,
+        help="Step 1 PDF 텍스트 추출 프로세스 수 (기본: 1 = 순차 추출)"
+    )
+
+    parser.add_argument(
+        "--pdf-backend",
+        type=str,
+        choices=["pymupdf", "pdfplumber"],
+        default="pymupdf",
+        help="Step 1 PDF 텍스트 추출 백엔드 (기본: pymupdf, 미설치 시 pdfplumber로 대체)"
+    )
+
+    parser.add_argument(
+        "--no-pdf-cache",
+        action="store_true",
+        help="Step 1 추출 캐시를 사용하지 않고 항상 PDF를 다시 파싱"
+    )
+
+    parser.add_argument(
+        "--keep-boilerplate",
+        action="store_true",
+        help="Step 1에서 반복되는 머리말/꼬리말/쪽번호를 제거하지 않음"
+    )
+
+    parser.add_argument(
+        "--stream-step1",
+        action="store_true",
+        help="Step 1 페이지를 step1.jsonl로 스트리밍 기록 (Step 2도 실행하면 추출 완료 전부터 분석 시작). "
+             "머리말/꼬리말 제거는 도착한 페이지까지의 누적 빈도로 판단하므로, 문서 중간부터 반복되는 문구는 "
+             "앞쪽 페이지에 남을 수 있음"
+    )
+
+    parser.add_argument(
+        "--step2-mode",
+        type=str,
+        choices=["sequential", "map-reduce"],
+        default="sequential",
+        help="Step 2 청크 분석 방식 (sequential: 순차 분석, map-reduce: 청크 동시 분석 후 중복 목표 병합)"
+    )
+
+    parser.add_argument(
+        "--llm-workers",
+        type=int,
+        default=4,
+        help="map-reduce 모드의 동시 LLM 호출 수 (기본: 4)"
+    )
+
+    parser.add_argument(
+        "--fix-workers",
+        type=int,
+        default=4,
+        help="Step 5 실패 ability 동시 수정 수 (1이면 순차 수정, 기본: 4)"
+    )
+
+    parser.add_argument(
+        "--chunker",
+        type=str,
+        choices=["fixed", "semantic"],
+        default="fixed",
+        help="Step 2 청크 분할 방식 (fixed: 8000자 고정, semantic: 페이지/문단 경계 + 토큰 예산)"
+    )
+
+    parser.add_argument(
+        "--chunk-tokens",
+        type=int,
+        default=None,
+        help="semantic 청커의 청크당 토큰 예산 (기본: LLM 공급자별 값, STEP2_CHUNK_TOKENS 환경변수)"
+    )
+
+    parser.add_argument(
+        "--chunk-overlap",
+        type=int,
+        default=0,
+        help="semantic 청커에서 이전 청크 끝부분을 반복할 토큰 수 (기본: 0)"
+    )
+
+    parser.add_argument(
+        "--technique-ranker",
+        type=str,
+        choices=["keyword", "tfidf"],
+        default="keyword",
+        help="Step 3 Technique 자동 선택 방식 (keyword: 토큰/부분 문자열 점수, tfidf: TF-IDF 코사인 유사도, numpy 필요)"
+    )
+
+    parser.add_argument(
+        "--llm-cache",
+        type=str,
+        choices=["off", "readwrite", "replay"],
+        default="off",
+        help="LLM 응답 캐시 (readwrite: 적중 시 재사용/미적중 시 저장, replay: 캐시된 응답만 사용, 기본: off)"
+    )
+
+    parser.add_argument(
+        "--retry-scope",
+        type=str,
+        choices=["full", "failed"],
+        default="full",
+        help="Step 5 재시도 실행 범위 (full: 전체 Adversary 재실행, failed: 수정된 ability와 선행 ability만 재실행)"
+    )
+
+    parser.add_argument(
+        "--operation-timeout",
+        type=float,
+        default=None,
+        help="Step 5 Operation 완료 대기 최대 시간(초). 초과 시 Operation을 중지하고 그때까지의 결과를 수집 (기본: 무제한)"
+    )
+
+    parser.add_argument(
+        "--correction-cache",
+        action="store_true",
+        help="Step 5 수정 결과 캐시 사용 (재실행에서 성공한 수정은 같은 명령어/에러에 LLM 호출 없이 재사용)"
+    )
+
     # 버전 ID (미지정 시 타임스탬프 자동 생성)
     parser.add_argument(
         "--version-id",
@@ -161,6 +312,11 @@ def main():
         print("[ERROR] --pdf 인자가 필요합니다 (결과 경로 규칙: data/processed/{pdf_stem}/{version_id}/)")
         sys.exit(1)
 
+    # Step 1 입력 검증 (스트리밍/일괄 모드 공통)
+    if 1 in steps and not Path(args.pdf).is_file():
+        print(f"[ERROR] Step 1 입력 PDF를 찾을 수 없습니다: {args.pdf}")
+        sys.exit(1)
+
     pdf_stem = Path(args.pdf).stem
     version_id = args.version_id or datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -179,12 +335,20 @@ def main():
     print(f"  - Version ID: {version_id}")
     print("="*70)
 
+    # LLM 응답 캐시 (get_llm_client() 호출 전에 초기화)
+    if args.llm_cache != "off":
+        from modules.ai.cache import init_llm_cache
+
+        llm_cache = init_llm_cache(mode=args.llm_cache)
+        print(f"LLM 응답 캐시: {args.llm_cache} ({llm_cache.path})")
+        print("="*70)
+
     # 메트릭 추적 초기화
+    # 모델 이름은 설정에서 읽음 (LLM을 쓰지 않는 Step만 실행할 때 SDK를 임포트하지 않도록)
     try:
         llm_provider = get_llm_provider()
-        llm_client = get_llm_client()
-        llm_model = getattr(llm_client, 'model', '') or getattr(llm_client, 'model_name', '')
-    except:
+        llm_model = get_llm_model(llm_provider)
+    except ValueError:
         llm_provider = "unknown"
         llm_model = "unknown"
 
@@ -198,27 +362,77 @@ def main():
     print(f"\n[메트릭 추적] LLM Provider: {llm_provider}, Model: {llm_model}")
     print("="*70)
 
-    # Step 1: PDF Processing
-    if 1 in steps:
-        if not args.pdf:
-            print("[ERROR] Step 1 실행 시 --pdf 인자가 필요합니다")
-            sys.exit(1)
+    step2_done = False
+
+    # Step 1 + 2: Streaming (Step 1 추출과 Step 2 분석을 동시에 진행)
+    if args.stream_step1 and 1 in steps and 2 in steps:
+        print("\n[Step 1-2] PDF Processing + Abstract Attack Flow Extraction (streaming)")
+        print("-" * 70)
+
+        from modules.steps.step1_pdf_processing import PDFProcessor, Step1StreamReader, step1_stream_path
+        from modules.steps.step2_abstract_flow import AbstractFlowExtractor
 
+        tracker.start_step("Step 1-2: PDF Processing + Abstract Flow Extraction (streaming)")
+        step1_errors = []
+
+        def run_step1():
+            try:
+                cache = None if args.no_pdf_cache else PDFProcessor.default_cache()
+                processor = PDFProcessor(workers=args.pdf_workers, cache=cache, backend=args.pdf_backend,
+                                         strip_boilerplate=not args.keep_boilerplate)
+                processor.stream_pdf(args.pdf, output_path=str(step1_output), version_id=version_id)
+            except Exception as e:
+                step1_errors.append(e)
+
+        # 이전 실행의 스트림 파일을 따라 읽지 않도록 먼저 삭제
+        stream_path = step1_stream_path(step1_output)
+        if stream_path.exists():
+            stream_path.unlink()
+
+        step1_thread = threading.Thread(target=run_step1, name="step1-stream", daemon=True)
+        step1_thread.start()
+        try:
+            reader = Step1StreamReader(stream_path, follow=True, is_producer_alive=step1_thread.is_alive)
+            extractor = AbstractFlowExtractor(mode=args.step2_mode, max_workers=args.llm_workers,
+                                              chunker=args.chunker, chunk_tokens=args.chunk_tokens,
+                                              chunk_overlap=args.chunk_overlap)
+            extractor.extract_abstract_flow(str(stream_path), str(step2_output), version_id=version_id,
+                                            stream_reader=reader)
+            step1_thread.join()
+            if step1_errors:
+                raise step1_errors[0]
+            tracker.end_step(success=True)
+        except Exception as e:
+            step1_thread.join()
+            error = step1_errors[0] if step1_errors else e
+            tracker.end_step(success=False, error_message=str(error))
+            raise error
+        step2_done = True
+
+    # Step 1: PDF Processing
+    elif 1 in steps:
         print("\n[Step 1] PDF Processing")
         print("-" * 70)
 
+        from modules.steps.step1_pdf_processing import PDFProcessor
+
         tracker.start_step("Step 1: PDF Processing")
         try:
-            processor = PDFProcessor()
+            cache = None if args.no_pdf_cache else PDFProcessor.default_cache()
+            processor = PDFProcessor(workers=args.pdf_workers, cache=cache, backend=args.pdf_backend,
+                                     strip_boilerplate=not args.keep_boilerplate)
             # version_id를 명시적으로 전달하여 동일 버전으로 연결
-            processor.process_pdf(args.pdf, output_path=str(step1_output), version_id=version_id)
+            if args.stream_step1:
+                processor.stream_pdf(args.pdf, output_path=str(step1_output), version_id=version_id)
+            else:
+                processor.process_pdf(args.pdf, output_path=str(step1_output), version_id=version_id)
             tracker.end_step(success=True)
         except Exception as e:
             tracker.end_step(success=False, error_message=str(e))
             raise
 
     # Step 2: Abstract Flow Extraction
-    if 2 in steps:
+    if 2 in steps and not step2_done:
         print("\n[Step 2] Abstract Attack Flow Extraction")
         print("-" * 70)
 
@@ -226,9 +440,13 @@ def main():
             print(f"[ERROR] {step1_output} 파일이 없습니다. Step 1을 먼저 실행하세요.")
             sys.exit(1)
 
+        from modules.steps.step2_abstract_flow import AbstractFlowExtractor
+
         tracker.start_step("Step 2: Abstract Flow Extraction")
         try:
-            extractor = AbstractFlowExtractor()
+            extractor = AbstractFlowExtractor(mode=args.step2_mode, max_workers=args.llm_workers,
+                                              chunker=args.chunker, chunk_tokens=args.chunk_tokens,
+                                              chunk_overlap=args.chunk_overlap)
             extractor.extract_abstract_flow(str(step1_output), str(step2_output), version_id=version_id)
             tracker.end_step(success=True)
         except Exception as e:
@@ -253,9 +471,11 @@ def main():
             print(f"[ERROR] {args.env} 파일이 없습니다.")
             sys.exit(1)
 
+        from modules.steps.step3_concrete_flow import ConcreteFlowGenerator
+
         tracker.start_step("Step 3: Concrete Flow Generation")
         try:
-            generator = ConcreteFlowGenerator()
+            generator = ConcreteFlowGenerator(technique_ranker=args.technique_ranker)
             generator.generate_concrete_flow(str(step2_output), args.env, str(step3_output), version_id=version_id)
             tracker.end_step(success=True)
         except Exception as e:
@@ -271,6 +491,8 @@ def main():
             print(f"[ERROR] {step3_output} 파일이 없습니다. Step 3을 먼저 실행하세요.")
             sys.exit(1)
 
+        from modules.steps.step4_ability_generator import AbilityGenerator
+
         tracker.start_step("Step 4: Caldera Ability Generation")
         try:
             generator = AbilityGenerator()
@@ -284,8 +506,10 @@ def main():
         if 5 in steps:
             print("\n[최적화] Step 5 준비: VM 재부팅 시작 (백그라운드)")
             print("-" * 70)
+            from modules.caldera.agent_manager import AgentManager
+
             agent_manager = AgentManager()
-            controller = vm_reload.VBoxController()
+            controller = get_vm_controller()
 
             # VM 종료
             try:
@@ -308,6 +532,12 @@ def main():
 
     # Step 5: Caldera Automation (Upload → Execute → Self-Correct)
     if 5 in steps:
+        from modules.steps.step5_self_correcting import OfflineCorrector
+        from modules.caldera.uploader import CalderaUploader
+        from modules.caldera.executor import CalderaExecutor
+        from modules.caldera.reporter import CalderaReporter
+        from modules.caldera.agent_manager import AgentManager
+
         tracker.start_step("Step 5: Caldera Automation")
 
         print("\n[Step 5] Caldera 자동화 (업로드 → 실행 → Self-Correcting)")
@@ -317,7 +547,7 @@ def main():
         if 4 not in steps:
             # Agent Manager 및 VM Controller 초기화
             agent_manager = AgentManager()
-            controller = vm_reload.VBoxController()
+            controller = get_vm_controller()
 
             print("\n[5-pre-1] VM 종료")
             print("-" * 70)
@@ -428,8 +658,7 @@ def main():
 
             # 완료 대기
             print(f"  Operation 완료 대기 중...")
-            executor.wait_for_completion(op_id, timeout=None)
-            print(f"  [OK] Operation 완료")
+            wait_for_operation(executor, op_id, args.operation_timeout)
 
             # 5-3. 결과 수집
             print("\n[5-3] 결과 수집")
@@ -474,6 +703,27 @@ def main():
 
         print(f"\n[초기 실행 결과] 전체: {first_total}, 성공: {first_success}, 실패: {first_failed}")
 
+        # 수정 결과 캐시 (재시도/실험 간 검증된 수정 재사용)
+        correction_cache = None
+        if args.correction_cache:
+            from modules.core.config import get_correction_cache_path
+            from modules.core.correction_cache import CorrectionCache
+
+            correction_cache = CorrectionCache(get_correction_cache_path())
+            print(f"[INFO] 수정 결과 캐시: {correction_cache.path}")
+
+        # --retry-scope failed: 수정된 ability + 선행 ability만 담은 임시 Adversary로 재실행
+        base_adversary = None
+        prerequisites = {}
+        if args.retry_scope == "failed":
+            from modules.caldera.retry_scope import build_retry_adversary, load_prerequisites, select_retry_abilities
+
+            with open(adversaries_file, 'r', encoding='utf-8') as f:
+                base_adversary = (yaml.safe_load(f) or [None])[0]
+            prerequisites = load_prerequisites(str(step3_output))
+            if not prerequisites:
+                print("[WARNING] step3.yml에 ability 의존 관계(edges)가 없어 수정된 ability만 재실행합니다.")
+
         # 재시도 루프 변수 초기화
         MAX_RETRIES = 3
         retry_count = 0
@@ -504,7 +754,7 @@ def main():
             print("-" * 70)
 
             # Self-Correcting 실행
-            corrector = OfflineCorrector()
+            corrector = OfflineCorrector(max_workers=args.fix_workers, correction_cache=correction_cache)
             correction_report = corrector.run(
                 abilities_file=str(abilities_file),
                 operation_report_file=str(current_report_file),
@@ -599,23 +849,46 @@ def main():
                 print(f"\n  Operation 생성 및 실행 (재시도 {retry_count + 1})")
                 print(f"  Operation 이름: {operation_name_retry}")
 
-                executor = CalderaExecutor(get_caldera_url(), get_caldera_api_key())
-                op_id_retry = executor.create_operation(operation_name_retry, uploaded_adversary_id, args.agent_paw)
-                print(f"  [OK] Operation ID: {op_id_retry}")
-
-                # Operation 시작
-                print(f"  Operation 시작 중...")
-                executor.start_operation(op_id_retry)
-                print(f"  [OK] Operation 실행 시작")
-
-                # 완료 대기
-                print(f"  Operation 완료 대기 중...")
-                executor.wait_for_completion(op_id_retry, timeout=None)
-                print(f"  [OK] Operation 완료")
-
-                # 재실행 결과 수집
-                reporter = CalderaReporter()
-                retry_report = reporter.collect_full_outputs(op_id_retry)
+                # --retry-scope failed: 재시도용 임시 Adversary 업로드 (재실행 결과 수집 후 삭제)
+                retry_adversary_id = uploaded_adversary_id
+                retry_subset = False
+                if base_adversary is not None:
+                    corrected_ids = [c['ability_id'] for c in correction_report.get('corrections', []) if c.get('success')]
+                    retry_ids = select_retry_abilities(base_adversary.get('atomic_ordering', []), corrected_ids, prerequisites)
+                    print(f"\n  재실행 범위: {len(retry_ids)}/{len(base_adversary.get('atomic_ordering', []))}개 ability "
+                          f"(수정 {len(corrected_ids)}개 + 선행 {len(retry_ids) - len(set(corrected_ids) & set(retry_ids))}개)")
+                    retry_adversary = build_retry_adversary(base_adversary, retry_ids)
+                    if retry_ids and uploader.upload_adversary(retry_adversary):
+                        retry_adversary_id = retry_adversary['adversary_id']
+                        retry_subset = True
+                    else:
+                        print("    [WARNING] 재시도용 Adversary를 사용할 수 없어 전체 Adversary로 재실행합니다.")
+
+                try:
+                    executor = CalderaExecutor(get_caldera_url(), get_caldera_api_key())
+                    op_id_retry = executor.create_operation(operation_name_retry, retry_adversary_id, args.agent_paw)
+                    print(f"  [OK] Operation ID: {op_id_retry}")
+
+                    # Operation 시작
+                    print(f"  Operation 시작 중...")
+                    executor.start_operation(op_id_retry)
+                    print(f"  [OK] Operation 실행 시작")
+
+                    # 완료 대기
+                    print(f"  Operation 완료 대기 중...")
+                    wait_for_operation(executor, op_id_retry, args.operation_timeout)
+
+                    # 재실행 결과 수집
+                    reporter = CalderaReporter()
+                    retry_report = reporter.collect_full_outputs(op_id_retry)
+                finally:
+                    if retry_subset:
+                        delete_retry_adversary(retry_adversary_id)
+
+                if retry_report and retry_subset:
+                    # 일부만 재실행한 결과를 이전 전체 리포트에 병합 (재실행하지 않은 ability는 이전 결과 유지)
+                    with open(current_report_file, 'r', encoding='utf-8') as f:
+                        retry_report = reporter.merge_reports(json.load(f), retry_report)
 
                 if retry_report:
                     # 재실행 리포트 저장 (Path 사용 후 문자열 변환)
@@ -688,6 +961,15 @@ def main():
             termination_reason = "max_retries_reached"
             print(f"\n  [종료] 최대 재시도 횟수({MAX_RETRIES}회)에 도달했습니다.")
 
+            # 마지막 재실행 결과는 Self-Correcting을 거치지 않으므로 여기서 수정 캐시에 반영
+            if correction_cache is not None:
+                with open(current_report_file, 'r', encoding='utf-8') as f:
+                    last_report = json.load(f)
+                with open(abilities_file, 'r', encoding='utf-8') as f:
+                    last_abilities = yaml.safe_load(f) or []
+                verified, rejected = correction_cache.record_outcomes(last_report, last_abilities)
+                print(f"  [수정 캐시] 마지막 재실행 결과 반영: 성공 {verified}, 실패 {rejected}")
+
         # 최종 성공률 비교 출력
         print("\n" + "="*70)
         print("Self-Correcting 최종 결과")
@@ -756,6 +1038,12 @@ def main():
             json.dump(cumulative_correction_report, f, indent=2, ensure_ascii=False)
         print(f"\n[저장] 최종 correction_report.json: {cumulative_report_path}")
 
+        # Caldera API 엔드포인트별 지연 시간 (업로드/실행/리포트/Agent 관리 공유 클라이언트)
+        from modules.caldera.client import get_caldera_client
+        caldera_client = get_caldera_client()
+        caldera_client.print_latency_summary()
+        tracker.record_step_detail("caldera_api_latency", caldera_client.latency_stats())
+
         print("\n[OK] Step 5 완료!")
         tracker.end_step(success=True)
 
@@ -782,6 +1070,13 @@ def main():
     print(f"총 출력 토큰: {summary['total_output_tokens']:,}")
     print(f"총 토큰: {summary['total_tokens']:,}")
     print(f"예상 비용: ${summary['total_cost_usd']:.4f}")
+    if summary['llm_cache_hits'] or summary['llm_cache_misses']:
+        print(f"LLM 캐시: 적중 {summary['llm_cache_hits']}회, 미적중 {summary['llm_cache_misses']}회")
+    for step_name, details in summary['step_details'].items():
+        boilerplate = details.get('boilerplate')
+        if boilerplate:
+            print(f"Boilerplate 제거 ({step_name}): {boilerplate['chars_saved']:,}자, "
+                  f"약 {boilerplate['tokens_saved']:,} 토큰 절감")
     print(f"완료된 Step: {summary['steps_completed']}/{summary['steps_completed'] + summary['steps_failed']}")
     print(f"\n메트릭 저장: {metrics_file}")
     print("="*70)
@@ -792,7 +1087,7 @@ def main():
     print("="*70)
 
     try:
-        controller = vm_reload.VBoxController()
+        controller = get_vm_controller()
         controller.shutdown_all()
         print("\n[OK] 모든 VM 종료 완료")
         print("="*70)
@@ -817,12 +1112,7 @@ if __name__ == "__main__":
                 pass
 
         # VM 종료 시도
-        try:
-            print("\n[VM 종료] 중단 시 VM을 종료합니다...")
-            controller = vm_reload.VBoxController()
-            controller.shutdown_all()
-        except:
-            pass
+        shutdown_vms("중단 시")
 
         sys.exit(1)
     except Exception as e:
@@ -839,11 +1129,6 @@ if __name__ == "__main__":
                 pass
 
         # VM 종료 시도
-        try:
-            print("\n[VM 종료] 에러 발생 시 VM을 종료합니다...")
-            controller = vm_reload.VBoxController()
-            controller.shutdown_all()
-        except:
-            pass
+        shutdown_vms("에러 발생 시")
 
         sys.exit(1)
@@ -1,4 +1,5 @@
 """LLM 클라이언트 추상 기본 클래스."""
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -18,3 +19,18 @@ class LLMClient(ABC):
             str: 생성된 텍스트.
         """
         pass
+
+    async def agenerate_text(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 4096) -> str:
+        """비동기 텍스트 생성.
+
+        네이티브 비동기 SDK가 없는 구현체를 위한 기본 구현으로, generate_text를 스레드에서 실행합니다.
+
+        Args:
+            prompt: 사용자 프롬프트.
+            system_prompt: 시스템 프롬프트 (선택).
+            max_tokens: 최대 생성 토큰 수.
+
+        Returns:
+            str: 생성된 텍스트.
+        """
+        return await asyncio.to_thread(self.generate_text, prompt, system_prompt=system_prompt, max_tokens=max_tokens)
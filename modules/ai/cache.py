@@ -0,0 +1,259 @@
+"""LLM 응답 캐시 (SQLite).
+
+공급자, 모델, 프롬프트 해시, 시스템 프롬프트, max_tokens를 키로 generate_text 응답을 저장하여
+같은 입력으로 Step 2~4를 다시 실행할 때 네트워크 호출과 토큰 비용을 없앱니다.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from modules.core.config import get_llm_cache_max_mb, get_llm_cache_path, get_llm_cache_ttl_hours
+from modules.core.metrics import get_metrics_tracker
+from .base import LLMClient
+
+
+CACHE_MODES = ("readwrite", "replay")
+
+
+class LLMCacheMissError(RuntimeError):
+    """replay 모드에서 캐시에 없는 요청이 들어온 경우."""
+
+
+class LLMResponseCache:
+    """SQLite 기반 LLM 응답 캐시.
+
+    - readwrite: 적중 시 저장된 응답 반환, 미적중 시 실제 호출 후 저장
+    - replay: 적중한 응답만 반환하고 미적중은 LLMCacheMissError (네트워크 호출 없음)
+
+    TTL이 지난 항목은 조회 시 무시되고, 저장 시 TTL 만료 항목과 용량 초과분(마지막 사용 시각 순)을 삭제합니다.
+    """
+
+    def __init__(self, path: str, mode: str = "readwrite", ttl_seconds: Optional[float] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        Args:
+            path: SQLite 데이터베이스 경로.
+            mode: 'readwrite' 또는 'replay'.
+            ttl_seconds: 항목 유효 시간 (None 또는 0이면 만료 없음).
+            max_bytes: 저장된 응답 전체 최대 크기 (None이면 제한 없음).
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"지원하지 않는 LLM 캐시 모드: {mode} (지원: {', '.join(CACHE_MODES)})")
+
+        self.path = path
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds or None
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Step 2 map-reduce 등 여러 스레드에서 공유하므로 잠금으로 직렬화
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " provider TEXT NOT NULL,"
+            " model TEXT NOT NULL,"
+            " response TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str, system_prompt: Optional[str], max_tokens: int) -> str:
+        """요청 파라미터로 캐시 키 생성.
+
+        Returns:
+            str: SHA-256 키.
+        """
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        payload = json.dumps([provider, model, prompt_hash, system_prompt, max_tokens], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시 조회 (적중 시 마지막 사용 시각 갱신).
+
+        Returns:
+            Optional[str]: 저장된 응답 또는 None.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, provider: str, model: str, response: str):
+        """응답 저장 후 만료/용량 초과 항목 정리."""
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, provider, model, response, size, created_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, model, response, size, now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def evict(self) -> int:
+        """만료 및 용량 초과 항목 삭제.
+
+        Returns:
+            int: 삭제된 항목 수.
+        """
+        with self._lock:
+            removed = self._evict(time.time())
+            self._conn.commit()
+            return removed
+
+    def _evict(self, now: float) -> int:
+        removed = 0
+        if self.ttl_seconds:
+            removed += self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)
+            ).rowcount
+
+        if self.max_bytes is not None:
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                # 오래 사용되지 않은 순으로 초과분만큼 삭제
+                stale = []
+                for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_access"):
+                    if total <= self.max_bytes:
+                        break
+                    stale.append((key,))
+                    total -= size
+                self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+                removed += len(stale)
+
+        return removed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class CachedLLMClient(LLMClient):
+    """LLM 클라이언트에 응답 캐시를 씌우는 래퍼 (다른 속성은 원본 클라이언트에 위임)."""
+
+    def __init__(self, client: LLMClient, provider: str, cache: LLMResponseCache):
+        self.client = client
+        self.provider = provider
+        self.cache = cache
+
+    @property
+    def model_id(self) -> str:
+        # Gemini는 model이 GenerativeModel 객체이므로 model_name 우선
+        return str(getattr(self.client, 'model_name', None) or getattr(self.client, 'model', ''))
+
+    def generate_text(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 4096) -> str:
+        """캐시 적중 시 저장된 응답, 미적중 시 실제 호출 결과를 저장 후 반환.
+
+        Raises:
+            LLMCacheMissError: replay 모드에서 캐시에 없는 요청인 경우.
+        """
+        key, cached = self._lookup(prompt, system_prompt, max_tokens)
+        if cached is not None:
+            return cached
+
+        response = self.client.generate_text(prompt, system_prompt=system_prompt, max_tokens=max_tokens)
+        return self._store(key, response)
+
+    async def agenerate_text(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 4096) -> str:
+        """generate_text의 비동기 버전."""
+        key, cached = self._lookup(prompt, system_prompt, max_tokens)
+        if cached is not None:
+            return cached
+
+        response = await self.client.agenerate_text(prompt, system_prompt=system_prompt, max_tokens=max_tokens)
+        return self._store(key, response)
+
+    def _lookup(self, prompt: str, system_prompt: Optional[str], max_tokens: int):
+        model = self.model_id
+        key = self.cache.make_key(self.provider, model, prompt, system_prompt, max_tokens)
+
+        cached = self.cache.get(key)
+        tracker = get_metrics_tracker()
+        if tracker:
+            tracker.record_llm_cache(hit=cached is not None)
+
+        if cached is None and self.cache.mode == "replay":
+            raise LLMCacheMissError(
+                f"LLM 캐시에 없는 요청입니다 (replay 모드, provider={self.provider}, model={model})"
+            )
+        return key, cached
+
+    def _store(self, key: str, response: str) -> str:
+        if response is not None:
+            self.cache.put(key, self.provider, self.model_id, response)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+# ============================================================================
+# Global Cache Instance
+# ============================================================================
+
+_global_cache: Optional[LLMResponseCache] = None
+
+
+def init_llm_cache(mode: str = "readwrite", path: Optional[str] = None,
+                   ttl_hours: Optional[float] = None, max_mb: Optional[int] = None) -> LLMResponseCache:
+    """전역 LLM 응답 캐시 초기화 (이후 get_llm_client()가 반환하는 클라이언트에 적용).
+
+    Args:
+        mode: 'readwrite' 또는 'replay'.
+        path: SQLite 경로 (기본: LLM_CACHE_PATH).
+        ttl_hours: 유효 시간 (기본: LLM_CACHE_TTL_HOURS, 0이면 만료 없음).
+        max_mb: 최대 크기 (기본: LLM_CACHE_MAX_MB).
+    """
+    global _global_cache
+    if ttl_hours is None:
+        ttl_hours = get_llm_cache_ttl_hours()
+    if max_mb is None:
+        max_mb = get_llm_cache_max_mb()
+
+    _global_cache = LLMResponseCache(
+        path or get_llm_cache_path(),
+        mode=mode,
+        ttl_seconds=ttl_hours * 3600 if ttl_hours else None,
+        max_bytes=max_mb * 1024 * 1024 if max_mb else None
+    )
+    return _global_cache
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """전역 LLM 응답 캐시 반환 (초기화되지 않았으면 None)."""
+    return _global_cache
+
+
+def reset_llm_cache():
+    """전역 LLM 응답 캐시 해제."""
+    global _global_cache
+    if _global_cache is not None:
+        _global_cache.close()
+    _global_cache = None
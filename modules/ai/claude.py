@@ -1,17 +1,34 @@
 """Anthropic Claude 클라이언트 구현체."""
-from typing import Optional
+from typing import Any, Dict, Optional
 import anthropic
 from modules.core.config import get_anthropic_api_key, get_claude_model
 from modules.core.metrics import get_metrics_tracker
 from .base import LLMClient
+from .concurrency import get_concurrency_limiter
 
 
 class ClaudeClient(LLMClient):
     """Claude API 클라이언트."""
 
-    def __init__(self):
-        self.client = anthropic.Anthropic(api_key=get_anthropic_api_key())
+    provider = "claude"
+
+    def __init__(self, max_retries: Optional[int] = None):
+        """
+        Args:
+            max_retries: SDK 자체 재시도 횟수 (None이면 SDK 기본값). RateLimitedLLMClient로 감쌀 때는
+                0으로 두어 재시도/백오프를 래퍼 한 곳에서만 처리 (재시도가 겹쳐 쌓이지 않도록).
+        """
+        self._sdk_options = {} if max_retries is None else {"max_retries": max_retries}
+        self.client = anthropic.Anthropic(api_key=get_anthropic_api_key(), **self._sdk_options)
         self.model = get_claude_model()
+        self._async_client = None
+
+    @property
+    def async_client(self) -> anthropic.AsyncAnthropic:
+        """비동기 클라이언트 (최초 사용 시 생성)"""
+        if self._async_client is None:
+            self._async_client = anthropic.AsyncAnthropic(api_key=get_anthropic_api_key(), **self._sdk_options)
+        return self._async_client
 
     def generate_text(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 4096) -> str:
         """Claude를 사용하여 텍스트 생성.
@@ -27,6 +44,17 @@ class ClaudeClient(LLMClient):
         Returns:
             str: 생성된 응답 텍스트.
         """
+        with get_concurrency_limiter().slot(self.provider):
+            response = self.client.messages.create(**self._request_kwargs(prompt, system_prompt, max_tokens))
+        return self._handle_response(response)
+
+    async def agenerate_text(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 4096) -> str:
+        """Claude 비동기 텍스트 생성 (AsyncAnthropic 사용, 인자/반환값은 generate_text와 동일)."""
+        async with get_concurrency_limiter().aslot(self.provider):
+            response = await self.async_client.messages.create(**self._request_kwargs(prompt, system_prompt, max_tokens))
+        return self._handle_response(response)
+
+    def _request_kwargs(self, prompt: str, system_prompt: Optional[str], max_tokens: int) -> Dict[str, Any]:
         messages = [{"role": "user", "content": prompt}]
 
         kwargs = {
@@ -38,8 +66,9 @@ class ClaudeClient(LLMClient):
         if system_prompt:
             kwargs["system"] = system_prompt
 
-        response = self.client.messages.create(**kwargs)
+        return kwargs
 
+    def _handle_response(self, response) -> str:
         # 메트릭 추적
         tracker = get_metrics_tracker()
         if tracker and hasattr(response, 'usage'):
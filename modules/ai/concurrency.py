@@ -0,0 +1,94 @@
+"""LLM 동시 호출 제한.
+
+프로세스 전체 한도(LLM_MAX_CONCURRENCY)와 공급자별 한도(LLM_MAX_CONCURRENCY_<PROVIDER>)를
+동기 경로(generate_text, 스레드 병렬)는 threading 세마포어로, 비동기 경로(agenerate_text,
+Step 2 map-reduce 등)는 asyncio 세마포어로 지킵니다.
+"""
+import asyncio
+import threading
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional, Tuple
+
+from modules.core.config import get_llm_max_concurrency, get_llm_provider_concurrency
+
+
+class ConcurrencyLimiter:
+    """전역 + 공급자별 세마포어.
+
+    asyncio.Semaphore는 이벤트 루프 하나에 묶이므로 비동기 세마포어는 루프별로 따로 만듭니다.
+    동기 한도와 비동기 한도는 각각 적용되며, 한 Step 안에서는 둘 중 한 경로만 사용합니다.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, provider_limits: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            max_concurrency: 전체 동시 호출 한도 (기본: LLM_MAX_CONCURRENCY).
+            provider_limits: 공급자별 한도 (미지정 공급자는 LLM_MAX_CONCURRENCY_<PROVIDER>).
+        """
+        self._max_concurrency = max(1, max_concurrency or get_llm_max_concurrency())
+        self._global = threading.BoundedSemaphore(self._max_concurrency)
+        self._provider_limits = dict(provider_limits or {})
+        self._providers: Dict[str, threading.BoundedSemaphore] = {}
+        self._async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[asyncio.Semaphore, Dict[str, asyncio.Semaphore]]]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _provider_limit(self, provider: str) -> int:
+        return max(1, self._provider_limits.get(provider) or get_llm_provider_concurrency(provider))
+
+    def _provider_semaphore(self, provider: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._providers.get(provider)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self._provider_limit(provider))
+                self._providers[provider] = semaphore
+            return semaphore
+
+    def _async_semaphore_pair(self, provider: str) -> Tuple[asyncio.Semaphore, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._async_semaphores.get(loop)
+            if entry is None:
+                entry = (asyncio.Semaphore(self._max_concurrency), {})
+                self._async_semaphores[loop] = entry
+            global_semaphore, providers = entry
+            semaphore = providers.get(provider)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self._provider_limit(provider))
+                providers[provider] = semaphore
+            return global_semaphore, semaphore
+
+    @contextmanager
+    def slot(self, provider: str):
+        """동기 호출용 슬롯 (빌 때까지 대기)"""
+        provider_semaphore = self._provider_semaphore(provider)
+        # 공급자 → 전역 순서로 획득 (다른 공급자 대기 중에 전역 슬롯을 붙잡지 않도록)
+        with provider_semaphore:
+            with self._global:
+                yield
+
+    @asynccontextmanager
+    async def aslot(self, provider: str):
+        """비동기 호출용 슬롯 (이벤트 루프를 막지 않고 빌 때까지 대기)"""
+        global_semaphore, provider_semaphore = self._async_semaphore_pair(provider)
+        # 동기 경로와 같은 공급자 → 전역 순서
+        async with provider_semaphore:
+            async with global_semaphore:
+                yield
+
+
+# ============================================================================
+# Global Limiter Instance
+# ============================================================================
+
+_global_limiter: Optional[ConcurrencyLimiter] = None
+_global_limiter_lock = threading.Lock()
+
+
+def get_concurrency_limiter() -> ConcurrencyLimiter:
+    """전역 동시 호출 제한기 반환 (최초 호출 시 환경변수 기준으로 생성)."""
+    global _global_limiter
+    with _global_limiter_lock:
+        if _global_limiter is None:
+            _global_limiter = ConcurrencyLimiter()
+        return _global_limiter
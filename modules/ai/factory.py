@@ -1,11 +1,9 @@
 """LLM 클라이언트 팩토리."""
 from typing import Optional
 from .base import LLMClient
-from .claude import ClaudeClient
-from .chatgpt import ChatGPTClient
-from .gemini import GeminiClient
-from .grok import GrokClient
-from modules.core.config import get_llm_provider
+from .cache import CachedLLMClient, get_llm_cache
+from .rate_limit import RateLimitedLLMClient, get_rate_limiter
+from modules.core.config import LLM_PROVIDER_ALIASES, get_llm_provider
 
 
 def get_llm_client(provider: Optional[str] = None) -> LLMClient:
@@ -17,6 +15,8 @@ def get_llm_client(provider: Optional[str] = None) -> LLMClient:
 
     Returns:
         LLMClient: 생성된 클라이언트 인스턴스.
+            공급자별 속도 제한/재시도 래퍼로 감싸며, init_llm_cache()로 캐시를 켠 경우
+            그 바깥에 캐시 래퍼를 씌움 (캐시 적중은 속도 제한 대기 없음).
 
     Raises:
         ValueError: 지원하지 않는 공급자인 경우.
@@ -24,15 +24,28 @@ def get_llm_client(provider: Optional[str] = None) -> LLMClient:
     if provider is None:
         provider = get_llm_provider()
 
-    provider_lower = provider.lower()
+    canonical = LLM_PROVIDER_ALIASES.get(provider.lower())
 
-    if provider_lower == "claude":
-        return ClaudeClient()
-    elif provider_lower in ("chatgpt", "openai", "gpt"):
-        return ChatGPTClient()
-    elif provider_lower in ("gemini", "google"):
-        return GeminiClient()
-    elif provider_lower in ("grok", "xai"):
-        return GrokClient()
+    # 공급자 SDK는 선택된 것만 임포트 (anthropic/openai/google-generativeai 기동 비용 절감)
+    # SDK 자체 재시도는 끄고 RateLimitedLLMClient의 재시도만 사용 (대기 시간/토큰 버킷 회계에 모두 반영되도록)
+    if canonical == "claude":
+        from .claude import ClaudeClient
+        client = ClaudeClient(max_retries=0)
+    elif canonical == "chatgpt":
+        from .chatgpt import ChatGPTClient
+        client = ChatGPTClient(max_retries=0)
+    elif canonical == "gemini":
+        from .gemini import GeminiClient
+        client = GeminiClient()
+    elif canonical == "grok":
+        from .grok import GrokClient
+        client = GrokClient(max_retries=0)
     else:
         raise ValueError(f"지원하지 않는 AI 공급자: {provider}. 지원되는 공급자: claude, chatgpt, gemini, grok")
+
+    client = RateLimitedLLMClient(client, canonical, get_rate_limiter(canonical))
+
+    cache = get_llm_cache()
+    if cache is not None:
+        return CachedLLMClient(client, canonical, cache)
+    return client
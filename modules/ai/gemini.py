@@ -1,14 +1,17 @@
 """Google Gemini 클라이언트 구현체."""
-from typing import Optional
+from typing import Optional, Tuple
 import google.generativeai as genai
 from modules.core.config import get_google_api_key, get_gemini_model
 from modules.core.metrics import get_metrics_tracker
 from .base import LLMClient
+from .concurrency import get_concurrency_limiter
 
 
 class GeminiClient(LLMClient):
     """Gemini API 클라이언트."""
 
+    provider = "gemini"
+
     def __init__(self):
         genai.configure(api_key=get_google_api_key())
         self.model_name = get_gemini_model()
@@ -28,6 +31,28 @@ class GeminiClient(LLMClient):
         Returns:
             str: 생성된 응답 텍스트.
         """
+        full_prompt, generation_config = self._build_request(prompt, system_prompt, max_tokens)
+
+        with get_concurrency_limiter().slot(self.provider):
+            response = self.model.generate_content(
+                full_prompt,
+                generation_config=generation_config
+            )
+        return self._handle_response(response)
+
+    async def agenerate_text(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 4096) -> str:
+        """Gemini 비동기 텍스트 생성 (generate_content_async 사용, 인자/반환값은 generate_text와 동일)."""
+        full_prompt, generation_config = self._build_request(prompt, system_prompt, max_tokens)
+
+        async with get_concurrency_limiter().aslot(self.provider):
+            response = await self.model.generate_content_async(
+                full_prompt,
+                generation_config=generation_config
+            )
+        return self._handle_response(response)
+
+    @staticmethod
+    def _build_request(prompt: str, system_prompt: Optional[str], max_tokens: int) -> Tuple[str, "genai.GenerationConfig"]:
         # Gemini의 경우 system instruction을 생성 시 설정
         generation_config = genai.GenerationConfig(
             max_output_tokens=max_tokens,
@@ -39,11 +64,9 @@ class GeminiClient(LLMClient):
         if system_prompt:
             full_prompt = f"{system_prompt}\n\n{prompt}"
 
-        response = self.model.generate_content(
-            full_prompt,
-            generation_config=generation_config
-        )
+        return full_prompt, generation_config
 
+    def _handle_response(self, response) -> str:
         # 메트릭 추적
         tracker = get_metrics_tracker()
         if tracker and hasattr(response, 'usage_metadata'):
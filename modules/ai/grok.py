@@ -1,20 +1,40 @@
 """xAI Grok 클라이언트 구현체."""
-from typing import Optional
+from typing import Any, Dict, Optional
 import openai
 from modules.core.config import get_grok_api_key, get_grok_model
 from modules.core.metrics import get_metrics_tracker
 from .base import LLMClient
+from .concurrency import get_concurrency_limiter
+
+GROK_BASE_URL = "https://api.x.ai/v1"
 
 
 class GrokClient(LLMClient):
     """Grok API 클라이언트."""
 
-    def __init__(self):
+    provider = "grok"
+
+    def __init__(self, max_retries: Optional[int] = None):
+        """
+        Args:
+            max_retries: SDK 자체 재시도 횟수 (None이면 SDK 기본값). RateLimitedLLMClient로 감쌀 때는
+                0으로 두어 재시도/백오프를 래퍼 한 곳에서만 처리 (재시도가 겹쳐 쌓이지 않도록).
+        """
+        self._sdk_options = {} if max_retries is None else {"max_retries": max_retries}
         self.client = openai.OpenAI(
             api_key=get_grok_api_key(),
-            base_url="https://api.x.ai/v1"
+            base_url=GROK_BASE_URL,
+            **self._sdk_options
         )
         self.model = get_grok_model()
+        self._async_client = None
+
+    @property
+    def async_client(self) -> openai.AsyncOpenAI:
+        """비동기 클라이언트 (최초 사용 시 생성)"""
+        if self._async_client is None:
+            self._async_client = openai.AsyncOpenAI(api_key=get_grok_api_key(), base_url=GROK_BASE_URL, **self._sdk_options)
+        return self._async_client
 
     def generate_text(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 4096) -> str:
         """Grok을 사용하여 텍스트 생성.
@@ -30,6 +50,36 @@ class GrokClient(LLMClient):
         Returns:
             str: 생성된 응답 텍스트.
         """
+        kwargs = self._request_kwargs(prompt, system_prompt)
+
+        # Grok 모델도 OpenAI SDK를 사용하므로 최신 API 규격 적용
+        # grok-beta, grok-2 등 최신 모델은 max_completion_tokens 사용 가능성 고려
+        with get_concurrency_limiter().slot(self.provider):
+            try:
+                response = self.client.chat.completions.create(**kwargs, max_tokens=max_tokens)
+            except Exception as e:
+                # max_tokens 오류 시 max_completion_tokens로 재시도
+                if not self._is_max_tokens_error(e):
+                    raise
+                response = self.client.chat.completions.create(**kwargs, max_completion_tokens=max_tokens)
+
+        return self._handle_response(response)
+
+    async def agenerate_text(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 4096) -> str:
+        """Grok 비동기 텍스트 생성 (AsyncOpenAI 사용, 인자/반환값은 generate_text와 동일)."""
+        kwargs = self._request_kwargs(prompt, system_prompt)
+
+        async with get_concurrency_limiter().aslot(self.provider):
+            try:
+                response = await self.async_client.chat.completions.create(**kwargs, max_tokens=max_tokens)
+            except Exception as e:
+                if not self._is_max_tokens_error(e):
+                    raise
+                response = await self.async_client.chat.completions.create(**kwargs, max_completion_tokens=max_tokens)
+
+        return self._handle_response(response)
+
+    def _request_kwargs(self, prompt: str, system_prompt: Optional[str]) -> Dict[str, Any]:
         messages = []
 
         if system_prompt:
@@ -37,27 +87,13 @@ class GrokClient(LLMClient):
 
         messages.append({"role": "user", "content": prompt})
 
-        # Grok 모델도 OpenAI SDK를 사용하므로 최신 API 규격 적용
-        # grok-beta, grok-2 등 최신 모델은 max_completion_tokens 사용 가능성 고려
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=0.7
-            )
-        except Exception as e:
-            # max_tokens 오류 시 max_completion_tokens로 재시도
-            if 'max_tokens' in str(e) and 'max_completion_tokens' in str(e):
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    max_completion_tokens=max_tokens,
-                    temperature=0.7
-                )
-            else:
-                raise
+        return {"model": self.model, "messages": messages, "temperature": 0.7}
+
+    @staticmethod
+    def _is_max_tokens_error(error: Exception) -> bool:
+        return 'max_tokens' in str(error) and 'max_completion_tokens' in str(error)
 
+    def _handle_response(self, response) -> str:
         # 메트릭 추적
         tracker = get_metrics_tracker()
         if tracker and hasattr(response, 'usage'):
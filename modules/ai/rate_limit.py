@@ -0,0 +1,240 @@
+"""LLM 호출 속도 제한 및 재시도.
+
+공급자별 분당 요청 수(RPM)와 분당 입력 토큰 수(TPM)를 토큰 버킷으로 제한하고,
+rate limit(429) / 과부하 / 5xx 오류는 지터를 넣은 지수 백오프로 재시도합니다.
+"""
+import asyncio
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+from modules.core.config import get_llm_max_retries, get_llm_rate_limits
+from modules.core.metrics import llm_call_wait_seconds
+from modules.core.tokens import estimate_tokens
+from .base import LLMClient
+
+
+# 재시도 대상 HTTP 상태 코드 (529: Anthropic overloaded)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+# 상태 코드가 없는 SDK 예외 중 재시도 대상 (openai/anthropic/google 공통 이름)
+RETRYABLE_ERROR_NAMES = {
+    "RateLimitError", "APIConnectionError", "APITimeoutError", "InternalServerError",
+    "OverloadedError", "ResourceExhausted", "ServiceUnavailable", "DeadlineExceeded", "TooManyRequests",
+}
+
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+
+class TokenBucket:
+    """분당 허용량 기반 토큰 버킷 (스레드 안전)."""
+
+    def __init__(self, per_minute: int):
+        """
+        Args:
+            per_minute: 분당 허용량 (버킷 용량도 동일).
+        """
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_take(self, amount: float) -> float:
+        """amount만큼 차감 시도.
+
+        Returns:
+            float: 0이면 차감 성공, 양수면 다시 시도하기까지 기다려야 할 시간 (초).
+        """
+        # 한 번에 용량보다 큰 요청은 용량만큼만 요구 (영원히 대기하지 않도록)
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / self.rate
+
+    def give_back(self, amount: float):
+        """차감했던 양을 되돌림"""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+
+class ProviderRateLimiter:
+    """공급자 하나의 RPM/TPM 제한."""
+
+    def __init__(self, provider: str, requests_per_minute: int, tokens_per_minute: int):
+        self.provider = provider
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._lock = threading.Lock()
+
+    def _try_acquire(self, tokens: int) -> float:
+        # 두 버킷을 함께 확인해야 하므로 잠금 안에서 처리하고, 한쪽이 부족하면 되돌림
+        with self._lock:
+            wait = self.requests.try_take(1) if self.requests else 0.0
+            if wait:
+                return wait
+            wait = self.tokens.try_take(tokens) if self.tokens else 0.0
+            if wait and self.requests:
+                self.requests.give_back(1)
+            return wait
+
+    def acquire(self, tokens: int) -> float:
+        """슬롯이 생길 때까지 대기 (동기).
+
+        Returns:
+            float: 대기한 시간 (초).
+        """
+        waited = 0.0
+        while True:
+            wait = self._try_acquire(tokens)
+            if not wait:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def aacquire(self, tokens: int) -> float:
+        """슬롯이 생길 때까지 대기 (비동기).
+
+        Returns:
+            float: 대기한 시간 (초).
+        """
+        waited = 0.0
+        while True:
+            wait = self._try_acquire(tokens)
+            if not wait:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if status is None:
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """rate limit, 과부하, 5xx, 연결 오류 여부."""
+    if _status_code(error) in RETRYABLE_STATUS_CODES:
+        return True
+    return any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(error).__mro__)
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """응답의 retry-after 헤더 (초)."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000.0
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def backoff_delay(attempt: int, error: Optional[Exception] = None) -> float:
+    """attempt(0부터)번째 재시도 전 대기 시간: full jitter 지수 백오프, retry-after가 있으면 그 이상."""
+    delay = random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt)))
+    retry_after = _retry_after_seconds(error) if error is not None else None
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, BACKOFF_MAX_SECONDS))
+    return delay
+
+
+class RateLimitedLLMClient(LLMClient):
+    """RPM/TPM 제한과 재시도를 적용하는 래퍼 (다른 속성은 원본 클라이언트에 위임).
+
+    대기 시간(속도 제한 + 백오프)은 호출별로 LLMUsage.wait_seconds에 기록됩니다.
+    """
+
+    def __init__(self, client: LLMClient, provider: str, limiter: ProviderRateLimiter,
+                 max_retries: Optional[int] = None):
+        self.client = client
+        self.provider = provider
+        self.limiter = limiter
+        self.max_retries = get_llm_max_retries() if max_retries is None else max_retries
+
+    @staticmethod
+    def _request_tokens(prompt: str, system_prompt: Optional[str]) -> int:
+        return estimate_tokens(prompt) + estimate_tokens(system_prompt or "")
+
+    def generate_text(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 4096) -> str:
+        """속도 제한 대기 후 호출하고, 재시도 가능한 오류는 백오프 후 재시도."""
+        tokens = self._request_tokens(prompt, system_prompt)
+        waited = 0.0
+        attempt = 0
+        while True:
+            waited += self.limiter.acquire(tokens)
+            wait_token = llm_call_wait_seconds.set(waited)
+            try:
+                return self.client.generate_text(prompt, system_prompt=system_prompt, max_tokens=max_tokens)
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable_error(e):
+                    raise
+                delay = backoff_delay(attempt, e)
+                print(f"      [RETRY] {self.provider} {type(e).__name__}: {delay:.1f}s 후 재시도 "
+                      f"({attempt + 1}/{self.max_retries})")
+                time.sleep(delay)
+                waited += delay
+                attempt += 1
+            finally:
+                llm_call_wait_seconds.reset(wait_token)
+
+    async def agenerate_text(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 4096) -> str:
+        """generate_text의 비동기 버전."""
+        tokens = self._request_tokens(prompt, system_prompt)
+        waited = 0.0
+        attempt = 0
+        while True:
+            waited += await self.limiter.aacquire(tokens)
+            wait_token = llm_call_wait_seconds.set(waited)
+            try:
+                return await self.client.agenerate_text(prompt, system_prompt=system_prompt, max_tokens=max_tokens)
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable_error(e):
+                    raise
+                delay = backoff_delay(attempt, e)
+                print(f"      [RETRY] {self.provider} {type(e).__name__}: {delay:.1f}s 후 재시도 "
+                      f"({attempt + 1}/{self.max_retries})")
+                await asyncio.sleep(delay)
+                waited += delay
+                attempt += 1
+            finally:
+                llm_call_wait_seconds.reset(wait_token)
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+# ============================================================================
+# Global Limiter Registry
+# ============================================================================
+
+_limiters: Dict[str, ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> ProviderRateLimiter:
+    """공급자별 프로세스 전역 속도 제한기 반환 (LLM_RPM_<PROVIDER>, LLM_TPM_<PROVIDER>)."""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            rpm, tpm = get_llm_rate_limits(provider)
+            limiter = ProviderRateLimiter(provider, rpm, tpm)
+            _limiters[provider] = limiter
+        return limiter
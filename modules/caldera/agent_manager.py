@@ -1,7 +1,6 @@
 """Caldera Agent 관리 유틸리티."""
 import time
-import requests
-from modules.core.config import get_caldera_url, get_caldera_api_key
+from modules.caldera.client import get_caldera_client
 
 
 class AgentManager:
@@ -13,12 +12,9 @@ class AgentManager:
             caldera_url: Caldera 서버 URL (None이면 환경변수에서 로드).
             api_key: Caldera API 키 (None이면 환경변수에서 로드).
         """
-        self.caldera_url = (caldera_url or get_caldera_url()).rstrip("/")
-        self.api_key = api_key or get_caldera_api_key()
-
-    def _headers(self):
-        """API 요청 헤더 생성."""
-        return {"KEY": self.api_key, "Content-Type": "application/json"}
+        self.client = get_caldera_client(caldera_url, api_key)
+        self.caldera_url = self.client.base_url
+        self.api_key = self.client.api_key
 
     def get_agents(self, timeout=10):
         """
@@ -30,8 +26,7 @@ class AgentManager:
         Returns:
             list: 에이전트 목록.
         """
-        url = f"{self.caldera_url}/api/v2/agents"
-        r = requests.get(url, headers=self._headers(), timeout=timeout)
+        r = self.client.get("/api/v2/agents", timeout=timeout)
         r.raise_for_status()
         return r.json()
 
@@ -51,8 +46,7 @@ class AgentManager:
 
         for a in agents:
             paw = a.get("paw")
-            del_url = f"{self.caldera_url}/api/v2/agents/{paw}"
-            resp = requests.delete(del_url, headers=self._headers(), timeout=10)
+            resp = self.client.delete(f"/api/v2/agents/{paw}", timeout=10)
             print(f"[KILL] agent {paw} → HTTP {resp.status_code}")
 
         print("[OK] 모든 agent 삭제 완료")
@@ -0,0 +1,113 @@
+"""Caldera 일괄 작업 실행기 (동시 수 제한, 항목별 재시도, 처리량 요약)."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Sequence, Tuple
+
+import requests
+
+# 일괄 업로드/삭제 동시 요청 수 (1이면 순차 처리)
+DEFAULT_BULK_WORKERS = 8
+# 항목별 추가 시도 횟수 (공유 클라이언트의 HTTP 재시도와 별개로, POST 실패/500 응답 등도 재시도)
+DEFAULT_ITEM_RETRIES = 2
+# 재시도 대기 (초): backoff * 2^(시도 - 1)
+ITEM_RETRY_BACKOFF = 0.5
+
+# operation(item) → (성공 여부, 결과 설명, 재시도 가능 여부)
+ItemOperation = Callable[[Any], Tuple[bool, str, bool]]
+
+
+def is_retryable_status(status_code: int) -> bool:
+    """항목 재시도 대상 응답 코드 (429, 5xx)."""
+    return status_code == 429 or status_code >= 500
+
+
+@dataclass
+class BulkItemResult:
+    """항목 하나의 처리 결과"""
+    item_id: str
+    success: bool
+    detail: str
+    attempts: int
+
+
+@dataclass
+class BulkSummary:
+    """일괄 작업 결과 (results는 입력 순서)"""
+    label: str
+    results: List[BulkItemResult]
+    elapsed: float
+
+    @property
+    def succeeded(self) -> List[BulkItemResult]:
+        return [r for r in self.results if r.success]
+
+    @property
+    def failed(self) -> List[BulkItemResult]:
+        return [r for r in self.results if not r.success]
+
+    @property
+    def retries(self) -> int:
+        return sum(r.attempts - 1 for r in self.results)
+
+    @property
+    def throughput(self) -> float:
+        return len(self.results) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def print_summary(self):
+        print(f"  처리량: {len(self.results)}개 / {self.elapsed:.2f}초 "
+              f"({self.throughput:.1f}개/초, 성공 {len(self.succeeded)}, 실패 {len(self.failed)}, 재시도 {self.retries}회)")
+
+
+def run_bulk(label: str, items: Sequence[Tuple[str, Any]], operation: ItemOperation,
+             max_workers: int = DEFAULT_BULK_WORKERS, retries: int = DEFAULT_ITEM_RETRIES) -> BulkSummary:
+    """항목별 operation을 최대 max_workers개 동시에 실행.
+
+    항목마다 독립적으로 재시도하므로 한 항목의 실패가 다른 항목을 막지 않습니다.
+    진행 상황은 완료되는 순서대로 한 줄씩 출력하며, 결과는 입력 순서로 반환합니다.
+
+    Args:
+        label: 출력용 항목 종류 (예: 'ability').
+        items: (항목 ID, operation에 넘길 값) 목록.
+        operation: (성공 여부, 결과 설명, 재시도 가능 여부)를 반환하는 함수.
+            requests 예외는 재시도 가능한 실패로 처리합니다.
+        max_workers: 최대 동시 실행 수 (1이면 순차 실행).
+        retries: 항목별 추가 시도 횟수.
+
+    Returns:
+        BulkSummary: 입력 순서의 항목별 결과와 소요 시간.
+    """
+    total = len(items)
+    done = [0]
+    lock = threading.Lock()
+
+    def attempt(entry: Tuple[str, Any]) -> BulkItemResult:
+        item_id, payload = entry
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                success, detail, retryable = operation(payload)
+            except requests.exceptions.RequestException as e:
+                success, detail, retryable = False, f"{type(e).__name__}: {e}", True
+            if success or not retryable or attempts > retries:
+                break
+            time.sleep(ITEM_RETRY_BACKOFF * 2 ** (attempts - 1))
+
+        result = BulkItemResult(item_id=item_id, success=success, detail=detail, attempts=attempts)
+        with lock:
+            done[0] += 1
+            status = "[OK]" if success else "[FAILED]"
+            retry_note = f", {attempts}회 시도" if attempts > 1 else ""
+            print(f"  [{done[0]}/{total}] {status} {label} {item_id} ({detail}{retry_note})")
+        return result
+
+    start = time.perf_counter()
+    workers = max(1, min(max_workers, total))
+    if workers == 1:
+        results = [attempt(entry) for entry in items]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(attempt, items))
+    return BulkSummary(label=label, results=results, elapsed=time.perf_counter() - start)
@@ -0,0 +1,186 @@
+"""Caldera REST API 공유 클라이언트."""
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from modules.core.config import (
+    get_caldera_api_key,
+    get_caldera_http_pool_size,
+    get_caldera_http_retries,
+    get_caldera_http_timeout,
+    get_caldera_url,
+)
+
+# 연결 타임아웃 (초). 읽기 타임아웃은 CALDERA_HTTP_TIMEOUT
+CONNECT_TIMEOUT = 5.0
+
+# 재시도할 응답 코드 / 메서드 (POST는 Operation 중복 생성 등을 막기 위해 재시도하지 않음)
+RETRY_STATUSES = (429, 502, 503, 504)
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"})
+
+_ID_SEGMENT_RE = re.compile(r"^/api/v2/(.*)$")
+
+
+def endpoint_key(method: str, path: str) -> str:
+    """지연 시간 집계용 엔드포인트 이름 (/api/v2 아래 ID 자리는 {id}로 치환).
+
+    예: GET /api/v2/operations/abc/links/def/result → GET /api/v2/operations/{id}/links/{id}/result
+    """
+    path = path.split('?', 1)[0]
+    match = _ID_SEGMENT_RE.match(path)
+    if match:
+        segments = match.group(1).split('/')
+        # REST 경로는 컬렉션/ID가 번갈아 나오므로 홀수 번째 세그먼트가 ID
+        path = "/api/v2/" + "/".join("{id}" if i % 2 else segment for i, segment in enumerate(segments))
+    return f"{method.upper()} {path}"
+
+
+class CalderaClient:
+    """연결 풀, 재시도, 타임아웃, 엔드포인트별 지연 시간 기록을 갖춘 Caldera API 클라이언트.
+
+    모든 Caldera 모듈(업로더, 실행기, 리포터, 삭제기, Agent 관리)이 get_caldera_client()로
+    같은 인스턴스를 공유하여 keep-alive 연결을 재사용합니다. requests.Session은 요청 간 공유해도
+    안전하며, 풀 크기만큼 동시 요청을 처리합니다.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 pool_size: Optional[int] = None, retries: Optional[int] = None,
+                 timeout: Optional[float] = None):
+        """
+        Args:
+            base_url: Caldera 서버 URL (기본: CALDERA_URL).
+            api_key: Caldera API 키 (기본: CALDERA_API_KEY).
+            pool_size: 최대 keep-alive 연결 수 (기본: CALDERA_HTTP_POOL_SIZE).
+            retries: 연결 오류/429/5xx 재시도 횟수 (기본: CALDERA_HTTP_RETRIES).
+            timeout: 읽기 타임아웃 초 (기본: CALDERA_HTTP_TIMEOUT).
+        """
+        self.base_url = (base_url or get_caldera_url()).rstrip('/')
+        self.api_key = api_key or get_caldera_api_key()
+        self.pool_size = pool_size or get_caldera_http_pool_size()
+        self.timeout = (CONNECT_TIMEOUT, timeout or get_caldera_http_timeout())
+
+        retry = Retry(
+            total=get_caldera_http_retries() if retries is None else retries,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.headers.update({'KEY': self.api_key})
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._latency: Dict[str, List[float]] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """API 요청 (path는 '/api/v2/...' 형태 또는 전체 URL).
+
+        timeout을 지정하지 않으면 (연결 5초, 읽기 CALDERA_HTTP_TIMEOUT)을 사용합니다.
+
+        Raises:
+            requests.exceptions.RequestException: 재시도 후에도 연결/타임아웃 오류인 경우.
+        """
+        url = path if path.startswith(("http://", "https://")) else f"{self.base_url}{path}"
+        kwargs.setdefault('timeout', self.timeout)
+        key = endpoint_key(method, url[len(self.base_url):] if url.startswith(self.base_url) else url)
+
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            self._record(key, time.perf_counter() - start, error=True)
+            raise
+        self._record(key, time.perf_counter() - start, error=response.status_code >= 400)
+        return response
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PUT", path, **kwargs)
+
+    def patch(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", path, **kwargs)
+
+    def _record(self, key: str, seconds: float, error: bool):
+        with self._lock:
+            self._latency.setdefault(key, []).append(seconds)
+            if error:
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+    def latency_stats(self) -> Dict[str, Dict]:
+        """엔드포인트별 요청 수, 오류 수(4xx/5xx/연결 오류), 지연 시간 (ms) 통계."""
+        with self._lock:
+            samples = {key: sorted(values) for key, values in self._latency.items()}
+            errors = dict(self._errors)
+
+        stats = {}
+        for key, values in sorted(samples.items()):
+            stats[key] = {
+                "count": len(values),
+                "errors": errors.get(key, 0),
+                "total_ms": round(sum(values) * 1000, 1),
+                "mean_ms": round(sum(values) / len(values) * 1000, 1),
+                "p95_ms": round(values[min(len(values) - 1, int(len(values) * 0.95))] * 1000, 1),
+                "max_ms": round(values[-1] * 1000, 1),
+            }
+        return stats
+
+    def reset_stats(self):
+        with self._lock:
+            self._latency.clear()
+            self._errors.clear()
+
+    def print_latency_summary(self, top: int = 10):
+        """총 소요 시간이 큰 엔드포인트부터 지연 시간 요약 출력."""
+        stats = self.latency_stats()
+        if not stats:
+            return
+        print(f"\n[Caldera API] {sum(s['count'] for s in stats.values())} requests")
+        for key, s in sorted(stats.items(), key=lambda item: -item[1]['total_ms'])[:top]:
+            print(f"  {key:<60} {s['count']:>5}x  mean {s['mean_ms']:>7.1f} ms  "
+                  f"p95 {s['p95_ms']:>7.1f} ms  errors {s['errors']}")
+
+
+# ============================================================================
+# Shared Client Instance
+# ============================================================================
+
+_clients: Dict[Tuple[str, str], CalderaClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_caldera_client(base_url: Optional[str] = None, api_key: Optional[str] = None) -> CalderaClient:
+    """서버 URL + API 키별 공유 CalderaClient 반환 (처음 호출 시 생성)."""
+    base_url = (base_url or get_caldera_url()).rstrip('/')
+    api_key = api_key or get_caldera_api_key()
+    with _clients_lock:
+        client = _clients.get((base_url, api_key))
+        if client is None:
+            client = _clients[(base_url, api_key)] = CalderaClient(base_url, api_key)
+        return client
+
+
+def reset_caldera_clients():
+    """공유 클라이언트 해제 (연결 종료)."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.session.close()
+        _clients.clear()
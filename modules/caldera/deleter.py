@@ -1,17 +1,22 @@
 """Caldera 삭제 모듈."""
-import requests
-from typing import List
-from modules.core.config import get_caldera_url, get_caldera_api_key
+from typing import List, Tuple
+from modules.caldera.bulk import DEFAULT_BULK_WORKERS, DEFAULT_ITEM_RETRIES, is_retryable_status, run_bulk
+from modules.caldera.client import get_caldera_client
 
 
 class CalderaDeleter:
     """Caldera에서 Ability와 Adversary를 삭제하는 클래스."""
 
-    def __init__(self):
-        self.base_url = get_caldera_url()
-        self.api_key = get_caldera_api_key()
-        self.session = requests.Session()
-        self.session.headers.update({'KEY': self.api_key})
+    def __init__(self, max_workers: int = DEFAULT_BULK_WORKERS, retries: int = DEFAULT_ITEM_RETRIES):
+        """
+        Args:
+            max_workers: 동시 삭제 요청 수 (1이면 순차 삭제).
+            retries: 항목별 추가 시도 횟수 (연결 오류, 429/5xx 응답).
+        """
+        self.client = get_caldera_client()
+        self.base_url = self.client.base_url
+        self.max_workers = max(1, max_workers)
+        self.retries = retries
 
         # 삭제 통계
         self.deleted_abilities = 0
@@ -19,6 +24,25 @@ class CalderaDeleter:
         self.failed_abilities = 0
         self.failed_adversaries = 0
 
+    def _delete(self, path: str) -> Tuple[bool, str, bool]:
+        """단일 항목 삭제 (404는 이미 삭제된 것으로 보고 성공 처리)."""
+        response = self.client.delete(path)
+        if response.status_code in (200, 204):
+            return True, "deleted", False
+        if response.status_code == 404:
+            return True, "not found, already deleted?", False
+        return False, f"HTTP {response.status_code}: {response.text[:200]}", is_retryable_status(response.status_code)
+
+    def delete_all(self, adversary_ids: List[str], ability_ids: List[str]):
+        """Adversaries를 모두 삭제한 뒤 Abilities 삭제 (Adversary가 Ability를 참조하므로 순서 유지).
+
+        Args:
+            adversary_ids: 삭제할 Adversary ID 목록.
+            ability_ids: 삭제할 Ability ID 목록.
+        """
+        self.delete_adversaries(adversary_ids)
+        self.delete_abilities(ability_ids)
+
     def delete_adversaries(self, adversary_ids: List[str]):
         """Adversaries 삭제 (먼저 삭제해야 함).
 
@@ -32,27 +56,19 @@ class CalderaDeleter:
         print("\n" + "="*70)
         print("Adversaries 삭제 시작")
         print("="*70)
-        print(f"  Total adversaries to delete: {len(adversary_ids)}")
-
-        for i, adversary_id in enumerate(adversary_ids, 1):
-            print(f"\n  [{i}/{len(adversary_ids)}] Deleting adversary: {adversary_id[:8]}...")
+        print(f"  Total adversaries to delete: {len(adversary_ids)} (동시 {min(self.max_workers, len(adversary_ids))}개)")
 
-            url = f"{self.base_url}/api/v2/adversaries/{adversary_id}"
-            response = self.session.delete(url)
-
-            if response.status_code == 200:
-                print(f"    [OK] Deleted successfully")
-                self.deleted_adversaries += 1
-            elif response.status_code == 404:
-                print(f"    [WARNING] Not found (already deleted?)")
-                self.deleted_adversaries += 1
-            else:
-                print(f"    [FAILED] Status: {response.status_code}")
-                print(f"    Error: {response.text[:200]}")
-                self.failed_adversaries += 1
+        summary = run_bulk(
+            "adversary",
+            [(adversary_id, f"/api/v2/adversaries/{adversary_id}") for adversary_id in adversary_ids],
+            self._delete, max_workers=self.max_workers, retries=self.retries
+        )
+        self.deleted_adversaries += len(summary.succeeded)
+        self.failed_adversaries += len(summary.failed)
 
         print(f"\n{'='*70}")
-        print(f"Adversaries 삭제 완료: {self.deleted_adversaries} 성공, {self.failed_adversaries} 실패")
+        print(f"Adversaries 삭제 완료: {len(summary.succeeded)} 성공, {len(summary.failed)} 실패")
+        summary.print_summary()
         print(f"{'='*70}")
 
     def delete_abilities(self, ability_ids: List[str]):
@@ -68,27 +84,19 @@ class CalderaDeleter:
         print("\n" + "="*70)
         print("Abilities 삭제 시작")
         print("="*70)
-        print(f"  Total abilities to delete: {len(ability_ids)}")
-
-        for i, ability_id in enumerate(ability_ids, 1):
-            print(f"\n  [{i}/{len(ability_ids)}] Deleting ability: {ability_id[:8]}...")
-
-            url = f"{self.base_url}/api/v2/abilities/{ability_id}"
-            response = self.session.delete(url)
+        print(f"  Total abilities to delete: {len(ability_ids)} (동시 {min(self.max_workers, len(ability_ids))}개)")
 
-            if response.status_code == 200:
-                print(f"    [OK] Deleted successfully")
-                self.deleted_abilities += 1
-            elif response.status_code == 404:
-                print(f"    [WARNING] Not found (already deleted?)")
-                self.deleted_abilities += 1
-            else:
-                print(f"    [FAILED] Status: {response.status_code}")
-                print(f"    Error: {response.text[:200]}")
-                self.failed_abilities += 1
+        summary = run_bulk(
+            "ability",
+            [(ability_id, f"/api/v2/abilities/{ability_id}") for ability_id in ability_ids],
+            self._delete, max_workers=self.max_workers, retries=self.retries
+        )
+        self.deleted_abilities += len(summary.succeeded)
+        self.failed_abilities += len(summary.failed)
 
         print(f"\n{'='*70}")
-        print(f"Abilities 삭제 완료: {self.deleted_abilities} 성공, {self.failed_abilities} 실패")
+        print(f"Abilities 삭제 완료: {len(summary.succeeded)} 성공, {len(summary.failed)} 실패")
+        summary.print_summary()
         print(f"{'='*70}")
 
     def print_summary(self):
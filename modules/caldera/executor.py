@@ -1,17 +1,52 @@
 """Caldera API 연동 실행기."""
 import time
-import requests
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
+from modules.caldera.client import get_caldera_client
 from modules.core.models import AbilityResult
 
+# Operation 상태(state만 요청) 확인 간격 (초). 완료 감지는 이 조회로만 함
+STATE_POLL_INTERVAL = 2.0
+# link 목록(chain) 갱신 간격 (초): 진행이 있었으면 LINK_POLL_INTERVAL, 변화 없이 대기 중이면
+# LINK_POLL_BACKOFF배씩 늘려 최대 간격까지, 예상 마지막 link가 실행 중이면 LINK_POLL_NEAR_COMPLETION_INTERVAL
+LINK_POLL_INTERVAL = 10.0
+LINK_POLL_MAX_INTERVAL = 30.0
+LINK_POLL_NEAR_COMPLETION_INTERVAL = 2.0
+LINK_POLL_BACKOFF = 1.5
+
+# 완료로 간주하는 Operation 상태
+OPERATION_DONE_STATES = ('finished', 'cleanup')
+
+# Caldera link status (0 성공, 1 오류, 124 타임아웃, -2 폐기, -3 실행 대기/실행 중 등)
+LINK_STATUS_LABELS = {0: "OK", 1: "FAILED", 124: "TIMEOUT", -2: "DISCARDED"}
+
+
+def is_link_finished(link: Dict) -> bool:
+    """link 실행 완료 여부 (finish 시각이 있거나 결과 상태)."""
+    return bool(link.get('finish')) or link.get('status') in LINK_STATUS_LABELS
+
+
+@dataclass
+class OperationProgress:
+    """Operation 완료 대기 결과"""
+    state: str = ""
+    expected_links: Optional[int] = None
+    finished_links: int = 0
+    total_links: int = 0
+    polls: int = 0  # 상태 조회 횟수
+    link_fetches: int = 0  # link 목록 조회 횟수
+    elapsed: float = 0.0
+    completed: bool = False
+    link_statuses: Dict[str, int] = field(default_factory=dict)
+
 
 class CalderaExecutor:
     """Caldera API와 통신하여 Operation을 제어."""
 
     def __init__(self, base_url: str, api_key: str):
-        self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
-        self.session.headers.update({'KEY': api_key})
+        self.client = get_caldera_client(base_url, api_key)
+        self.base_url = self.client.base_url
+        self.last_progress: Optional[OperationProgress] = None
 
     def create_operation(self, name: str, adversary_id: str, agent_paw: Optional[str] = None) -> str:
         """새로운 Operation 생성.
@@ -27,17 +62,17 @@ class CalderaExecutor:
         Returns:
             str: 생성된 Operation ID.
         """
-        url = f"{self.base_url}/api/v2/operations"
         payload = {
             "name": name,
             "adversary": {"adversary_id": adversary_id},
             "planner": {"planner_id": "atomic"},
             "source": {"id": "basic"},
             "group": "",  # Empty group targets all agents
-            "jitter": "1/1"  # No delay between abilities (format: "fraction/seconds")
+            "jitter": "1/1",  # No delay between abilities (format: "fraction/seconds")
+            "auto_close": True  # 플래너가 더 실행할 link가 없으면 Caldera가 Operation을 finished로 전환
         }
 
-        response = self.session.post(url, json=payload)
+        response = self.client.post("/api/v2/operations", json=payload)
         response.raise_for_status()
         return response.json()['id']
 
@@ -49,39 +84,146 @@ class CalderaExecutor:
         """
         # v2 API에서는 생성 시 바로 시작되거나, 별도 start 호출 필요.
         # 기존 코드 로직 참조: PATCH로 state 변경
-        url = f"{self.base_url}/api/v2/operations/{operation_id}"
         payload = {"state": "running"}
-        response = self.session.patch(url, json=payload)
+        response = self.client.patch(f"/api/v2/operations/{operation_id}", json=payload)
         response.raise_for_status()
 
-    def wait_for_completion(self, operation_id: str, timeout: Optional[int] = None) -> bool:
-        """Operation 완료 대기.
+    def stop_operation(self, operation_id: str):
+        """Operation 중지 (state를 finished로 변경).
+
+        Usage:
+            완료 대기 기한을 넘긴 Operation이 계속 실행되지 않도록 할 때 사용됩니다.
+        """
+        response = self.client.patch(f"/api/v2/operations/{operation_id}", json={"state": "finished"})
+        response.raise_for_status()
+
+    def _expected_link_count(self, operation_id: str) -> Optional[int]:
+        """예상 link 수 (Adversary ability 수 × 대상 Agent 수, 조회 실패 시 None).
+
+        건너뛰는 ability나 반복 실행/사실(fact) 기반으로 추가되는 link가 있으면 실제 link 수와
+        다르므로, 진행 표시와 폴링 간격 선택에만 사용하고 완료 판단에는 쓰지 않습니다.
+        """
+        response = self.client.get(f"/api/v2/operations/{operation_id}",
+                                   params={'include': ['adversary', 'host_group']})
+        if response.status_code != 200:
+            return None
+        data = response.json()
+        abilities = len((data.get('adversary') or {}).get('atomic_ordering') or [])
+        agents = len(data.get('host_group') or [])
+        return abilities * agents if abilities and agents else None
+
+    def _print_link_progress(self, link: Dict, finished: int, expected: Optional[int]):
+        ability = link.get('ability') or {}
+        status = link.get('status')
+        label = LINK_STATUS_LABELS.get(status, f"status {status}")
+        total = expected if expected is not None else "?"
+        technique = ability.get('technique_id', '')
+        print(f"    [link {finished}/{total}] {label:<9} {technique} {ability.get('name', link.get('id', ''))}")
+
+    def wait_for_completion(self, operation_id: str, timeout: Optional[float] = None,
+                            verbose: bool = True) -> bool:
+        """Operation 완료 대기 (적응형 폴링).
 
         Usage:
             실행된 Operation이 끝날 때까지 대기하여 결과를 수집할 시점을 판단할 때 사용됩니다.
 
+        상태 확인은 state만 요청하는 가벼운 조회로 STATE_POLL_INTERVAL마다 하고, link 목록(chain)은
+        상태가 바뀌었을 때, 완료/기한 직전, 그리고 link 갱신 간격이 되었을 때만 받습니다. link 갱신
+        간격은 진행이 있으면 기본 간격, 변화 없이 대기 중이면 점점 늘리고, 예상 마지막 link가 실행
+        중이면 짧게 유지합니다. 새로 끝난 link는 link 목록을 받을 때마다 출력합니다.
+        완료는 Caldera가 보고하는 Operation 상태(finished/cleanup)로만 판단합니다.
+
         Args:
             operation_id: Operation ID.
             timeout: 최대 대기 시간 (초). None이면 무제한 대기.
+            verbose: link별 진행 상황 출력 여부.
 
         Returns:
-            bool: 완료 여부 (True: 완료, False: 타임아웃).
+            bool: 완료 여부 (True: 완료, False: 타임아웃). 상세 결과는 self.last_progress.
         """
-        start_time = time.time()
-        url = f"{self.base_url}/api/v2/operations/{operation_id}"
+        start_time = time.monotonic()
+        deadline = None if timeout is None else start_time + timeout
+        path = f"/api/v2/operations/{operation_id}"
 
+        progress = OperationProgress()
+        self.last_progress = progress
+        try:
+            progress.expected_links = self._expected_link_count(operation_id)
+        except Exception:
+            progress.expected_links = None
+
+        link_interval = LINK_POLL_INTERVAL
+        next_link_fetch = start_time
+        last_state = None
         while True:
-            # timeout이 설정되어 있고 초과한 경우
-            if timeout is not None and (time.time() - start_time >= timeout):
+            progress.polls += 1
+            response = self.client.get(path, params={'include': ['state']})
+            if response.status_code == 200:
+                progress.state = response.json().get('state', '')
+            done = progress.state in OPERATION_DONE_STATES
+
+            now = time.monotonic()
+            near_deadline = deadline is not None and deadline - now <= STATE_POLL_INTERVAL
+            if done or near_deadline or progress.state != last_state or now >= next_link_fetch:
+                changed, running = self._refresh_links(path, progress, verbose)
+
+                # 예상 마지막 link가 실행 중이면 짧게, 진행이 있었으면 기본 간격, 변화 없으면 점점 느리게
+                # (예상 link 수는 실제와 다를 수 있으므로 간격 선택에만 사용)
+                near_completion = (running > 0 and progress.expected_links is not None
+                                   and progress.finished_links + running >= progress.expected_links)
+                if near_completion:
+                    link_interval = LINK_POLL_NEAR_COMPLETION_INTERVAL
+                elif changed:
+                    link_interval = LINK_POLL_INTERVAL
+                else:
+                    link_interval = min(max(link_interval, LINK_POLL_INTERVAL) * LINK_POLL_BACKOFF,
+                                        LINK_POLL_MAX_INTERVAL)
+                next_link_fetch = time.monotonic() + link_interval
+            last_state = progress.state
+
+            now = time.monotonic()
+            if done:
+                progress.completed = True
+                progress.elapsed = now - start_time
+                return True
+            if deadline is not None and now >= deadline:
+                progress.elapsed = now - start_time
                 return False
 
-            response = self.session.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                state = data.get('state')
-                if state in ['finished', 'cleanup']:
-                    return True
-            time.sleep(5)
+            wake = min(now + STATE_POLL_INTERVAL, next_link_fetch)
+            if deadline is not None:
+                wake = min(wake, deadline)
+            time.sleep(max(0.0, wake - now))
+
+    def _refresh_links(self, path: str, progress: OperationProgress, verbose: bool) -> Tuple[bool, int]:
+        """link 목록(chain)을 받아 진행 상황 갱신.
+
+        Returns:
+            Tuple[bool, int]: (새 link가 생기거나 끝났는지, 실행 중인 link 수). 조회 실패 시 (False, 0).
+        """
+        progress.link_fetches += 1
+        response = self.client.get(path, params={'include': ['chain']})
+        if response.status_code != 200:
+            return False, 0
+
+        chain = response.json().get('chain') or []
+        changed = len(chain) != progress.total_links
+        progress.total_links = len(chain)
+
+        running = 0
+        for link in chain:
+            link_id = link.get('id')
+            if not is_link_finished(link):
+                running += 1
+                continue
+            if link_id in progress.link_statuses:
+                continue
+            progress.link_statuses[link_id] = link.get('status')
+            progress.finished_links += 1
+            changed = True
+            if verbose:
+                self._print_link_progress(link, progress.finished_links, progress.expected_links)
+        return changed, running
 
     def get_operation_results(self, operation_id: str) -> List[AbilityResult]:
         """Operation 실행 결과 조회.
@@ -96,8 +238,7 @@ class CalderaExecutor:
             List[AbilityResult]: 실행 결과 목록.
         """
         # 링크 결과 조회
-        url = f"{self.base_url}/api/v2/operations/{operation_id}/links"
-        response = self.session.get(url)
+        response = self.client.get(f"/api/v2/operations/{operation_id}/links")
         response.raise_for_status()
         links = response.json()
 
@@ -1,17 +1,25 @@
 """Caldera 리포터 모듈."""
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
-from modules.core.config import get_caldera_url, get_caldera_api_key
+from modules.caldera.client import get_caldera_client
+
+# link result 동시 조회 수 (1이면 순차 조회)
+DEFAULT_LINK_WORKERS = 8
 
 
 class CalderaReporter:
     """Caldera Operation 실행 결과를 수집하는 클래스."""
 
-    def __init__(self):
-        self.base_url = get_caldera_url().rstrip('/')
-        self.api_key = get_caldera_api_key()
-        self.headers = {"KEY": self.api_key}
+    def __init__(self, max_workers: int = DEFAULT_LINK_WORKERS):
+        """
+        Args:
+            max_workers: link result 동시 조회 수 (1이면 순차 조회, 공유 클라이언트의 연결 풀 크기 이하로 제한).
+        """
+        self.client = get_caldera_client()
+        self.base_url = self.client.base_url
+        self.max_workers = max(1, min(max_workers, self.client.pool_size))
 
     def find_operation_id(self, name: str) -> Optional[str]:
         """Operation 이름으로 ID 찾기.
@@ -23,9 +31,8 @@ class CalderaReporter:
             Optional[str]: Operation ID 또는 None.
         """
         try:
-            resp = requests.get(
-                f"{self.base_url}/api/v2/operations",
-                headers=self.headers,
+            resp = self.client.get(
+                "/api/v2/operations",
                 timeout=30
             )
             resp.raise_for_status()
@@ -78,9 +85,8 @@ class CalderaReporter:
 
         # 1. Operation 기본 정보
         try:
-            resp = requests.get(
-                f"{self.base_url}/api/v2/operations/{operation_id}",
-                headers=self.headers,
+            resp = self.client.get(
+                f"/api/v2/operations/{operation_id}",
                 timeout=30
             )
             resp.raise_for_status()
@@ -102,6 +108,9 @@ class CalderaReporter:
 
         print(f"Collecting outputs from {len(chain)} links...\n")
 
+        # link result를 먼저 동시에 조회한 뒤, 출력/결과 구성은 chain 순서대로 (순차 조회와 동일한 리포트)
+        link_outputs = self._fetch_link_results(operation_id, chain)
+
         for i, link in enumerate(chain, 1):
             link_id = link.get('id')
             ability_name = link.get('ability', {}).get('name', 'Unknown')
@@ -110,8 +119,7 @@ class CalderaReporter:
             status_icon = "✓" if status == 0 else "✗"
             print(f"{status_icon} [{i:2d}/{len(chain)}] {ability_name}")
 
-            # Link result 조회
-            output_data = self._get_link_result(operation_id, link_id)
+            output_data = link_outputs[i - 1]
 
             if output_data:
                 stdout = output_data.get('stdout', '')
@@ -191,12 +199,21 @@ class CalderaReporter:
 
         return report
 
+    def _fetch_link_results(self, operation_id: str, chain: List[Dict]) -> List[Optional[Dict]]:
+        """chain의 모든 link result 조회 (max_workers개 동시 요청, chain 순서로 반환)."""
+        link_ids = [link.get('id') for link in chain]
+        workers = min(self.max_workers, len(link_ids))
+        if workers <= 1:
+            return [self._get_link_result(operation_id, link_id) for link_id in link_ids]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda link_id: self._get_link_result(operation_id, link_id), link_ids))
+
     def _get_link_result(self, operation_id: str, link_id: str) -> Optional[Dict]:
         """Link의 result를 가져오기."""
         try:
-            resp = requests.get(
-                f"{self.base_url}/api/v2/operations/{operation_id}/links/{link_id}/result",
-                headers=self.headers,
+            resp = self.client.get(
+                f"/api/v2/operations/{operation_id}/links/{link_id}/result",
                 timeout=10
             )
 
@@ -292,6 +309,51 @@ class CalderaReporter:
             'with_any_output': with_any_output,
         }
 
+    def merge_reports(self, base_report: Dict, retry_report: Dict) -> Dict:
+        """일부 Ability만 재실행한 리포트를 이전 전체 리포트에 병합.
+
+        재실행된 ability의 결과는 재실행 결과로 교체하고 (이전 결과 위치에 삽입), 나머지는 이전 결과를
+        그대로 유지한 뒤 통계를 다시 계산합니다.
+
+        Args:
+            base_report: 이전 실행의 전체 리포트.
+            retry_report: 재실행 리포트 (일부 ability만 포함).
+
+        Returns:
+            Dict: 병합된 리포트 (operation_metadata는 재실행 기준, merged_from에 이전 Operation ID 기록).
+        """
+        retried: Dict[str, List[Dict]] = {}
+        for result in retry_report.get('results', []):
+            retried.setdefault(result.get('ability_id'), []).append(result)
+
+        results = []
+        inserted = set()
+        for result in base_report.get('results', []):
+            ability_id = result.get('ability_id')
+            if ability_id not in retried:
+                results.append(result)
+            elif ability_id not in inserted:
+                results.extend(retried[ability_id])
+                inserted.add(ability_id)
+        for ability_id, ability_results in retried.items():
+            if ability_id not in inserted:
+                results.extend(ability_results)
+
+        agents = list(base_report.get('agents', []))
+        known_paws = {agent.get('paw') for agent in agents}
+        agents.extend(agent for agent in retry_report.get('agents', []) if agent.get('paw') not in known_paws)
+
+        metadata = dict(retry_report.get('operation_metadata', {}))
+        metadata['merged_from'] = base_report.get('operation_metadata', {}).get('id')
+        metadata['retried_abilities'] = len(retried)
+
+        return {
+            'operation_metadata': metadata,
+            'agents': agents,
+            'results': results,
+            'statistics': self._calculate_stats(results),
+        }
+
     def save_report(self, report: Dict, filename: str):
         """Report 저장."""
         with open(filename, 'w', encoding='utf-8') as f:
@@ -0,0 +1,75 @@
+"""Step 5 재시도 범위 선택 (수정된 Ability + 선행 Ability만 재실행)."""
+import os
+from typing import Dict, Iterable, List
+
+import yaml
+
+from modules.steps.step4_ability_generator import node_ability_id
+
+
+def load_prerequisites(step3_file: str) -> Dict[str, List[str]]:
+    """Step 3 concrete_flow의 edges로 Ability별 직접 선행 Ability 목록 생성.
+
+    edges의 from → to를 "to를 실행하려면 from이 먼저 실행되어야 함"으로 보며,
+    dependency_type이 optional인 edge는 제외합니다.
+
+    Args:
+        step3_file: step3.yml 경로.
+
+    Returns:
+        Dict[str, List[str]]: {ability_id: [선행 ability_id, ...]} (파일이 없거나 edges가 없으면 빈 딕셔너리).
+    """
+    if not step3_file or not os.path.exists(step3_file):
+        return {}
+
+    with open(step3_file, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+
+    flow = data.get('concrete_flow', data)
+    node_ids = {node.get('id'): node_ability_id(node.get('id'), node.get('name'))
+                for node in flow.get('nodes') or [] if node.get('id')}
+
+    prerequisites: Dict[str, List[str]] = {}
+    for edge in flow.get('edges') or []:
+        if str(edge.get('dependency_type', 'required')).lower() == 'optional':
+            continue
+        source, target = node_ids.get(edge.get('from')), node_ids.get(edge.get('to'))
+        if source and target and source != target:
+            required = prerequisites.setdefault(target, [])
+            if source not in required:
+                required.append(source)
+    return prerequisites
+
+
+def select_retry_abilities(atomic_ordering: List[str], corrected_ids: Iterable[str],
+                           prerequisites: Dict[str, List[str]]) -> List[str]:
+    """재실행할 Ability 선택 (수정된 Ability + 전이적 선행 Ability, 원래 실행 순서 유지).
+
+    Args:
+        atomic_ordering: 원본 Adversary의 실행 순서.
+        corrected_ids: 이번 재시도에서 수정된 ability_id.
+        prerequisites: load_prerequisites() 결과.
+
+    Returns:
+        List[str]: atomic_ordering 순서의 재실행 ability_id 목록.
+    """
+    selected = set()
+    stack = [ability_id for ability_id in corrected_ids if ability_id in atomic_ordering]
+    while stack:
+        ability_id = stack.pop()
+        if ability_id in selected:
+            continue
+        selected.add(ability_id)
+        stack.extend(prerequisites.get(ability_id, []))
+
+    return [ability_id for ability_id in atomic_ordering if ability_id in selected]
+
+
+def build_retry_adversary(base_adversary: Dict, ability_ids: List[str]) -> Dict:
+    """선택한 Ability만 담은 재시도용 Adversary (ID는 원본 ID + '-retry', 재시도마다 덮어씀)."""
+    return {
+        "adversary_id": f"{base_adversary['adversary_id']}-retry",
+        "name": f"{base_adversary.get('name', base_adversary['adversary_id'])} (Retry)",
+        "description": f"Step 5 retry subset of {base_adversary['adversary_id']} ({len(ability_ids)} abilities)",
+        "atomic_ordering": list(ability_ids)
+    }
@@ -1,58 +1,152 @@
 """Caldera 업로더 모듈."""
-import requests
+import hashlib
+import os
+import tempfile
 import yaml
 import json
-from typing import List
-from modules.core.config import get_caldera_url, get_caldera_api_key
+from typing import Dict, List, Optional, Set, Tuple
+from modules.caldera.bulk import DEFAULT_BULK_WORKERS, DEFAULT_ITEM_RETRIES, is_retryable_status, run_bulk
+from modules.caldera.client import get_caldera_client
+
+# abilities.yml 옆에 저장하는 업로드 매니페스트 (ability별 마지막 업로드 내용 해시)
+MANIFEST_FILENAME = "abilities.upload_manifest.json"
+
+
+def ability_content_hash(ability: Dict) -> str:
+    """Ability 내용의 SHA-256 (키 순서와 무관)."""
+    payload = json.dumps(ability, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def manifest_path_for(abilities_file: str) -> str:
+    """abilities.yml과 같은 디렉토리의 업로드 매니페스트 경로."""
+    return os.path.join(os.path.dirname(os.path.abspath(abilities_file)), MANIFEST_FILENAME)
 
 
 class CalderaUploader:
     """Caldera에 Ability와 Adversary를 업로드하는 클래스."""
 
-    def __init__(self):
-        self.base_url = get_caldera_url().rstrip('/')
-        self.api_key = get_caldera_api_key()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'KEY': self.api_key,
-            'Content-Type': 'application/json'
-        })
+    def __init__(self, max_workers: int = DEFAULT_BULK_WORKERS, retries: int = DEFAULT_ITEM_RETRIES):
+        """
+        Args:
+            max_workers: 동시 업로드 요청 수 (1이면 순차 업로드).
+            retries: 항목별 추가 시도 횟수 (연결 오류, 429/5xx 응답).
+        """
+        self.client = get_caldera_client()
+        self.base_url = self.client.base_url
+        self.max_workers = max(1, max_workers)
+        self.retries = retries
         self.uploaded_ability_ids = []
         self.uploaded_adversary_ids = []
 
-    def _upsert(self, endpoint: str, item_id: str, data: dict) -> tuple[bool, str]:
+    def _upsert(self, endpoint: str, item_id: str, data: dict,
+                exists: Optional[bool] = None) -> tuple[bool, str]:
         """공통 upsert 로직: 존재하면 PUT, 없으면 POST.
 
         Args:
             endpoint: API 엔드포인트 (예: 'abilities', 'adversaries').
             item_id: 항목 ID.
             data: 데이터 딕셔너리.
+            exists: 서버 존재 여부 (None이면 GET으로 확인).
 
         Returns:
             tuple[bool, str]: (성공 여부, 수행한 작업 'UPDATE'/'CREATE').
         """
-        check_url = f"{self.base_url}/api/v2/{endpoint}/{item_id}"
-        exists = self.session.get(check_url).status_code == 200
+        response, action = self._send_upsert(endpoint, item_id, data, exists)
+        return response.status_code in (200, 201), action
+
+    def _send_upsert(self, endpoint: str, item_id: str, data: dict, exists: Optional[bool]):
+        check_path = f"/api/v2/{endpoint}/{item_id}"
+        if exists is None:
+            exists = self.client.get(check_path).status_code == 200
 
         if exists:
-            response = self.session.put(check_url, json=data)
-            action = "UPDATE"
-        else:
-            url = f"{self.base_url}/api/v2/{endpoint}"
-            response = self.session.post(url, json=data)
-            action = "CREATE"
+            return self.client.put(check_path, json=data), "UPDATE"
+        return self.client.post(f"/api/v2/{endpoint}", json=data), "CREATE"
 
-        return response.status_code in (200, 201), action
+    def _upsert_task(self, task: Dict) -> Tuple[bool, str, bool]:
+        """run_bulk용 upsert.
 
+        목록 조회로 알게 된 존재 여부는 첫 시도에만 쓰고, 재시도에서는 GET으로 다시 확인합니다
+        (응답을 못 받은 POST가 서버에는 반영되었을 수 있으므로).
+        """
+        exists = task.pop('exists', None)
+        response, action = self._send_upsert(task['endpoint'], task['item_id'], task['data'], exists)
+        if response.status_code in (200, 201):
+            return True, action, False
+        return False, f"{action} HTTP {response.status_code}", is_retryable_status(response.status_code)
+
+    def _upload_items(self, endpoint: str, label: str, items: List[Tuple[str, Dict, Optional[bool]]]):
+        """(항목 ID, 데이터, 서버 존재 여부) 목록을 동시에 upsert.
+
+        Returns:
+            BulkSummary: 입력 순서의 항목별 결과 (detail은 성공 시 'CREATE'/'UPDATE').
+        """
+        tasks = [(item_id, {'endpoint': endpoint, 'item_id': item_id, 'data': data, 'exists': exists})
+                 for item_id, data, exists in items]
+        return run_bulk(label, tasks, self._upsert_task, max_workers=self.max_workers, retries=self.retries)
+
+    def _fetch_existing_ids(self, endpoint: str, id_key: str) -> Optional[Set[str]]:
+        """서버에 있는 항목 ID를 한 번에 조회.
 
-    def upload_abilities(self, abilities_file: str) -> List[str]:
-        """Abilities 업로드 (upsert).
+        include 파라미터로 ID 필드만 요청합니다 (지원하지 않는 서버는 전체 객체를 반환해도 동일하게 처리).
+
+        Returns:
+            Optional[Set[str]]: ID 집합 (조회 실패 시 None → 항목별 GET으로 확인).
+        """
+        try:
+            response = self.client.get(f"/api/v2/{endpoint}", params={'include': id_key})
+            response.raise_for_status()
+            return {item.get(id_key) for item in response.json() if item.get(id_key)}
+        except Exception as e:
+            print(f"  [WARNING] {endpoint} 목록 조회 실패, 항목별로 확인합니다: {e}")
+            return None
+
+    @staticmethod
+    def _load_manifest(manifest_file: str, base_url: str) -> Dict[str, str]:
+        """업로드 매니페스트 로드 (다른 서버에 업로드한 기록이면 무시).
+
+        Returns:
+            Dict[str, str]: {ability_id: 마지막 업로드 내용 해시}.
+        """
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('server') != base_url:
+            return {}
+        return dict(manifest.get('abilities') or {})
+
+    @staticmethod
+    def _save_manifest(manifest_file: str, base_url: str, hashes: Dict[str, str]):
+        """업로드 매니페스트 저장 (임시 파일에 쓴 뒤 교체, 실패 시 임시 파일 삭제)."""
+        directory = os.path.dirname(manifest_file)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'server': base_url, 'abilities': hashes}, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, manifest_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def upload_abilities(self, abilities_file: str, force: bool = False) -> List[str]:
+        """Abilities 업로드 (변경분만 upsert).
+
+        abilities.yml 옆의 매니페스트(abilities.upload_manifest.json)에 ability별 마지막 업로드 내용
+        해시를 기록하고, 해시가 같고 서버에도 남아 있는 ability는 건너뜁니다. 서버의 기존 ID는
+        목록 API 한 번으로 조회하여 항목별 GET 없이 PUT/POST를 결정합니다.
 
         Args:
             abilities_file: abilities.yml 파일 경로.
+            force: True면 매니페스트와 관계없이 모든 ability 업로드.
 
         Returns:
-            List[str]: 업로드된 Ability ID 목록.
+            List[str]: 서버에 반영된 Ability ID 목록 (변경 없어 건너뛴 ability 포함).
         """
         print("\n" + "="*70)
         print("Abilities 업로드")
@@ -65,24 +159,43 @@ class CalderaUploader:
             print("  [ERROR] No abilities found")
             return []
 
-        uploaded_ids = []
-        created, updated = 0, 0
+        manifest_file = manifest_path_for(abilities_file)
+        previous = {} if force else self._load_manifest(manifest_file, self.base_url)
+        existing = self._fetch_existing_ids('abilities', 'ability_id')
+        hashes = dict(previous)
 
-        for i, ability in enumerate(abilities, 1):
+        content_hashes = {}
+        changed = []
+        for ability in abilities:
             ability_id = ability.get('ability_id')
-            print(f"  [{i}/{len(abilities)}] {ability.get('name', 'Unknown')}")
-
-            success, action = self._upsert('abilities', ability_id, ability)
-            if success:
-                print(f"    [OK] {action}")
-                uploaded_ids.append(ability_id)
-                self.uploaded_ability_ids.append(ability_id)
-                created += 1 if action == "CREATE" else 0
-                updated += 1 if action == "UPDATE" else 0
-            else:
-                print(f"    [FAILED]")
-
-        print(f"\n  완료: {len(uploaded_ids)}/{len(abilities)} (신규: {created}, 수정: {updated})")
+            content_hashes[ability_id] = ability_content_hash(ability)
+            exists = None if existing is None else ability_id in existing
+
+            # 마지막 업로드와 내용이 같고 서버에도 있으면 건너뜀 (서버에서 삭제된 경우 다시 생성)
+            if previous.get(ability_id) == content_hashes[ability_id] and exists is not False:
+                continue
+            changed.append((ability_id, ability, exists))
+
+        unchanged = len(abilities) - len(changed)
+        print(f"  변경: {len(changed)}개, 변경 없음: {unchanged}개 (동시 {min(self.max_workers, max(1, len(changed)))}개)")
+
+        summary = self._upload_items('abilities', 'ability', changed)
+        failed_ids = {result.item_id for result in summary.failed}
+        for result in summary.succeeded:
+            hashes[result.item_id] = content_hashes[result.item_id]
+        for ability_id in failed_ids:
+            hashes.pop(ability_id, None)
+        self._save_manifest(manifest_file, self.base_url, hashes)
+
+        # 건너뛴 ability도 서버에 있으므로 추적 목록에 포함 (abilities.yml 순서)
+        uploaded_ids = [a.get('ability_id') for a in abilities if a.get('ability_id') not in failed_ids]
+        self.uploaded_ability_ids.extend(uploaded_ids)
+
+        created = sum(1 for result in summary.succeeded if result.detail == "CREATE")
+        updated = len(summary.succeeded) - created
+        print(f"\n  완료: {len(uploaded_ids)}/{len(abilities)} (신규: {created}, 수정: {updated}, 변경 없음: {unchanged})")
+        if summary.results:
+            summary.print_summary()
         return uploaded_ids
 
     def upload_adversaries(self, adversaries_file: str) -> List[str]:
@@ -105,26 +218,51 @@ class CalderaUploader:
             print("  [ERROR] No adversaries found")
             return []
 
-        uploaded_ids = []
-        created, updated = 0, 0
+        existing = self._fetch_existing_ids('adversaries', 'adversary_id')
+        summary = self._upload_items('adversaries', 'adversary', [
+            (adversary.get('adversary_id'), adversary,
+             None if existing is None else adversary.get('adversary_id') in existing)
+            for adversary in adversaries
+        ])
 
-        for i, adversary in enumerate(adversaries, 1):
-            adversary_id = adversary.get('adversary_id')
-            print(f"  [{i}/{len(adversaries)}] {adversary.get('name', 'Unknown')}")
-
-            success, action = self._upsert('adversaries', adversary_id, adversary)
-            if success:
-                print(f"    [OK] {action}")
-                uploaded_ids.append(adversary_id)
-                self.uploaded_adversary_ids.append(adversary_id)
-                created += 1 if action == "CREATE" else 0
-                updated += 1 if action == "UPDATE" else 0
-            else:
-                print(f"    [FAILED]")
+        uploaded_ids = [result.item_id for result in summary.succeeded]
+        self.uploaded_adversary_ids.extend(uploaded_ids)
 
+        created = sum(1 for result in summary.succeeded if result.detail == "CREATE")
+        updated = len(summary.succeeded) - created
         print(f"\n  완료: {len(uploaded_ids)}/{len(adversaries)} (신규: {created}, 수정: {updated})")
+        summary.print_summary()
         return uploaded_ids
 
+    def upload_all(self, abilities_file: str, adversaries_file: str) -> Tuple[List[str], List[str]]:
+        """Abilities를 모두 업로드한 뒤 Adversaries 업로드 (Adversary가 참조하는 Ability가 먼저 있어야 함).
+
+        Returns:
+            Tuple[List[str], List[str]]: (Ability ID 목록, Adversary ID 목록).
+        """
+        ability_ids = self.upload_abilities(abilities_file)
+        adversary_ids = self.upload_adversaries(adversaries_file)
+        return ability_ids, adversary_ids
+
+    def upload_adversary(self, adversary: Dict) -> bool:
+        """단일 Adversary 업로드 (upsert).
+
+        Args:
+            adversary: Adversary 딕셔너리 (adversary_id, name, atomic_ordering 등).
+
+        Returns:
+            bool: 성공 여부.
+        """
+        adversary_id = adversary.get('adversary_id')
+        success, action = self._upsert('adversaries', adversary_id, adversary)
+        if success:
+            print(f"  [OK] Adversary {action}: {adversary_id} ({len(adversary.get('atomic_ordering', []))}개 ability)")
+            if adversary_id not in self.uploaded_adversary_ids:
+                self.uploaded_adversary_ids.append(adversary_id)
+        else:
+            print(f"  [FAILED] Adversary 업로드 실패: {adversary_id}")
+        return success
+
     def save_tracking_file(self, output_file: str):
         """업로드된 ID 추적 파일 저장.
 
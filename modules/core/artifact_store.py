@@ -0,0 +1,150 @@
+"""
+콘텐츠 주소 기반 아티팩트 저장소
+입력 파일 해시 + 추출기 버전을 키로 중간 결과를 재사용하고 LRU/용량 기준으로 정리
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+
+class ArtifactStore:
+    """SHA-256 키 기반 JSON 아티팩트 캐시.
+
+    디렉토리 구조:
+        {root}/{key[:2]}/{key}.json
+
+    마지막 접근 시각은 파일 mtime으로 기록하며 (noatime 마운트에서도 동작),
+    용량/개수 제한을 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, root: str, max_bytes: Optional[int] = None, max_entries: Optional[int] = None):
+        """
+        Args:
+            root: 캐시 루트 디렉토리.
+            max_bytes: 전체 캐시 최대 용량 (None이면 제한 없음).
+            max_entries: 최대 항목 수 (None이면 제한 없음).
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+    @staticmethod
+    def hash_file(file_path: str, chunk_size: int = 1 << 20) -> str:
+        """파일 내용의 SHA-256 해시 계산.
+
+        Args:
+            file_path: 파일 경로.
+            chunk_size: 읽기 단위 (bytes).
+
+        Returns:
+            str: 16진수 해시 문자열.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(chunk_size), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(content_hash: str, version: str) -> str:
+        """콘텐츠 해시와 생성기 버전으로 캐시 키 생성.
+
+        Args:
+            content_hash: 입력 파일의 SHA-256.
+            version: 추출기/생성기 버전 문자열.
+
+        Returns:
+            str: 캐시 키 (SHA-256).
+        """
+        return hashlib.sha256(f"{content_hash}:{version}".encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (적중 시 LRU 시각 갱신).
+
+        Args:
+            key: 캐시 키.
+
+        Returns:
+            Optional[Any]: 저장된 데이터 또는 None.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: Any):
+        """캐시 저장 (임시 파일 작성 후 원자적 교체) 및 정리.
+
+        Args:
+            key: 캐시 키.
+            data: JSON 직렬화 가능한 데이터.
+        """
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.evict()
+
+    def evict(self) -> int:
+        """용량/개수 제한 초과 시 LRU 순으로 삭제.
+
+        Returns:
+            int: 삭제된 항목 수.
+        """
+        if self.max_bytes is None and self.max_entries is None:
+            return 0
+        if not self.root.exists():
+            return 0
+
+        entries = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        # 오래 사용되지 않은 순
+        entries.sort(key=lambda e: e[0])
+        total_bytes = sum(size for _, size, _ in entries)
+        count = len(entries)
+        removed = 0
+
+        for _, size, path in entries:
+            over_bytes = self.max_bytes is not None and total_bytes > self.max_bytes
+            over_count = self.max_entries is not None and count > self.max_entries
+            if not (over_bytes or over_count):
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_bytes -= size
+            count -= 1
+            removed += 1
+
+        return removed
@@ -0,0 +1,182 @@
+"""
+토큰 기반 의미 단위 청커
+페이지 → 문단 → 줄 경계를 지키면서 공급자별 토큰 예산에 맞춰 Step 2 분석용 청크를 생성
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from modules.core.config import LLM_PROVIDER_ALIASES, get_step2_chunk_tokens
+from modules.core.tokens import estimate_tokens
+
+
+# 공급자별 청크당 토큰 예산 (프롬프트 템플릿 + 개요 + 응답 여유분을 고려한 본문 크기)
+CHUNK_TOKEN_BUDGETS = {
+    "claude": 6000,
+    "chatgpt": 4000,
+    "gemini": 8000,
+    "grok": 4000,
+}
+DEFAULT_CHUNK_TOKENS = 4000
+
+# 새 문단의 시작으로 보는 줄 (글머리표, 번호, 로마 숫자 제목, 원문자, 참고 표시 등)
+_PARAGRAPH_START_RE = re.compile(
+    r"^\s*("
+    r"[-•·▪◦o※*]\s"
+    r"|\d{1,2}[.)]\s"
+    r"|[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩ]+\.\s"
+    r"|[①-⑳]"
+    r"|[\[【<(]"
+    r")"
+)
+
+
+def get_chunk_token_budget(provider: Optional[str] = None) -> int:
+    """공급자별 청크 토큰 예산 (STEP2_CHUNK_TOKENS 환경변수가 있으면 우선).
+
+    Args:
+        provider: LLM 공급자 이름 (별칭 허용).
+
+    Returns:
+        int: 청크당 최대 토큰 수.
+    """
+    override = get_step2_chunk_tokens()
+    if override:
+        return override
+
+    name = (provider or "").lower()
+    name = LLM_PROVIDER_ALIASES.get(name, name)
+    return CHUNK_TOKEN_BUDGETS.get(name, DEFAULT_CHUNK_TOKENS)
+
+
+@dataclass
+class _Unit:
+    """청크를 구성하는 최소 단위 (문단 또는 분할된 줄)"""
+    text: str
+    tokens: int
+    separator: str  # 앞 단위와 이어 붙일 때 사용하는 구분자
+    page_number: int
+
+
+class SemanticChunker:
+    """페이지/문단/줄 경계를 지키는 토큰 예산 기반 청커.
+
+    - 페이지와 문단 경계에서 우선 분할하고, 한 문단이 예산을 넘으면 줄 단위로,
+      한 줄이 예산을 넘을 때만 문자 단위로 자릅니다.
+    - overlap_tokens > 0이면 이전 청크 끝부분의 단위를 다음 청크 앞에 반복합니다.
+    - pages는 이터레이터여도 되며, 청크는 필요한 페이지만 읽은 뒤 바로 생성됩니다.
+    """
+
+    def __init__(self, max_tokens: int, overlap_tokens: int = 0,
+                 token_counter: Callable[[str], int] = estimate_tokens):
+        """
+        Args:
+            max_tokens: 청크당 최대 토큰 수.
+            overlap_tokens: 이전 청크에서 반복할 최대 토큰 수 (max_tokens의 절반 이하로 제한).
+            token_counter: 토큰 수 계산 함수.
+        """
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+        self.max_tokens = max_tokens
+        self.overlap_tokens = max(0, min(overlap_tokens, max_tokens // 2))
+        self.count_tokens = token_counter
+        self.stats: Dict[str, int] = {"pages": 0, "chunks": 0, "tokens": 0}
+
+    def chunks(self, pages: Iterable[Dict]) -> Iterator[str]:
+        """페이지 목록(또는 스트림)에서 청크 텍스트 생성"""
+        current: List[_Unit] = []
+        current_tokens = 0
+
+        for unit in self._units(pages):
+            if current and current_tokens + unit.tokens > self.max_tokens:
+                yield self._emit(current)
+                current = self._overlap_tail(current)
+                current_tokens = sum(u.tokens for u in current)
+                # 겹침 부분 때문에 예산을 넘으면 겹침을 포기
+                if current_tokens + unit.tokens > self.max_tokens:
+                    current, current_tokens = [], 0
+
+            current.append(unit)
+            current_tokens += unit.tokens
+
+        if current:
+            yield self._emit(current)
+
+    def _emit(self, units: List[_Unit]) -> str:
+        text = units[0].text + "".join(u.separator + u.text for u in units[1:])
+        self.stats["chunks"] += 1
+        self.stats["tokens"] += sum(u.tokens for u in units)
+        return text
+
+    def _overlap_tail(self, units: List[_Unit]) -> List[_Unit]:
+        """청크 끝에서 overlap_tokens 이내의 단위들"""
+        if not self.overlap_tokens:
+            return []
+        tail: List[_Unit] = []
+        total = 0
+        # 청크 전체를 반복하지 않도록 첫 단위는 제외
+        for unit in reversed(units[1:]):
+            if total + unit.tokens > self.overlap_tokens:
+                break
+            tail.insert(0, unit)
+            total += unit.tokens
+        return tail
+
+    def _units(self, pages: Iterable[Dict]) -> Iterator[_Unit]:
+        """페이지를 문단 단위로 나누고, 예산을 넘는 문단은 더 잘게 분할"""
+        for page in pages:
+            self.stats["pages"] += 1
+            page_number = page.get("page_number", 0)
+            separator = "\n\n"  # 페이지 경계 (기존 full_text 결합 방식과 동일)
+
+            for paragraph in self._paragraphs(page.get("text", "")):
+                tokens = self.count_tokens(paragraph)
+                if tokens <= self.max_tokens:
+                    yield _Unit(paragraph, tokens, separator, page_number)
+                else:
+                    for i, piece in enumerate(self._split_oversized(paragraph)):
+                        yield _Unit(piece, self.count_tokens(piece), separator if i == 0 else "\n", page_number)
+                separator = "\n"
+
+    @staticmethod
+    def _paragraphs(text: str) -> List[str]:
+        """빈 줄 또는 글머리표/번호로 시작하는 줄을 문단 경계로 분할"""
+        paragraphs: List[List[str]] = []
+        for line in text.split("\n"):
+            if not line.strip():
+                if paragraphs and paragraphs[-1]:
+                    paragraphs.append([])
+                continue
+            if not paragraphs or (paragraphs[-1] and _PARAGRAPH_START_RE.match(line)):
+                paragraphs.append([])
+            paragraphs[-1].append(line)
+        return ["\n".join(lines) for lines in paragraphs if lines]
+
+    def _split_oversized(self, paragraph: str) -> Iterator[str]:
+        """예산을 넘는 문단을 줄 단위로 묶고, 그래도 넘는 줄은 문자 단위로 분할"""
+        buffer: List[str] = []
+        buffer_tokens = 0
+        for line in paragraph.split("\n"):
+            tokens = self.count_tokens(line)
+            if tokens > self.max_tokens:
+                if buffer:
+                    yield "\n".join(buffer)
+                    buffer, buffer_tokens = [], 0
+                yield from self._split_line(line, tokens)
+                continue
+            if buffer and buffer_tokens + tokens > self.max_tokens:
+                yield "\n".join(buffer)
+                buffer, buffer_tokens = [], 0
+            buffer.append(line)
+            buffer_tokens += tokens
+        if buffer:
+            yield "\n".join(buffer)
+
+    def _split_line(self, line: str, tokens: int) -> Iterator[str]:
+        """한 줄이 예산을 넘는 경우 토큰 비율에 맞춰 문자 단위로 분할"""
+        step = max(1, int(len(line) * self.max_tokens / tokens))
+        while step > 1 and self.count_tokens(line[:step]) > self.max_tokens:
+            step = int(step * 0.9)
+        for start in range(0, len(line), step):
+            yield line[start:start + step]
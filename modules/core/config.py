@@ -2,6 +2,7 @@
 Configuration utility for loading environment variables
 """
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Load .env file
@@ -50,6 +51,33 @@ def get_caldera_api_key() -> str:
     return os.getenv("CALDERA_API_KEY", "ADMIN123")
 
 
+def get_caldera_http_pool_size() -> int:
+    """Get Caldera API connection pool size from environment variable.
+
+    Returns:
+        int: Maximum keep-alive connections to the Caldera server (default: 16)
+    """
+    return int(os.getenv("CALDERA_HTTP_POOL_SIZE", "16"))
+
+
+def get_caldera_http_retries() -> int:
+    """Get Caldera API retry count from environment variable.
+
+    Returns:
+        int: Retries for connection errors and 429/502/503/504 responses (default: 3, POST is never retried)
+    """
+    return int(os.getenv("CALDERA_HTTP_RETRIES", "3"))
+
+
+def get_caldera_http_timeout() -> float:
+    """Get Caldera API read timeout (seconds) from environment variable.
+
+    Returns:
+        float: Read timeout in seconds (default: 60)
+    """
+    return float(os.getenv("CALDERA_HTTP_TIMEOUT", "60"))
+
+
 def get_llm_provider() -> str:
     """Get LLM provider from environment variable.
 
@@ -129,3 +157,208 @@ def get_grok_model() -> str:
         str: Grok model name (default: grok-beta)
     """
     return os.getenv('GROK_MODEL', 'grok-beta')
+
+
+# 공급자 별칭 → 표준 이름
+LLM_PROVIDER_ALIASES = {
+    "claude": "claude",
+    "chatgpt": "chatgpt",
+    "openai": "chatgpt",
+    "gpt": "chatgpt",
+    "gemini": "gemini",
+    "google": "gemini",
+    "grok": "grok",
+    "xai": "grok",
+}
+
+
+def get_llm_model(provider: str = None) -> str:
+    """Get the model name configured for an LLM provider (without creating its client).
+
+    Args:
+        provider: Provider name or alias (default: LLM_PROVIDER)
+
+    Returns:
+        str: Model name
+
+    Raises:
+        ValueError: If the provider is not supported
+    """
+    canonical = LLM_PROVIDER_ALIASES.get((provider or get_llm_provider()).lower())
+    getters = {
+        "claude": get_claude_model,
+        "chatgpt": get_openai_model,
+        "gemini": get_gemini_model,
+        "grok": get_grok_model,
+    }
+    if canonical is None:
+        raise ValueError(f"Unsupported LLM provider: {provider or get_llm_provider()}")
+    return getters[canonical]()
+
+
+def get_step1_cache_dir() -> str:
+    """Get Step 1 artifact cache directory from environment variable.
+
+    Returns:
+        str: Cache directory (default: <project_root>/data/cache/step1)
+    """
+    default_dir = Path(__file__).resolve().parents[2] / "data" / "cache" / "step1"
+    return os.getenv('STEP1_CACHE_DIR', str(default_dir))
+
+
+def get_step1_cache_max_mb() -> int:
+    """Get Step 1 artifact cache size limit (MB) from environment variable.
+
+    Returns:
+        int: Maximum cache size in MB (default: 512)
+    """
+    return int(os.getenv('STEP1_CACHE_MAX_MB', '512'))
+
+
+def get_step2_chunk_tokens() -> int:
+    """Get Step 2 per-chunk token budget override from environment variable.
+
+    Returns:
+        int: Tokens per chunk (default: 0 = per-provider budget)
+
+    Raises:
+        ValueError: If STEP2_CHUNK_TOKENS is not a non-negative integer
+    """
+    value = os.getenv('STEP2_CHUNK_TOKENS', '0').strip() or '0'
+    try:
+        tokens = int(value)
+    except ValueError:
+        raise ValueError(f"STEP2_CHUNK_TOKENS must be an integer, got {value!r}") from None
+    if tokens < 0:
+        raise ValueError(f"STEP2_CHUNK_TOKENS must be 0 or greater, got {tokens}")
+    return tokens
+
+
+def get_llm_cache_path() -> str:
+    """Get LLM response cache (SQLite) path from environment variable.
+
+    Returns:
+        str: Cache database path (default: <project_root>/data/cache/llm/responses.sqlite3)
+    """
+    default_path = Path(__file__).resolve().parents[2] / "data" / "cache" / "llm" / "responses.sqlite3"
+    return os.getenv('LLM_CACHE_PATH', str(default_path))
+
+
+def get_llm_cache_ttl_hours() -> float:
+    """Get LLM response cache TTL (hours) from environment variable.
+
+    Returns:
+        float: TTL in hours (default: 0 = no expiry)
+    """
+    return float(os.getenv('LLM_CACHE_TTL_HOURS', '0'))
+
+
+def get_llm_cache_max_mb() -> int:
+    """Get LLM response cache size limit (MB) from environment variable.
+
+    Returns:
+        int: Maximum cache size in MB (default: 256)
+    """
+    return int(os.getenv('LLM_CACHE_MAX_MB', '256'))
+
+
+def get_mitre_bundle_path() -> str:
+    """Get MITRE ATT&CK STIX bundle path from environment variable.
+
+    Returns:
+        str: Bundle path (default: <project_root>/data/mitre/enterprise-attack.json)
+    """
+    default_path = Path(__file__).resolve().parents[2] / "data" / "mitre" / "enterprise-attack.json"
+    return os.getenv('MITRE_ATTACK_PATH', str(default_path))
+
+
+def get_mitre_snapshot_path() -> str:
+    """Get MITRE technique snapshot path from environment variable.
+
+    Returns:
+        str: Snapshot path (default: <project_root>/data/cache/mitre/enterprise-attack.snapshot.pkl)
+    """
+    default_path = Path(__file__).resolve().parents[2] / "data" / "cache" / "mitre" / "enterprise-attack.snapshot.pkl"
+    return os.getenv('MITRE_SNAPSHOT_PATH', str(default_path))
+
+
+def get_classification_rules_path() -> str:
+    """Get Step 5 failure classification rules path from environment variable.
+
+    Returns:
+        str: Rules YAML path (default: <project_root>/config/classification_rules.yml)
+    """
+    default_path = Path(__file__).resolve().parents[2] / "config" / "classification_rules.yml"
+    return os.getenv('CLASSIFICATION_RULES_PATH', str(default_path))
+
+
+def get_correction_cache_path() -> str:
+    """Get Step 5 correction cache (SQLite) path from environment variable.
+
+    Returns:
+        str: Cache database path (default: <project_root>/data/cache/step5/corrections.sqlite3)
+    """
+    default_path = Path(__file__).resolve().parents[2] / "data" / "cache" / "step5" / "corrections.sqlite3"
+    return os.getenv('CORRECTION_CACHE_PATH', str(default_path))
+
+
+# 공급자별 동시 LLM 호출 기본 제한
+DEFAULT_LLM_PROVIDER_CONCURRENCY = {
+    "claude": 4,
+    "chatgpt": 4,
+    "gemini": 4,
+    "grok": 2,
+}
+
+
+def get_llm_max_concurrency() -> int:
+    """Get process-wide limit on in-flight LLM calls from environment variable.
+
+    Returns:
+        int: Maximum concurrent LLM calls across all providers (default: 8)
+    """
+    return int(os.getenv('LLM_MAX_CONCURRENCY', '8'))
+
+
+def get_llm_provider_concurrency(provider: str) -> int:
+    """Get per-provider limit on in-flight LLM calls from environment variable.
+
+    Reads LLM_MAX_CONCURRENCY_<PROVIDER> (e.g. LLM_MAX_CONCURRENCY_CLAUDE).
+
+    Returns:
+        int: Maximum concurrent calls for the provider (default: 4, grok: 2)
+    """
+    default = DEFAULT_LLM_PROVIDER_CONCURRENCY.get(provider, 4)
+    return int(os.getenv(f'LLM_MAX_CONCURRENCY_{provider.upper()}', str(default)))
+
+
+# 공급자별 기본 요청/토큰 한도 (분당, 0이면 제한 없음)
+DEFAULT_LLM_RATE_LIMITS = {
+    "claude": (50, 40000),
+    "chatgpt": (500, 30000),
+    "gemini": (60, 1000000),
+    "grok": (60, 100000),
+}
+
+
+def get_llm_rate_limits(provider: str) -> tuple:
+    """Get per-provider requests/min and input tokens/min limits from environment variables.
+
+    Reads LLM_RPM_<PROVIDER> and LLM_TPM_<PROVIDER> (e.g. LLM_RPM_CLAUDE). 0 disables a limit.
+
+    Returns:
+        tuple: (requests_per_minute, tokens_per_minute)
+    """
+    default_rpm, default_tpm = DEFAULT_LLM_RATE_LIMITS.get(provider, (60, 100000))
+    rpm = int(os.getenv(f'LLM_RPM_{provider.upper()}', str(default_rpm)))
+    tpm = int(os.getenv(f'LLM_TPM_{provider.upper()}', str(default_tpm)))
+    return rpm, tpm
+
+
+def get_llm_max_retries() -> int:
+    """Get retry count for rate-limit / 5xx LLM errors from environment variable.
+
+    Returns:
+        int: Maximum retries per call (default: 5)
+    """
+    return int(os.getenv('LLM_MAX_RETRIES', '5'))
@@ -0,0 +1,167 @@
+"""
+Step 5 수정 결과 캐시 (SQLite)
+(정규화한 원본 명령어, 실패 유형, stderr 시그니처) 지문을 키로 LLM이 만든 수정 명령어와
+재실행 결과(pending / succeeded / failed)를 저장하여, 재시도와 실험 사이에서 검증된 수정을 재사용
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+STATUS_PENDING = "pending"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+# stderr 시그니처에 쓰는 최대 길이 (긴 출력은 앞부분만 비교)
+SIGNATURE_MAX_CHARS = 2000
+
+# 실행마다 달라지는 값 → 자리표시자 (순서대로 적용)
+_VOLATILE_PATTERNS = [
+    (re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"), "<guid>"),
+    (re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}\b"), "<ip>"),
+    (re.compile(r"\b0x[0-9a-f]+\b"), "<hex>"),
+    (re.compile(r"\d+"), "<n>"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def normalize_command(command: str) -> str:
+    """명령어 정규화 (앞뒤 공백 제거, 연속 공백 하나로)."""
+    return " ".join((command or "").split())
+
+
+def stderr_signature(stderr: str) -> str:
+    """에러 출력의 시그니처 (소문자, GUID/IP/16진수/숫자 자리표시자 치환, 공백 정규화)."""
+    signature = (stderr or "").lower()
+    for pattern, placeholder in _VOLATILE_PATTERNS:
+        signature = pattern.sub(placeholder, signature)
+    return signature.strip()[:SIGNATURE_MAX_CHARS]
+
+
+class CorrectionCache:
+    """SQLite 기반 Ability 수정 결과 캐시.
+
+    - 지문마다 여러 수정 명령어를 가질 수 있으며, 각 수정은 pending → succeeded/failed 상태를 가짐
+    - lookup은 succeeded 상태인 수정만 반환 (미검증/실패한 수정은 LLM을 다시 호출)
+    - 재실행 리포트가 들어오면 record_outcomes로 해당 명령어의 상태를 최신 결과로 갱신
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite 데이터베이스 경로.
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Step 5 병렬 수정 등 여러 스레드에서 공유하므로 잠금으로 직렬화
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fixes ("
+            " fingerprint TEXT NOT NULL,"
+            " fixed_command TEXT NOT NULL,"
+            " failure_type TEXT NOT NULL,"
+            " original_command TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " PRIMARY KEY (fingerprint, fixed_command))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_fixes_fixed_command ON fixes(fixed_command)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_fingerprint(command: str, failure_type: str, stderr: str) -> str:
+        """원본 명령어, 실패 유형, stderr로 지문 생성.
+
+        Returns:
+            str: SHA-256 지문.
+        """
+        payload = json.dumps([normalize_command(command), failure_type, stderr_signature(stderr)], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def lookup(self, fingerprint: str) -> Optional[str]:
+        """재실행에서 성공이 확인된 수정 명령어 조회 (여러 개면 가장 최근에 확인된 것).
+
+        Returns:
+            Optional[str]: 수정 명령어 또는 None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fixed_command FROM fixes WHERE fingerprint = ? AND status = ?"
+                " ORDER BY updated_at DESC LIMIT 1",
+                (fingerprint, STATUS_SUCCEEDED)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def record_fix(self, fingerprint: str, fixed_command: str, failure_type: str, original_command: str):
+        """LLM이 만든 수정 저장 (이미 있는 수정이면 기존 상태 유지)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO fixes"
+                " (fingerprint, fixed_command, failure_type, original_command, status, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (fingerprint, fixed_command, failure_type, original_command,
+                 STATUS_PENDING, now, now)
+            )
+            self._conn.commit()
+
+    def record_outcomes(self, operation_report: Dict, abilities: List[Dict]) -> Tuple[int, int]:
+        """Operation 리포트 결과로 수정 명령어 상태 갱신.
+
+        abilities.yml의 현재 명령어가 저장된 수정 명령어와 같으면, 해당 ability가 하나 이상의
+        Agent에서 성공했는지에 따라 succeeded/failed로 기록합니다 (같은 리포트를 다시 넣어도 결과 동일).
+
+        Args:
+            operation_report: Operation 리포트 (results[].ability_id, status).
+            abilities: 리포트 실행 당시의 abilities.yml 내용.
+
+        Returns:
+            Tuple[int, int]: (succeeded로 갱신된 수, failed로 갱신된 수).
+        """
+        succeeded: Dict[str, bool] = {}
+        for result in operation_report.get('results', []):
+            ability_id = result.get('ability_id', '')
+            succeeded[ability_id] = succeeded.get(ability_id, False) or result.get('status', 0) == 0
+
+        updates = []
+        for ability in abilities or []:
+            if ability.get('ability_id') not in succeeded:
+                continue
+            executors = ability.get('executors') or []
+            if not executors:
+                continue
+            status = STATUS_SUCCEEDED if succeeded[ability['ability_id']] else STATUS_FAILED
+            updates.append((status, executors[0].get('command', '')))
+
+        if not updates:
+            return 0, 0
+
+        now = time.time()
+        counts = {STATUS_SUCCEEDED: 0, STATUS_FAILED: 0}
+        with self._lock:
+            for status, command in updates:
+                counts[status] += self._conn.execute(
+                    "UPDATE fixes SET status = ?, updated_at = ? WHERE fixed_command = ? AND status != ?",
+                    (status, now, command, status)
+                ).rowcount
+            self._conn.commit()
+        return counts[STATUS_SUCCEEDED], counts[STATUS_FAILED]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,188 @@
+"""
+실패 분류 규칙 컴파일러
+config/classification_rules.yml의 keywords / patterns / extractors를 한 번 컴파일해 두고,
+stderr/stdout에서 모든 규칙의 근거를 모아 점수 순으로 분류 결과 반환
+
+- keywords: 대소문자 무시 부분 문자열 (pyahocorasick 설치 시 Aho-Corasick 오토마톤, 없으면 키워드별 str.find)
+  (결합 정규식 `(?=(a|b|...))`은 위치마다 모든 대안을 시도하여 키워드별 검색보다 느림)
+  다른 키워드 안에 포함된 매칭은 제외 (예: "command not found" 안의 "not found")
+- patterns: 대소문자 무시 정규식, 로드 시 한 번 컴파일하여 패턴별로 첫 매칭까지만 검색
+  키워드가 매칭된 규칙에만 점수를 더함 (패턴만으로는 분류되지 않음)
+  (여러 패턴을 | 로 결합한 정규식은 CPython re에서 패턴별 리터럴 최적화가 사라져 오히려 느림)
+- extractors: 분류 결과에 포함된 규칙에 대해서만 실행하여 IP, 경로 등 값 추출 (대소문자 구분)
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# 규칙 점수: 키워드 1개당 1점, 패턴 1개당 0.25점
+# 패턴은 보조 근거로, 키워드가 하나 이상 매칭된 규칙에만 더함 ("At line:1 char:5"처럼
+# 거의 모든 PowerShell 에러에 나오는 패턴만으로 규칙이 선택되지 않도록)
+KEYWORD_WEIGHT = 1.0
+PATTERN_WEIGHT = 0.25
+# 추출기별 최대 추출 값 수
+MAX_EXTRACTED = 5
+
+
+@dataclass
+class RuleMatch:
+    """규칙 하나의 매칭 결과 (근거 포함)"""
+    rule: str
+    score: float
+    keywords: List[str] = field(default_factory=list)
+    patterns: List[str] = field(default_factory=list)
+    extracted: Dict[str, List[str]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return {
+            "rule": self.rule,
+            "score": self.score,
+            "keywords": self.keywords,
+            "patterns": self.patterns,
+            "extracted": self.extracted
+        }
+
+
+class _KeywordMatcher:
+    """여러 키워드를 한 번에 찾고, 다른 매칭 안에 포함된 매칭은 제외."""
+
+    def __init__(self, keywords: List[str], backend: Optional[str] = None):
+        """
+        Args:
+            keywords: 소문자 키워드 목록 (중복 없음)
+            backend: 'aho-corasick' 또는 'scan' (None이면 pyahocorasick 설치 여부로 선택)
+        """
+        if backend is None:
+            backend = "aho-corasick" if ahocorasick is not None else "scan"
+        if backend == "aho-corasick" and ahocorasick is None:
+            raise ImportError("pyahocorasick이 설치되어 있지 않습니다 (pip install pyahocorasick)")
+        self.backend = backend
+
+        if backend == "aho-corasick":
+            self._automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                self._automaton.add_word(keyword, keyword)
+            if keywords:
+                self._automaton.make_automaton()
+        elif backend == "scan":
+            self._keywords = list(keywords)
+        else:
+            raise ValueError(f"Unknown keyword backend: {backend}")
+        self._empty = not keywords
+
+    def find(self, text: str) -> List[str]:
+        """text (소문자)에서 매칭된 키워드 목록 (처음 나온 순서, 중복 없음)."""
+        if self._empty:
+            return []
+
+        if self.backend == "aho-corasick":
+            spans = [(end - len(keyword) + 1, end + 1, keyword) for end, keyword in self._automaton.iter(text)]
+        else:
+            # 키워드마다 C 수준 str.find로 모든 위치 검색 (규칙별 단순 검사와 같은 방식)
+            spans = []
+            for keyword in self._keywords:
+                start = text.find(keyword)
+                while start != -1:
+                    spans.append((start, start + len(keyword), keyword))
+                    start = text.find(keyword, start + 1)
+
+        # 시작 위치 오름차순, 같은 위치면 긴 것 먼저 → 앞선 매칭 범위 안에 끝나는 매칭은 포함된 것
+        spans.sort(key=lambda span: (span[0], -span[1]))
+        found = []
+        covered_end = -1
+        for start, end, keyword in spans:
+            if end <= covered_end:
+                continue
+            covered_end = end
+            if keyword not in found:
+                found.append(keyword)
+        return found
+
+
+class CompiledRuleSet:
+    """YAML 분류 규칙을 컴파일한 매처."""
+
+    def __init__(self, rules: Dict[str, Dict], keyword_backend: Optional[str] = None):
+        """
+        Args:
+            rules: {규칙 이름: {description, keywords, patterns, extractors}} (YAML과 같은 구조)
+            keyword_backend: 키워드 매칭 방식 ('aho-corasick' 또는 'scan', None이면 자동 선택)
+        """
+        self.rules = list(rules)
+        self._order = {name: index for index, name in enumerate(self.rules)}
+        self.descriptions = {name: (spec or {}).get('description', '') for name, spec in rules.items()}
+
+        # 키워드 → 규칙 목록 (같은 키워드가 여러 규칙에 있을 수 있음)
+        self._keyword_rules: Dict[str, List[str]] = {}
+        # (규칙, 원본 패턴, 컴파일된 정규식)
+        self._patterns: List[Tuple[str, str, re.Pattern]] = []
+        self._extractors: Dict[str, List[Tuple[str, re.Pattern]]] = {}
+
+        for name, spec in rules.items():
+            spec = spec or {}
+            for keyword in spec.get('keywords') or []:
+                rule_names = self._keyword_rules.setdefault(str(keyword).lower(), [])
+                if name not in rule_names:
+                    rule_names.append(name)
+            for pattern in spec.get('patterns') or []:
+                try:
+                    compiled = re.compile(pattern, re.IGNORECASE)
+                except re.error as e:
+                    raise ValueError(f"분류 규칙 '{name}'의 패턴 오류: {pattern} ({e})")
+                self._patterns.append((name, pattern, compiled))
+            extractors = []
+            for extractor_name, pattern in (spec.get('extractors') or {}).items():
+                try:
+                    extractors.append((extractor_name, re.compile(pattern)))
+                except re.error as e:
+                    raise ValueError(f"분류 규칙 '{name}'의 추출기 오류: {extractor_name} ({e})")
+            if extractors:
+                self._extractors[name] = extractors
+
+        self._keywords = _KeywordMatcher(list(self._keyword_rules), keyword_backend)
+
+    @classmethod
+    def from_yaml(cls, path: str, keyword_backend: Optional[str] = None) -> "CompiledRuleSet":
+        """classification_rules.yml 로드 후 컴파일."""
+        with open(path, 'r', encoding='utf-8') as f:
+            rules = yaml.safe_load(f) or {}
+        if not isinstance(rules, dict):
+            raise ValueError(f"분류 규칙 형식 오류 (규칙 이름 → 정의 매핑 필요): {path}")
+        return cls(rules, keyword_backend)
+
+    @property
+    def keyword_backend(self) -> str:
+        return self._keywords.backend
+
+    def classify(self, text: str) -> List[RuleMatch]:
+        """text를 분류하여 점수 내림차순 (동점이면 YAML 규칙 순서) 결과 목록 반환 (매칭 없으면 빈 목록)."""
+        matches: Dict[str, RuleMatch] = {}
+
+        for keyword in self._keywords.find(text.lower()):
+            for name in self._keyword_rules[keyword]:
+                match = matches.setdefault(name, RuleMatch(rule=name, score=0.0))
+                match.keywords.append(keyword)
+                match.score += KEYWORD_WEIGHT
+
+        for name, pattern, regex in self._patterns:
+            match = matches.get(name)
+            if match is None or not regex.search(text):
+                continue
+            match.patterns.append(pattern)
+            match.score += PATTERN_WEIGHT
+
+        for name, match in matches.items():
+            for extractor_name, regex in self._extractors.get(name, []):
+                values = list(dict.fromkeys(m.group(0) for m in regex.finditer(text)))[:MAX_EXTRACTED]
+                if values:
+                    match.extracted[extractor_name] = values
+
+        return sorted(matches.values(), key=lambda m: (-m.score, self._order[m.rule]))
@@ -4,14 +4,20 @@ LLM 사용량, 실행 시간, API 비용 등을 추적
 """
 
 import json
+import threading
 import time
+from contextvars import ContextVar
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from contextlib import contextmanager
 
 
+# 현재 LLM 호출이 속도 제한/재시도로 기다린 시간 (RateLimitedLLMClient가 설정, record_llm_call이 읽음)
+llm_call_wait_seconds: ContextVar[float] = ContextVar("llm_call_wait_seconds", default=0.0)
+
+
 # ============================================================================
 # Data Models
 # ============================================================================
@@ -24,6 +30,7 @@ class LLMUsage:
     output_tokens: int
     total_tokens: int
     cost: float = 0.0
+    wait_seconds: float = 0.0  # 속도 제한 대기 + 재시도 백오프 시간
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
@@ -39,8 +46,12 @@ class StepMetrics:
     total_output_tokens: int = 0
     total_tokens: int = 0
     total_cost: float = 0.0
+    total_wait_seconds: float = 0.0
+    llm_cache_hits: int = 0
+    llm_cache_misses: int = 0
     status: str = "running"  # running, completed, failed
     error_message: str = ""
+    details: Dict[str, Any] = field(default_factory=dict)  # Step별 부가 지표 (예: boilerplate 제거량)
 
 
 @dataclass
@@ -56,6 +67,9 @@ class ExperimentMetrics:
     total_output_tokens: int = 0
     total_tokens: int = 0
     total_cost: float = 0.0
+    total_wait_seconds: float = 0.0
+    llm_cache_hits: int = 0
+    llm_cache_misses: int = 0
     llm_provider: str = ""
     llm_model: str = ""
     status: str = "running"  # running, completed, failed
@@ -126,6 +140,7 @@ class MetricsTracker:
         self._start_time = time.time()
         self._current_step: Optional[StepMetrics] = None
         self._step_start_time: Optional[float] = None
+        self._lock = threading.Lock()
 
     @contextmanager
     def track_step(self, step_name: str):
@@ -166,32 +181,58 @@ class MetricsTracker:
             self._current_step.total_output_tokens += usage.output_tokens
             self._current_step.total_tokens += usage.total_tokens
             self._current_step.total_cost += usage.cost
+            self._current_step.total_wait_seconds += usage.wait_seconds
 
         self.experiment.steps.append(self._current_step)
         self._current_step = None
         self._step_start_time = None
 
-    def record_llm_call(self, model: str, input_tokens: int, output_tokens: int):
-        """LLM API 호출 기록"""
+    def record_llm_call(self, model: str, input_tokens: int, output_tokens: int,
+                        wait_seconds: Optional[float] = None):
+        """LLM API 호출 기록 (wait_seconds 미지정 시 현재 호출 컨텍스트의 대기 시간 사용)"""
         total_tokens = input_tokens + output_tokens
         cost = CostCalculator.calculate_cost(model, input_tokens, output_tokens)
+        if wait_seconds is None:
+            wait_seconds = llm_call_wait_seconds.get()
 
         usage = LLMUsage(
             model=model,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             total_tokens=total_tokens,
-            cost=cost
+            cost=cost,
+            wait_seconds=round(wait_seconds, 3)
         )
 
-        if self._current_step is not None:
-            self._current_step.llm_calls.append(usage)
-
-        # 전체 실험 메트릭 업데이트
-        self.experiment.total_input_tokens += input_tokens
-        self.experiment.total_output_tokens += output_tokens
-        self.experiment.total_tokens += total_tokens
-        self.experiment.total_cost += cost
+        # 병렬 LLM 호출(Step 2 map-reduce 등)에서 동시에 기록될 수 있으므로 잠금
+        with self._lock:
+            if self._current_step is not None:
+                self._current_step.llm_calls.append(usage)
+
+            # 전체 실험 메트릭 업데이트
+            self.experiment.total_input_tokens += input_tokens
+            self.experiment.total_output_tokens += output_tokens
+            self.experiment.total_tokens += total_tokens
+            self.experiment.total_cost += cost
+            self.experiment.total_wait_seconds += usage.wait_seconds
+
+    def record_llm_cache(self, hit: bool):
+        """LLM 응답 캐시 적중/미적중 기록"""
+        with self._lock:
+            if hit:
+                self.experiment.llm_cache_hits += 1
+                if self._current_step is not None:
+                    self._current_step.llm_cache_hits += 1
+            else:
+                self.experiment.llm_cache_misses += 1
+                if self._current_step is not None:
+                    self._current_step.llm_cache_misses += 1
+
+    def record_step_detail(self, key: str, value: Any):
+        """현재 Step에 부가 지표 기록 (Step 실행 중이 아니면 무시)"""
+        with self._lock:
+            if self._current_step is not None:
+                self._current_step.details[key] = value
 
     def finalize(self, success: bool = True):
         """실험 종료 및 최종 메트릭 계산"""
@@ -223,8 +264,12 @@ class MetricsTracker:
             "total_output_tokens": self.experiment.total_output_tokens,
             "total_tokens": self.experiment.total_tokens,
             "total_cost_usd": round(self.experiment.total_cost, 4),
+            "total_wait_seconds": round(self.experiment.total_wait_seconds, 1),
+            "llm_cache_hits": self.experiment.llm_cache_hits,
+            "llm_cache_misses": self.experiment.llm_cache_misses,
             "steps_completed": len([s for s in self.experiment.steps if s.status == "completed"]),
             "steps_failed": len([s for s in self.experiment.steps if s.status == "failed"]),
+            "step_details": {s.step_name: s.details for s in self.experiment.steps if s.details},
             "status": self.experiment.status
         }
 
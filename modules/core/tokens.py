@@ -0,0 +1,40 @@
+"""
+토큰 수 추정 유틸리티
+tiktoken이 설치되어 있으면 cl100k_base 인코딩으로 계산하고, 없으면 문자 종류 기반 근사값 사용
+"""
+
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 LLM 입력 토큰 수 추정.
+
+    tiktoken 미설치 시: ASCII는 4자당 1토큰, 그 외(한글 등)는 1자당 1토큰으로 근사합니다.
+
+    Args:
+        text: 대상 텍스트.
+
+    Returns:
+        int: 추정 토큰 수.
+    """
+    if not text:
+        return 0
+
+    if tiktoken is not None:
+        try:
+            return len(_get_encoding().encode(text))
+        except Exception:
+            pass
+
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
@@ -0,0 +1 @@
+"""MITRE ATT&CK technique data helpers."""
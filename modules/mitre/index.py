@@ -0,0 +1,290 @@
+"""
+MITRE ATT&CK technique 검색 인덱스
+전술별로 technique를 나누고 이름/설명 토큰을 미리 계산해 두어, 노드 하나를 매칭할 때
+같은 전술의 후보 technique만 점수 계산하도록 함 (Step 3 technique 자동 선택용)
+"""
+
+import difflib
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Step 3 노드 전술명(snake_case) → MITRE kill chain phase 이름
+TACTIC_MAPPING = {
+    'initial_access': 'initial-access',
+    'execution': 'execution',
+    'persistence': 'persistence',
+    'privilege_escalation': 'privilege-escalation',
+    'defense_evasion': 'defense-evasion',
+    'credential_access': 'credential-access',
+    'discovery': 'discovery',
+    'lateral_movement': 'lateral-movement',
+    'collection': 'collection',
+    'command_and_control': 'command-and-control',
+    'exfiltration': 'exfiltration',
+    'impact': 'impact',
+    'reconnaissance': 'reconnaissance'
+}
+
+# 토큰/부분 문자열 점수가 없을 때 사용하는 유사도 fallback의 최소값
+FUZZY_MIN_RATIO = 0.2
+
+# 부분 문자열 보너스 후보를 찾는 문자 n-gram 길이
+SUBSTRING_GRAM = 3
+
+
+def token_list(text: str) -> List[str]:
+    """텍스트를 소문자 영숫자 토큰 목록으로 변환 (중복 포함, 등장 순서)"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """텍스트를 소문자 영숫자 토큰 집합으로 변환"""
+    return frozenset(token_list(text))
+
+
+def char_grams(text: str, n: int = SUBSTRING_GRAM) -> FrozenSet[str]:
+    """문자 n-gram 집합 (text가 n보다 짧으면 빈 집합)"""
+    return frozenset(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+def to_mitre_tactic(tactic: str) -> str:
+    """노드 전술명을 MITRE kill chain phase 이름으로 변환"""
+    return TACTIC_MAPPING.get(tactic, tactic)
+
+
+def node_query(node: Dict) -> Tuple[str, str, str]:
+    """concrete flow 노드를 순위화 질의 (tactic, name, description)로 변환"""
+    return (node.get('tactic', '').lower().replace('-', '_'), node.get('name', ''), node.get('description', ''))
+
+
+@dataclass(frozen=True)
+class TechniqueRecord:
+    """인덱스에 저장되는 technique 정보 (Step 3에서 사용하는 필드만)"""
+    id: str
+    name: str
+    description: str
+    tactics: Tuple[str, ...]
+
+    @classmethod
+    def from_stix(cls, tech: Any) -> "TechniqueRecord":
+        """mitreattack-python technique 객체(또는 동일 구조의 dict)에서 생성"""
+        return cls(
+            id=tech.get('external_references', [{}])[0].get('external_id', 'T0000'),
+            name=tech.get('name', 'Unknown'),
+            description=tech.get('description', ''),
+            tactics=tuple(phase['phase_name'] for phase in tech.get('kill_chain_phases', []))
+        )
+
+
+@dataclass(frozen=True)
+class _IndexedTechnique:
+    ordinal: int  # 원본 technique 목록에서의 순서 (동점 시 순서 유지용)
+    record: TechniqueRecord
+    name_lower: str
+    desc_lower: str
+    name_tokens: FrozenSet[str]
+    desc_tokens: FrozenSet[str]
+
+
+class TechniqueIndex:
+    """전술별로 분할된 technique 인덱스.
+
+    - 각 technique의 이름/설명을 소문자화·토큰화해 한 번만 계산
+    - 전술별 역색인(token → technique 순번)으로 토큰이 겹치는 technique만 점수 계산
+    - 부분 문자열 보너스는 문자 3-gram 역색인으로 포함 가능성이 있는 technique만 확인
+    - 점수 규칙과 동점 처리 순서는 기존 Step 3 선형 탐색과 동일
+    """
+
+    def __init__(self, records: Iterable[TechniqueRecord]):
+        self.records: List[TechniqueRecord] = list(records)
+        self._partitions: Dict[str, List[_IndexedTechnique]] = defaultdict(list)
+        self._name_postings: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        self._desc_postings: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        # 부분 문자열 후보용: 이름/설명 3-gram → 순번, 이름 첫 3-gram → 순번, 3자 미만 이름의 순번
+        self._name_grams: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        self._desc_grams: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        self._name_heads: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        self._short_names: Dict[str, List[int]] = defaultdict(list)
+
+        for ordinal, record in enumerate(self.records):
+            name_lower = record.name.lower()
+            desc_lower = record.description.lower()
+            entry = _IndexedTechnique(
+                ordinal=ordinal,
+                record=record,
+                name_lower=name_lower,
+                desc_lower=desc_lower,
+                name_tokens=tokenize(name_lower),
+                desc_tokens=tokenize(desc_lower)
+            )
+            # 같은 전술이 kill_chain_phases에 중복돼도 한 번만 등록
+            for tactic in dict.fromkeys(record.tactics):
+                position = len(self._partitions[tactic])
+                self._partitions[tactic].append(entry)
+                for token in entry.name_tokens:
+                    self._name_postings[tactic][token].append(position)
+                for token in entry.desc_tokens:
+                    self._desc_postings[tactic][token].append(position)
+                for gram in char_grams(name_lower):
+                    self._name_grams[tactic][gram].append(position)
+                for gram in char_grams(desc_lower):
+                    self._desc_grams[tactic][gram].append(position)
+                if len(name_lower) >= SUBSTRING_GRAM:
+                    self._name_heads[tactic][name_lower[:SUBSTRING_GRAM]].append(position)
+                elif name_lower:
+                    self._short_names[tactic].append(position)
+
+    @classmethod
+    def from_mitre_data(cls, mitre_data) -> "TechniqueIndex":
+        """MitreAttackData.get_techniques() 결과로 인덱스 생성"""
+        return cls(TechniqueRecord.from_stix(tech) for tech in mitre_data.get_techniques())
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def tactics(self) -> List[str]:
+        return list(self._partitions)
+
+    def techniques_for(self, tactic: str) -> List[TechniqueRecord]:
+        """전술(MITRE phase 이름)에 속한 technique 목록 (원본 순서)"""
+        return [entry.record for entry in self._partitions.get(tactic, [])]
+
+    def find_candidates(self, tactic: str, name: str, description: str, top_k: int = 1) -> List[Dict]:
+        """노드(전술/이름/설명)에 맞는 technique 최대 top_k개 (없으면 유사도 fallback 1개 또는 빈 리스트).
+
+        Args:
+            tactic: 노드 전술명 (snake_case 또는 MITRE phase 이름).
+            name: 노드 이름.
+            description: 노드 설명.
+            top_k: 반환할 최대 개수.
+
+        Returns:
+            List[Dict]: [{'id', 'name', 'score'}, ...] (점수 내림차순, 동점은 원본 순서)
+        """
+        mitre_tactic = to_mitre_tactic(tactic)
+        partition = self._partitions.get(mitre_tactic)
+        if not partition:
+            return []
+
+        name_lower = name.lower()
+        desc_lower = description.lower()
+        scores = self._score_partition(mitre_tactic, partition, name_lower, desc_lower)
+
+        if scores:
+            # 점수 내림차순, 동점은 원본 순서 (기존 stable sort와 동일)
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+            return [self._result(partition[position].record, score) for position, score in ranked[:top_k]]
+
+        best = self._fuzzy_best(partition, name_lower, desc_lower)
+        return [best] if best else []
+
+    def rank_nodes(self, queries: Sequence[Tuple[str, str, str]], top_k: int = 1) -> List[List[Dict]]:
+        """여러 노드 순위화 (TfidfTechniqueRanker.rank_nodes와 같은 인터페이스)
+
+        Args:
+            queries: [(tactic, name, description), ...].
+            top_k: 노드별 최대 후보 수.
+
+        Returns:
+            List[List[Dict]]: 노드별 find_candidates 결과.
+        """
+        return [self.find_candidates(tactic, name, description, top_k=top_k)
+                for tactic, name, description in queries]
+
+    def _score_partition(self, tactic: str, partition: List[_IndexedTechnique],
+                         name_lower: str, desc_lower: str) -> Dict[int, int]:
+        """후보 technique별 점수 (1점 이상만, key = 파티션 내 위치)"""
+        name_postings = self._name_postings[tactic]
+        desc_postings = self._desc_postings[tactic]
+
+        # 이름 토큰 교집합 ×3 (역색인으로 겹치는 technique만 방문)
+        name_overlap: Dict[int, int] = defaultdict(int)
+        for token in tokenize(name_lower):
+            for position in name_postings.get(token, ()):
+                name_overlap[position] += 1
+
+        # 설명 토큰 교집합 (최대 5점)
+        desc_overlap: Dict[int, int] = defaultdict(int)
+        for token in tokenize(desc_lower):
+            for position in desc_postings.get(token, ()):
+                desc_overlap[position] += 1
+
+        scores: Dict[int, int] = {}
+        for position in set(name_overlap) | set(desc_overlap):
+            scores[position] = name_overlap.get(position, 0) * 3 + min(desc_overlap.get(position, 0), 5)
+
+        # 부분 문자열 보너스 (토큰이 겹치지 않아도 생길 수 있으므로 3-gram 역색인으로 후보를 따로 구함)
+        for position, bonus in self._substring_bonus(tactic, partition, name_lower, desc_lower).items():
+            scores[position] = scores.get(position, 0) + bonus
+
+        return {position: score for position, score in scores.items() if score >= 1}
+
+    def _substring_bonus(self, tactic: str, partition: List[_IndexedTechnique],
+                         name_lower: str, desc_lower: str) -> Dict[int, int]:
+        """부분 문자열 보너스 (0점 제외, key = 파티션 내 위치)
+
+        이름 ⊂ technique 이름 +2, technique 이름 ⊂ 이름 +1, 이름 ⊂ technique 설명 +1,
+        설명 ⊂ technique 설명 +1. 후보만 좁히고 최종 판정은 `in` 연산이므로 전체 탐색과 결과 동일.
+        """
+        name_grams = self._name_grams[tactic]
+        desc_grams = self._desc_grams[tactic]
+        bonus: Dict[int, int] = defaultdict(int)
+
+        for text, grams, weight, field in ((name_lower, name_grams, 2, 'name_lower'),
+                                           (name_lower, desc_grams, 1, 'desc_lower'),
+                                           (desc_lower, desc_grams, 1, 'desc_lower')):
+            if not text:
+                continue
+            for position in self._containing(text, grams, len(partition)):
+                if text in getattr(partition[position], field):
+                    bonus[position] += weight
+
+        # technique 이름이 질의 이름에 포함: 이름의 첫 3-gram이 질의에 있어야 함 (3자 미만 이름은 항상 확인)
+        if name_lower:
+            heads = self._name_heads[tactic]
+            candidates = set(self._short_names[tactic])
+            for gram in char_grams(name_lower):
+                candidates.update(heads.get(gram, ()))
+            for position in candidates:
+                if partition[position].name_lower in name_lower:
+                    bonus[position] += 1
+
+        return bonus
+
+    @staticmethod
+    def _containing(text: str, grams: Dict[str, List[int]], size: int) -> Iterable[int]:
+        """text를 포함할 수 있는 위치 (text의 3-gram 중 가장 드문 것의 역색인, 짧은 text는 전체)"""
+        text_grams = char_grams(text)
+        if not text_grams:
+            return range(size)
+        return min((grams.get(gram, ()) for gram in text_grams), key=len)
+
+    def _fuzzy_best(self, partition: List[_IndexedTechnique], name_lower: str, desc_lower: str) -> Optional[Dict]:
+        """토큰/부분 문자열 점수가 모두 0일 때: 이름/설명 문자열 유사도가 가장 높은 technique 1개"""
+        best = None
+        best_ratio = 0
+        for entry in partition:
+            # real_quick_ratio/quick_ratio는 ratio의 상한이므로 현재 최고값을 넘을 수 없으면 건너뜀 (결과 동일)
+            ratio = 0
+            for a, b in ((name_lower, entry.name_lower), (desc_lower, entry.desc_lower)):
+                matcher = difflib.SequenceMatcher(None, a, b)
+                if matcher.real_quick_ratio() <= max(best_ratio, ratio) or matcher.quick_ratio() <= max(best_ratio, ratio):
+                    continue
+                ratio = max(ratio, matcher.ratio())
+            if ratio > best_ratio:
+                best_ratio = ratio
+                best = self._result(entry.record, ratio)
+
+        if best and best_ratio >= FUZZY_MIN_RATIO:
+            return best
+        return None
+
+    @staticmethod
+    def _result(record: TechniqueRecord, score) -> Dict:
+        return {'id': record.id, 'name': record.name, 'score': score}
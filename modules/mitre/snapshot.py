@@ -0,0 +1,169 @@
+"""
+MITRE ATT&CK technique 스냅샷
+enterprise-attack.json STIX 번들에서 Step 3가 사용하는 필드(ID, 이름, 설명, kill chain phase)만 뽑아
+pickle로 저장하고, 번들 SHA-256이 바뀌면 다시 생성
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+# 모듈 패키지를 정상 인식하도록 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.core.artifact_store import ArtifactStore
+from modules.core.config import get_mitre_bundle_path, get_mitre_snapshot_path
+from modules.mitre.index import TechniqueRecord
+
+
+# 스냅샷 구조가 바뀌면 올려서 기존 스냅샷을 무효화
+SNAPSHOT_VERSION = 1
+
+
+def read_bundle_techniques(bundle_path: str) -> List[TechniqueRecord]:
+    """STIX 번들 JSON에서 technique(attack-pattern) 목록 추출.
+
+    MitreAttackData.get_techniques()와 같은 객체(하위 technique, revoked/deprecated 포함)를
+    번들 순서대로 반환하며, stix2 객체 그래프는 만들지 않습니다.
+
+    Args:
+        bundle_path: enterprise-attack.json 경로.
+
+    Returns:
+        List[TechniqueRecord]: technique 목록.
+    """
+    with open(bundle_path, 'r', encoding='utf-8') as f:
+        bundle = json.load(f)
+
+    return [
+        TechniqueRecord.from_stix(obj)
+        for obj in bundle.get('objects', [])
+        if obj.get('type') == 'attack-pattern'
+    ]
+
+
+def _bundle_stat(bundle_path: str) -> dict:
+    stat = os.stat(bundle_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _read_snapshot(snapshot_path: str) -> Optional[dict]:
+    try:
+        with open(snapshot_path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"  [WARNING] MITRE snapshot unreadable, rebuilding: {e}")
+        return None
+
+    if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def _write_snapshot(snapshot_path: str, snapshot: dict):
+    # 임시 파일 작성 후 원자적 교체 (동시에 실행된 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록)
+    directory = os.path.dirname(os.path.abspath(snapshot_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def build_snapshot(bundle_path: Optional[str] = None, snapshot_path: Optional[str] = None,
+                   bundle_hash: Optional[str] = None) -> List[TechniqueRecord]:
+    """번들을 읽어 스냅샷 생성.
+
+    Args:
+        bundle_path: STIX 번들 경로 (기본: MITRE_ATTACK_PATH).
+        snapshot_path: 스냅샷 경로 (기본: MITRE_SNAPSHOT_PATH).
+        bundle_hash: 이미 계산한 번들 SHA-256 (없으면 계산).
+
+    Returns:
+        List[TechniqueRecord]: 스냅샷에 저장된 technique 목록.
+    """
+    bundle_path = bundle_path or get_mitre_bundle_path()
+    snapshot_path = snapshot_path or get_mitre_snapshot_path()
+
+    records = read_bundle_techniques(bundle_path)
+    _write_snapshot(snapshot_path, {
+        'version': SNAPSHOT_VERSION,
+        'bundle_sha256': bundle_hash or ArtifactStore.hash_file(bundle_path),
+        'bundle_stat': _bundle_stat(bundle_path),
+        # dataclass 대신 튜플로 저장해 로드 시 객체 생성 비용을 줄임
+        'techniques': [(r.id, r.name, r.description, r.tactics) for r in records],
+    })
+    return records
+
+
+def load_techniques(bundle_path: Optional[str] = None, snapshot_path: Optional[str] = None,
+                    rebuild: bool = False) -> List[TechniqueRecord]:
+    """스냅샷에서 technique 목록 로드 (없거나 번들이 바뀌었으면 다시 생성).
+
+    번들 크기/수정 시각이 스냅샷 생성 시점과 같으면 해시 계산 없이 바로 사용하고,
+    다르면 SHA-256을 비교해 내용이 바뀐 경우에만 다시 생성합니다.
+
+    Args:
+        bundle_path: STIX 번들 경로 (기본: MITRE_ATTACK_PATH).
+        snapshot_path: 스냅샷 경로 (기본: MITRE_SNAPSHOT_PATH).
+        rebuild: True면 스냅샷을 무조건 다시 생성.
+
+    Returns:
+        List[TechniqueRecord]: technique 목록.
+    """
+    bundle_path = bundle_path or get_mitre_bundle_path()
+    snapshot_path = snapshot_path or get_mitre_snapshot_path()
+
+    snapshot = None if rebuild else _read_snapshot(snapshot_path)
+    if snapshot is not None:
+        stat = _bundle_stat(bundle_path)
+        if snapshot.get('bundle_stat') == stat:
+            return [TechniqueRecord(*fields) for fields in snapshot['techniques']]
+
+        bundle_hash = ArtifactStore.hash_file(bundle_path)
+        if snapshot.get('bundle_sha256') == bundle_hash:
+            # 내용은 같고 mtime만 바뀐 경우 (복사/체크아웃): stat만 갱신
+            snapshot['bundle_stat'] = stat
+            _write_snapshot(snapshot_path, snapshot)
+            return [TechniqueRecord(*fields) for fields in snapshot['techniques']]
+    else:
+        bundle_hash = None
+
+    print(f"  [INFO] Building MITRE ATT&CK snapshot: {snapshot_path}")
+    return build_snapshot(bundle_path, snapshot_path, bundle_hash=bundle_hash)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build MITRE ATT&CK technique snapshot for Step 3')
+    parser.add_argument('--bundle', default=None, help='STIX bundle path (default: MITRE_ATTACK_PATH)')
+    parser.add_argument('--output', default=None, help='Snapshot path (default: MITRE_SNAPSHOT_PATH)')
+    args = parser.parse_args()
+
+    bundle_path = args.bundle or get_mitre_bundle_path()
+    snapshot_path = args.output or get_mitre_snapshot_path()
+
+    start = time.perf_counter()
+    records = build_snapshot(bundle_path, snapshot_path)
+    elapsed = time.perf_counter() - start
+
+    size_kb = os.path.getsize(snapshot_path) / 1024
+    print(f"[OK] {len(records)} techniques → {snapshot_path} ({size_kb:.0f} KB, {elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+TF-IDF 기반 MITRE ATT&CK technique 순위화
+technique 이름/설명으로 TF-IDF 행렬을 한 번 만들어 두고, concrete flow의 모든 노드를
+한 번의 행렬 곱으로 점수 계산 (numpy 필요)
+"""
+
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from .index import TechniqueRecord, to_mitre_tactic, token_list
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# 이름 토큰 가중치 (키워드 순위화의 이름 교집합 ×3과 동일한 비중)
+NAME_WEIGHT = 3
+# 코사인 유사도가 이 값 이하인 technique는 후보에서 제외
+TFIDF_MIN_SCORE = 0.05
+
+
+def _term_counts(name: str, description: str, name_weight: int) -> Counter:
+    counts = Counter(token_list(description))
+    for token in token_list(name):
+        counts[token] += name_weight
+    return counts
+
+
+class TfidfTechniqueRanker:
+    """technique TF-IDF 행렬 기반 순위화.
+
+    - 문서 = technique 이름(가중치 NAME_WEIGHT) + 설명, 가중치 = (1 + log tf) × 평활 idf, 행 단위 L2 정규화
+    - 행렬은 용어별 (technique 순번, 가중치) 목록(CSC)으로 저장하고, 질의에 등장한 용어 열만 꺼내
+      (노드 수 × 용어 수) @ (용어 수 × technique 수) 한 번으로 모든 노드의 코사인 유사도를 계산
+    - 노드 전술에 속하지 않는 technique는 제외 (키워드 순위화와 동일)
+    """
+
+    def __init__(self, records: Iterable[TechniqueRecord], name_weight: int = NAME_WEIGHT,
+                 min_score: float = TFIDF_MIN_SCORE):
+        """
+        Args:
+            records: technique 목록.
+            name_weight: 이름 토큰 가중치.
+            min_score: 후보로 인정할 최소 코사인 유사도 (초과).
+
+        Raises:
+            ImportError: numpy가 설치되지 않은 경우.
+        """
+        if np is None:
+            raise ImportError("numpy is required for the TF-IDF technique ranker (pip install numpy)")
+
+        self.records: List[TechniqueRecord] = list(records)
+        self.name_weight = name_weight
+        self.min_score = min_score
+
+        doc_counts = [_term_counts(r.name, r.description, name_weight) for r in self.records]
+        doc_freq = Counter(token for counts in doc_counts for token in counts)
+
+        n_docs = len(self.records)
+        self.vocabulary: Dict[str, int] = {token: i for i, token in enumerate(sorted(doc_freq))}
+        self.idf = np.array(
+            [math.log((1 + n_docs) / (1 + doc_freq[token])) + 1 for token in sorted(doc_freq)],
+            dtype=np.float32
+        )
+
+        terms, docs, weights = [], [], []
+        for doc, counts in enumerate(doc_counts):
+            term_ids = np.fromiter((self.vocabulary[t] for t in counts), dtype=np.int64, count=len(counts))
+            tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+            row = self._weigh(term_ids, tf)
+            terms.append(term_ids)
+            docs.append(np.full(len(term_ids), doc, dtype=np.int64))
+            weights.append(row)
+
+        terms = np.concatenate(terms) if terms else np.zeros(0, dtype=np.int64)
+        docs = np.concatenate(docs) if docs else np.zeros(0, dtype=np.int64)
+        weights = np.concatenate(weights) if weights else np.zeros(0, dtype=np.float32)
+
+        # 용어 순으로 정렬한 CSC 구조: 용어 t의 항목은 [indptr[t], indptr[t + 1])
+        order = np.lexsort((docs, terms))
+        self._doc_ids = docs[order]
+        self._weights = weights[order]
+        self._indptr = np.concatenate(([0], np.cumsum(np.bincount(terms, minlength=len(self.vocabulary)))))
+
+        # 전술별 technique 마스크 (행 = 전술, 열 = technique)
+        tactics = sorted({tactic for r in self.records for tactic in r.tactics})
+        self._tactic_rows = {tactic: i for i, tactic in enumerate(tactics)}
+        self._tactic_mask = np.zeros((len(tactics) + 1, n_docs), dtype=bool)  # 마지막 행 = 알 수 없는 전술
+        for doc, record in enumerate(self.records):
+            for tactic in record.tactics:
+                self._tactic_mask[self._tactic_rows[tactic], doc] = True
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _weigh(self, term_ids, tf):
+        """sublinear tf × idf 후 L2 정규화"""
+        row = (1.0 + np.log(tf)) * self.idf[term_ids]
+        norm = float(np.linalg.norm(row))
+        return row / norm if norm else row
+
+    def rank_nodes(self, queries: Sequence[Tuple[str, str, str]], top_k: int = 1) -> List[List[Dict]]:
+        """여러 노드를 한 번에 순위화.
+
+        Args:
+            queries: [(tactic, name, description), ...] (tactic은 snake_case 또는 MITRE phase 이름).
+            top_k: 노드별 최대 후보 수.
+
+        Returns:
+            List[List[Dict]]: 노드별 [{'id', 'name', 'score'}, ...] (코사인 유사도 내림차순, 동점은 원본 순서)
+        """
+        if not queries:
+            return []
+
+        # 질의에 등장한 (사전에 있는) 용어만 열로 사용
+        query_terms = []
+        for _, name, description in queries:
+            counts = _term_counts(name, description, self.name_weight)
+            query_terms.append({self.vocabulary[t]: c for t, c in counts.items() if t in self.vocabulary})
+        columns = sorted({term for terms in query_terms for term in terms})
+        column_of = {term: j for j, term in enumerate(columns)}
+
+        query_matrix = np.zeros((len(queries), len(columns)), dtype=np.float32)
+        for i, terms in enumerate(query_terms):
+            if not terms:
+                continue
+            term_ids = np.fromiter(terms.keys(), dtype=np.int64, count=len(terms))
+            tf = np.fromiter(terms.values(), dtype=np.float32, count=len(terms))
+            query_matrix[i, [column_of[t] for t in terms]] = self._weigh(term_ids, tf)
+
+        # 선택된 용어 열만 technique × 용어 밀집 행렬로 펼침
+        technique_matrix = np.zeros((len(self.records), len(columns)), dtype=np.float32)
+        if columns:
+            columns_arr = np.asarray(columns, dtype=np.int64)
+            starts = self._indptr[columns_arr]
+            lengths = self._indptr[columns_arr + 1] - starts
+            positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+            technique_matrix[self._doc_ids[positions], np.repeat(np.arange(len(columns)), lengths)] = self._weights[positions]
+
+        scores = query_matrix @ technique_matrix.T  # (노드 수, technique 수)
+
+        unknown_row = len(self._tactic_rows)
+        tactic_rows = [self._tactic_rows.get(to_mitre_tactic(tactic), unknown_row) for tactic, _, _ in queries]
+        scores[~self._tactic_mask[tactic_rows]] = -1.0
+
+        results = []
+        for row in scores:
+            ranked = np.argsort(-row, kind='stable')[:top_k]
+            results.append([
+                {'id': self.records[doc].id, 'name': self.records[doc].name, 'score': round(float(row[doc]), 4)}
+                for doc in ranked if row[doc] > self.min_score
+            ])
+        return results
+
+    def find_candidates(self, tactic: str, name: str, description: str, top_k: int = 1) -> List[Dict]:
+        """노드 하나 순위화 (rank_nodes의 단일 질의 버전)"""
+        return self.rank_nodes([(tactic, name, description)], top_k=top_k)[0]
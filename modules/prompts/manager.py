@@ -1,24 +1,101 @@
 """프롬프트 템플릿 관리자."""
 import os
+import threading
 import yaml
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 from pathlib import Path
 
+# 템플릿 렌더링 방식: format = str.format ({변수}), jinja2 = Jinja2 ({{ 변수 }}, 조건/반복 가능)
+PROMPT_ENGINES = ("format", "jinja2")
+
+# 모든 PromptManager 인스턴스가 공유하는 템플릿 캐시
+# (절대 경로, 기본 엔진) → (mtime_ns, size, 엔진, YAML 데이터, 컴파일된 템플릿)
+_template_cache: Dict[Tuple[str, str], Tuple[int, int, str, Dict[str, Any], Any]] = {}
+_template_cache_lock = threading.Lock()
+
+
+def clear_template_cache():
+    """공유 템플릿 캐시 비우기."""
+    with _template_cache_lock:
+        _template_cache.clear()
+
+
+@lru_cache(maxsize=1)
+def _jinja_environment():
+    # jinja2는 jinja2 템플릿을 처음 컴파일할 때만 임포트 (기동 시간 절감)
+    import jinja2
+
+    # 변수 누락을 오류로 처리하고, 프롬프트 끝 줄바꿈을 그대로 유지 (HTML 이스케이프 없음)
+    return jinja2.Environment(
+        undefined=jinja2.StrictUndefined,
+        keep_trailing_newline=True,
+        autoescape=False
+    )
+
 
 class PromptManager:
     """프롬프트 템플릿 로드 및 렌더링.
-    
+
     YAML 템플릿 구조:
         description: 프롬프트 역할 설명 (한국어)
+        engine: jinja2  (선택, 생략 시 PromptManager의 기본 엔진)
         prompt: |
             실제 프롬프트 내용
+
+    템플릿은 처음 사용할 때 읽어 컴파일한 뒤 프로세스 전역 캐시에 보관하고,
+    파일의 수정 시각/크기가 바뀌면 다시 읽습니다.
     """
 
-    def __init__(self, template_dir: str = None):
+    def __init__(self, template_dir: str = None, engine: str = "format"):
+        """
+        Args:
+            template_dir: 템플릿 디렉토리 (기본: modules/prompts/templates).
+            engine: 템플릿에 engine 지정이 없을 때 사용할 렌더링 방식 ('format' 또는 'jinja2').
+        """
+        if engine not in PROMPT_ENGINES:
+            raise ValueError(f"지원하지 않는 프롬프트 엔진: {engine} (지원: {', '.join(PROMPT_ENGINES)})")
+
         if template_dir is None:
             self.template_dir = Path(__file__).parent / "templates"
         else:
             self.template_dir = Path(template_dir)
+        self.engine = engine
+
+    def _load(self, template_name: str) -> Tuple[str, Dict[str, Any], Any]:
+        """캐시에서 (엔진, YAML 데이터, 컴파일된 템플릿) 반환 (없거나 파일이 바뀌었으면 다시 로드)."""
+        template_path = self.template_dir / template_name
+        try:
+            stat = os.stat(template_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"프롬프트 템플릿을 찾을 수 없음: {template_path}")
+
+        key = (os.path.abspath(template_path), self.engine)
+        cached = _template_cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2], cached[3], cached[4]
+
+        with open(template_path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+
+        engine = data.get('engine') or self.engine
+        compiled = self._compile(engine, data.get('prompt', ''), template_path)
+
+        with _template_cache_lock:
+            _template_cache[key] = (stat.st_mtime_ns, stat.st_size, engine, data, compiled)
+        return engine, data, compiled
+
+    @staticmethod
+    def _compile(engine: str, prompt: str, template_path: Path) -> Any:
+        if engine == "format":
+            return prompt
+        if engine == "jinja2":
+            try:
+                environment = _jinja_environment()
+            except ImportError:
+                raise ImportError(f"jinja2가 필요한 템플릿입니다: {template_path} (pip install jinja2)")
+            return environment.from_string(prompt)
+        raise ValueError(f"지원하지 않는 프롬프트 엔진: {engine} ({template_path})")
 
     def load_template(self, template_name: str) -> Dict[str, str]:
         """YAML 템플릿 파일 로드.
@@ -27,19 +104,13 @@ class PromptManager:
             template_name: 템플릿 파일명 (.yaml 확장자).
 
         Returns:
-            Dict[str, str]: description과 prompt를 포함한 딕셔너리.
+            Dict[str, str]: description과 prompt를 포함한 딕셔너리 (캐시 공유 방지를 위해 복사본).
 
         Raises:
             FileNotFoundError: 파일이 없는 경우.
         """
-        template_path = self.template_dir / template_name
-        if not template_path.exists():
-            raise FileNotFoundError(f"프롬프트 템플릿을 찾을 수 없음: {template_path}")
-        
-        with open(template_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        
-        return data
+        _, data, _ = self._load(template_name)
+        return dict(data)
 
     def get_prompt(self, template_name: str) -> str:
         """템플릿에서 prompt 부분만 반환.
@@ -50,7 +121,7 @@ class PromptManager:
         Returns:
             str: 프롬프트 문자열.
         """
-        data = self.load_template(template_name)
+        _, data, _ = self._load(template_name)
         return data.get('prompt', '')
 
     def render(self, template_name: str, **kwargs) -> str:
@@ -63,9 +134,17 @@ class PromptManager:
         Returns:
             str: 완성된 프롬프트 문자열.
         """
-        prompt = self.get_prompt(template_name)
+        engine, _, compiled = self._load(template_name)
+        if engine == "jinja2":
+            from jinja2 import UndefinedError
+
+            try:
+                return compiled.render(**kwargs)
+            except UndefinedError as e:
+                raise ValueError(f"템플릿 변수 누락: {e}")
+
         try:
-            return prompt.format(**kwargs)
+            return compiled.format(**kwargs)
         except KeyError as e:
             raise ValueError(f"템플릿 변수 누락: {e}")
 
@@ -78,5 +157,5 @@ class PromptManager:
         Returns:
             str: 설명 문자열.
         """
-        data = self.load_template(template_name)
+        _, data, _ = self._load(template_name)
         return data.get('description', '')
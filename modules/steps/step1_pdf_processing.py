@@ -4,42 +4,381 @@ Extract text from PDF reports page by page
 """
 
 import os
+import re
+import json
+import math
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+import sys
 import yaml
-import pdfplumber
 from dotenv import load_dotenv
 
+# 모듈 패키지를 정상 인식하도록 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.core.artifact_store import ArtifactStore
+from modules.core.config import get_step1_cache_dir, get_step1_cache_max_mb
+from modules.core.metrics import get_metrics_tracker
+from modules.core.tokens import estimate_tokens
+
 load_dotenv()
 
+# 추출 결과 형식/로직이 바뀌면 올려서 기존 캐시를 무효화
+EXTRACTOR_VERSION = "1"
+
+
+# 워커 하나가 맡을 최소 페이지 수 (너무 잘게 나누면 프로세스 기동 비용이 더 큼)
+MIN_PAGES_PER_WORKER = 4
+
+DEFAULT_PDF_BACKEND = "pymupdf"
+
+# Boilerplate 제거: 페이지 위/아래 몇 줄을 머리말/꼬리말 후보로 볼지, 몇 % 이상의 페이지에 반복되면 제거할지
+BOILERPLATE_EDGE_LINES = 2
+BOILERPLATE_MIN_RATIO = 0.5
+BOILERPLATE_MIN_PAGES = 3
+# 스트리밍 모드에서 빈도 인덱스를 만들기 위해 먼저 모아두는 페이지 수
+BOILERPLATE_WARMUP_PAGES = 8
+
+
+# PDF 라이브러리는 실제로 추출할 때만 로드 (Step 2 등에서 이 모듈을 임포트할 때 기동 비용 방지)
+@lru_cache(maxsize=None)
+def _import_pdfplumber():
+    try:
+        import pdfplumber
+    except ImportError:
+        return None
+    return pdfplumber
+
+
+@lru_cache(maxsize=None)
+def _import_pymupdf():
+    try:
+        import pymupdf
+    except ImportError:
+        try:
+            # PyMuPDF < 1.24.3은 fitz 이름으로만 제공
+            import fitz as pymupdf
+        except ImportError:
+            return None
+    return pymupdf
+
+
+class PdfplumberBackend:
+    """pdfplumber-based extraction (slow, layout-aware fallback)"""
+
+    name = "pdfplumber"
+
+    @staticmethod
+    def is_available() -> bool:
+        return _import_pdfplumber() is not None
+
+    @staticmethod
+    def version() -> str:
+        return f"pdfplumber-{_import_pdfplumber().__version__}"
+
+    def page_count(self, pdf_path: str) -> int:
+        with _import_pdfplumber().open(pdf_path) as pdf:
+            return len(pdf.pages)
+
+    def extract_range(self, pdf_path: str, start: int, end: int) -> List[Dict[str, Any]]:
+        """Extract text from pages [start, end)"""
+        return list(self.iter_range(pdf_path, start, end))
+
+    def iter_range(self, pdf_path: str, start: int, end: int) -> Iterator[Dict[str, Any]]:
+        """Yield pages in [start, end) one at a time"""
+        with _import_pdfplumber().open(pdf_path) as pdf:
+            for page_num in range(start, end):
+                page = pdf.pages[page_num]
+                text = page.extract_text()
+                # 페이지 캐시를 비워 메모리 누적 방지
+                page.flush_cache()
+                if text:
+                    yield {
+                        "page_number": page_num + 1,
+                        "text": text
+                    }
+
+
+class PyMuPDFBackend:
+    """PyMuPDF (fitz) based extraction (fast path)"""
+
+    name = "pymupdf"
+
+    @staticmethod
+    def is_available() -> bool:
+        return _import_pymupdf() is not None
+
+    @staticmethod
+    def version() -> str:
+        return f"pymupdf-{_import_pymupdf().VersionBind}"
+
+    def page_count(self, pdf_path: str) -> int:
+        with _import_pymupdf().open(pdf_path) as doc:
+            return doc.page_count
+
+    def extract_range(self, pdf_path: str, start: int, end: int) -> List[Dict[str, Any]]:
+        """Extract text from pages [start, end)"""
+        return list(self.iter_range(pdf_path, start, end))
+
+    def iter_range(self, pdf_path: str, start: int, end: int) -> Iterator[Dict[str, Any]]:
+        """Yield pages in [start, end) one at a time"""
+        with _import_pymupdf().open(pdf_path) as doc:
+            for page_num in range(start, end):
+                # sort=True: 위→아래, 왼→오른쪽 읽기 순서 (pdfplumber와 유사)
+                text = self._normalize(doc[page_num].get_text("text", sort=True))
+                if text:
+                    yield {
+                        "page_number": page_num + 1,
+                        "text": text
+                    }
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Collapse layout padding so the output matches pdfplumber's line format"""
+        lines = (" ".join(line.split()) for line in text.splitlines())
+        return "\n".join(line for line in lines if line)
+
+
+PDF_BACKENDS = {
+    PyMuPDFBackend.name: PyMuPDFBackend,
+    PdfplumberBackend.name: PdfplumberBackend,
+}
+
+
+def get_pdf_backend(name: Optional[str] = None):
+    """Return the requested PDF backend, falling back to pdfplumber if unavailable"""
+    name = (name or DEFAULT_PDF_BACKEND).lower()
+    if name not in PDF_BACKENDS:
+        raise ValueError(f"Unsupported PDF backend: {name} (supported: {', '.join(PDF_BACKENDS)})")
+
+    backend = PDF_BACKENDS[name]
+    if backend.is_available():
+        return backend()
+
+    for fallback in PDF_BACKENDS.values():
+        if fallback.is_available():
+            print(f"  [WARNING] PDF backend '{name}' not installed, falling back to '{fallback.name}'")
+            return fallback()
+
+    raise ImportError("No PDF backend installed. Run: pip install PyMuPDF==1.24.0 pdfplumber==0.11.0")
+
+
+def _extract_page_range(backend_name: str, pdf_path: str, start: int, end: int) -> List[Dict[str, Any]]:
+    """Extract text from pages [start, end) with a dedicated document handle.
+
+    Module-level so that it can be pickled and run inside a worker process.
+    """
+    return PDF_BACKENDS[backend_name]().extract_range(pdf_path, start, end)
+
+
+def _fixed_page_ranges(total_pages: int, pages_per_range: int) -> List[Tuple[int, int]]:
+    """Split [0, total_pages) into consecutive ranges of pages_per_range pages"""
+    return [(start, min(start + pages_per_range, total_pages))
+            for start in range(0, total_pages, pages_per_range)]
+
+
+def _split_page_range(total_pages: int, workers: int) -> List[Tuple[int, int]]:
+    """Split [0, total_pages) into contiguous, roughly equal ranges (one per worker)"""
+    workers = max(1, min(workers, total_pages))
+    base, extra = divmod(total_pages, workers)
+
+    ranges = []
+    start = 0
+    for i in range(workers):
+        end = start + base + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+# ============================================================================
+# Boilerplate (header/footer) stripping
+# ============================================================================
+
+_DIGITS_RE = re.compile(r"\d+")
+_WHITESPACE_RE = re.compile(r"\s+")
+# "3", "- 3 -", "3 / 27", "Page 3 of 27" 같은 단독 쪽번호 줄
+_PAGE_NUMBER_RE = re.compile(r"^[\s\-–—|]*(page\s*)?\d{1,4}(\s*(/|of)\s*\d{1,4})?[\s\-–—|]*$", re.IGNORECASE)
+
+
+class BoilerplateStripper:
+    """Removes headers, footers, banners and page numbers repeated across pages.
+
+    Only the first/last edge_lines non-empty lines of each page are candidates, so
+    repeated phrases inside the body (table headers, mitigation bullets) are kept.
+    Candidates are fingerprinted (digits → '#', whitespace collapsed) so running
+    headers such as "Korea Internet & Security Agency 12" match across pages.
+    Lone numeric lines ("3", "- 3 -", "3 / 27") are removed only when the number is
+    the page's own number or follows the same printed-page offset on enough pages,
+    so a year or figure that happens to sit at a page edge is kept.
+    """
+
+    def __init__(self, edge_lines: int = BOILERPLATE_EDGE_LINES, min_ratio: float = BOILERPLATE_MIN_RATIO,
+                 min_pages: int = BOILERPLATE_MIN_PAGES):
+        self.edge_lines = edge_lines
+        self.min_ratio = min_ratio
+        self.min_pages = min_pages
+        self._index: Counter = Counter()  # (zone, fingerprint) -> 등장 페이지 수
+        self._page_offsets: Counter = Counter()  # (zone, 쪽번호 줄의 숫자 - page_number) -> 등장 페이지 수
+        self._observed_pages = 0
+        self.stats = {"pages": 0, "removed_lines": 0, "chars_before": 0, "chars_after": 0,
+                      "tokens_before": 0, "tokens_after": 0}
+
+    @staticmethod
+    def fingerprint(line: str) -> str:
+        return _WHITESPACE_RE.sub(" ", _DIGITS_RE.sub("#", line)).strip()
+
+    def _edge_candidates(self, lines: List[str]) -> Dict[int, Tuple[str, str]]:
+        """Line index -> (zone, fingerprint) for header/footer candidate lines"""
+        non_empty = [i for i, line in enumerate(lines) if line.strip()]
+        candidates = {}
+        for i in non_empty[:self.edge_lines]:
+            candidates[i] = ("header", self.fingerprint(lines[i]))
+        for i in non_empty[-self.edge_lines:]:
+            candidates.setdefault(i, ("footer", self.fingerprint(lines[i])))
+        return candidates
+
+    @staticmethod
+    def _page_offset(line: str, page_number: Optional[int]) -> Optional[int]:
+        """Printed number minus the page's own number for a lone page-number line (None otherwise)"""
+        if page_number is None or not _PAGE_NUMBER_RE.match(line):
+            return None
+        return int(_DIGITS_RE.search(line).group()) - page_number
+
+    def observe(self, page: Dict[str, Any]):
+        """Add a page's header/footer lines to the frequency index"""
+        lines = page.get("text", "").split("\n")
+        candidates = self._edge_candidates(lines)
+        self._index.update(set(candidates.values()))
+        offsets = {(zone, self._page_offset(lines[i].strip(), page.get("page_number")))
+                   for i, (zone, _) in candidates.items()}
+        self._page_offsets.update(key for key in offsets if key[1] is not None)
+        self._observed_pages += 1
+
+    def _is_boilerplate(self, zone: str, fingerprint: str, line: str, page_number: Optional[int] = None) -> bool:
+        threshold = max(self.min_pages, math.ceil(self.min_ratio * self._observed_pages))
+        offset = self._page_offset(line, page_number)
+        if offset is not None:
+            # 쪽번호 줄: 현재 페이지 번호이거나, 같은 번호 차이(표지 등으로 밀린 쪽번호)가 반복될 때만 제거
+            return offset == 0 or self._page_offsets[(zone, offset)] >= threshold
+        return self._index[(zone, fingerprint)] >= threshold
+
+    def strip_page(self, page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return a copy of page without boilerplate lines (None if nothing is left)"""
+        text = page.get("text", "")
+        lines = text.split("\n")
+        candidates = self._edge_candidates(lines)
+        page_number = page.get("page_number")
+        removed = {i for i, (zone, fp) in candidates.items()
+                   if self._is_boilerplate(zone, fp, lines[i].strip(), page_number)}
+        stripped = "\n".join(line for i, line in enumerate(lines) if i not in removed).strip()
+
+        self.stats["pages"] += 1
+        self.stats["removed_lines"] += len(removed)
+        self.stats["chars_before"] += len(text)
+        self.stats["chars_after"] += len(stripped)
+        self.stats["tokens_before"] += estimate_tokens(text)
+        self.stats["tokens_after"] += estimate_tokens(stripped)
+
+        if not stripped:
+            return None
+        return {**page, "text": stripped}
+
+    def strip(self, pages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Strip boilerplate using a frequency index built from all pages"""
+        for page in pages:
+            self.observe(page)
+        return [p for p in (self.strip_page(page) for page in pages) if p is not None]
+
+    def strip_stream(self, pages: Iterable[Dict[str, Any]], warmup: int = BOILERPLATE_WARMUP_PAGES) -> Iterator[Dict[str, Any]]:
+        """Strip boilerplate from a page stream.
+
+        The first `warmup` pages are buffered to seed the index; after that each page
+        is added to the running index and stripped as soon as it arrives.
+        """
+        buffered = []
+        for page in pages:
+            self.observe(page)
+            if buffered is not None and len(buffered) < warmup:
+                buffered.append(page)
+                continue
+            if buffered:
+                yield from (p for p in map(self.strip_page, buffered) if p is not None)
+            buffered = None
+            stripped = self.strip_page(page)
+            if stripped is not None:
+                yield stripped
+        if buffered:
+            yield from (p for p in map(self.strip_page, buffered) if p is not None)
+
+    def summary(self) -> Dict[str, int]:
+        """Characters/tokens saved so far"""
+        return {
+            "removed_lines": self.stats["removed_lines"],
+            "chars_before": self.stats["chars_before"],
+            "chars_after": self.stats["chars_after"],
+            "chars_saved": self.stats["chars_before"] - self.stats["chars_after"],
+            "tokens_saved": self.stats["tokens_before"] - self.stats["tokens_after"],
+        }
+
 
 class PDFProcessor:
     """Convert KISA TTPs PDF to structured data (page-based extraction)"""
 
+    def __init__(self, workers: int = 1, cache: Optional[ArtifactStore] = None, backend: Optional[str] = None,
+                 strip_boilerplate: bool = True):
+        """
+        Args:
+            workers: Number of extraction processes (1 = serial extraction)
+            cache: Content-addressed page cache (None = always extract)
+            backend: PDF backend name ('pymupdf' or 'pdfplumber', default: pymupdf)
+            strip_boilerplate: Remove repeated headers/footers/page numbers before saving
+        """
+        self.workers = max(1, workers or 1)
+        self.cache = cache
+        self.backend = get_pdf_backend(backend)
+        self.strip_boilerplate = strip_boilerplate
+
+    @staticmethod
+    def default_cache() -> ArtifactStore:
+        """Page cache configured from STEP1_CACHE_DIR / STEP1_CACHE_MAX_MB"""
+        return ArtifactStore(get_step1_cache_dir(), max_bytes=get_step1_cache_max_mb() * 1024 * 1024)
+
     def process_pdf(self, pdf_path: str, output_path: str = None, version_id: str = None) -> Dict[str, Any]:
         """Extract PDF text page by page and save"""
         print(f"[PDF] Processing PDF: {pdf_path}")
 
-        pages_data = self._extract_pages(pdf_path)
+        pdf_hash = ArtifactStore.hash_file(pdf_path)
+        pages_data = list(self.iter_pages(pdf_path, pdf_hash, streaming=False))
 
         pdf_stem = Path(pdf_path).stem
         # version_id가 없으면 타임스탬프로 생성하여 폴더/파일명에 포함
         version_id = version_id or datetime.now().strftime("%Y%m%d_%H%M%S")
 
+        boilerplate = None
+        if self.strip_boilerplate:
+            stripper = BoilerplateStripper()
+            pages_data = stripper.strip(pages_data)
+            boilerplate = self._report_boilerplate(stripper)
+
+        metadata = self._build_metadata(pdf_path, version_id, pdf_hash, len(pages_data))
+        if boilerplate is not None:
+            metadata["boilerplate"] = boilerplate
+
         result = {
-            "metadata": {
-                "source": pdf_path,
-                "pdf_name": pdf_stem,
-                "version_id": version_id,
-                "total_pages": len(pages_data)
-            },
+            "metadata": metadata,
             "pages": pages_data
         }
 
         if output_path is None:
-            # 지정 경로 없으면 data/processed/{pdf이름}/{version_id}/{pdf이름}_parsed.yml로 저장
-            output_path = Path("../../data/processed") / pdf_stem / version_id / f"{pdf_stem}_parsed.yml"
+            output_path = self._default_output_path(pdf_stem, version_id)
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -49,33 +388,320 @@ class PDFProcessor:
         print(f"  - Total pages: {len(pages_data)}")
         return result
 
-    def _extract_pages(self, pdf_path: str) -> List[Dict[str, Any]]:
-        """Extract text from each page separately"""
-        with pdfplumber.open(pdf_path) as pdf:
-            print(f"  [INFO] Processing {len(pdf.pages)} pages...")
+    def stream_pdf(self, pdf_path: str, output_path: str = None, version_id: str = None) -> Dict[str, Any]:
+        """Extract PDF text page by page, appending each page to a JSONL stream as it arrives.
 
-            pages_data = []
-            for page_num, page in enumerate(pdf.pages, 1):
-                text = page.extract_text()
-                if text:
-                    pages_data.append({
-                        "page_number": page_num,
-                        "text": text
-                    })
+        The stream is written next to output_path (step1.yml -> step1.jsonl) so that
+        Step 2 can start consuming pages before extraction finishes. Once the stream
+        is complete it is converted to the regular step1.yml without loading all pages.
+
+        Returns:
+            Dict: step1 metadata (including total_pages)
+        """
+        print(f"[PDF] Streaming PDF: {pdf_path}")
+
+        pdf_hash = ArtifactStore.hash_file(pdf_path)
+        pdf_stem = Path(pdf_path).stem
+        version_id = version_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        if output_path is None:
+            output_path = self._default_output_path(pdf_stem, version_id)
+        stream_path = step1_stream_path(output_path)
+
+        metadata = self._build_metadata(pdf_path, version_id, pdf_hash, total_pages=None)
+        pages = self.iter_pages(pdf_path, pdf_hash, streaming=True)
+        stripper = BoilerplateStripper() if self.strip_boilerplate else None
+        if stripper is not None:
+            pages = stripper.strip_stream(pages)
+
+        with Step1StreamWriter(stream_path, metadata) as writer:
+            for page in pages:
+                writer.write_page(page)
+            if stripper is not None:
+                writer.end_info["boilerplate"] = self._report_boilerplate(stripper)
+
+        metadata["total_pages"] = writer.total_pages
+        metadata.update(writer.end_info)
+        convert_stream_to_yaml(stream_path, output_path)
+
+        print(f"[SUCCESS] Saved to: {output_path} (stream: {stream_path})")
+        print(f"  - Total pages: {writer.total_pages}")
+        return metadata
+
+    def iter_pages(self, pdf_path: str, pdf_hash: Optional[str] = None, streaming: bool = True) -> Iterator[Dict[str, Any]]:
+        """Yield pages in page order, from the artifact cache on a hit (extracting and caching on a miss).
+
+        Args:
+            streaming: Use small page batches so the first pages are yielded early
+        """
+        if self.cache is None:
+            yield from self._iter_extracted_pages(pdf_path, streaming)
+            return
+
+        pdf_hash = pdf_hash or ArtifactStore.hash_file(pdf_path)
+        key = ArtifactStore.make_key(pdf_hash, self._extractor_version())
+        cached = self.cache.get(key)
+        if cached is not None:
+            print(f"  [CACHE] Reusing extracted pages (sha256: {pdf_hash[:12]}...)")
+            yield from cached["pages"]
+            return
+
+        # 캐시 저장용으로 텍스트만 모음 (페이지 파싱 객체는 보관하지 않음)
+        pages_data = []
+        for page in self._iter_extracted_pages(pdf_path, streaming):
+            pages_data.append(page)
+            yield page
+        self.cache.put(key, {"source_sha256": pdf_hash, "pages": pages_data})
+
+    @staticmethod
+    def _report_boilerplate(stripper: BoilerplateStripper) -> Dict[str, int]:
+        """Print boilerplate savings and record them in the experiment metrics"""
+        summary = stripper.summary()
+        print(f"  [INFO] Boilerplate removed: {summary['removed_lines']} lines, "
+              f"{summary['chars_saved']} chars (~{summary['tokens_saved']} tokens)")
+
+        tracker = get_metrics_tracker()
+        if tracker is not None:
+            tracker.record_step_detail("boilerplate", summary)
+        return summary
+
+    def _build_metadata(self, pdf_path: str, version_id: str, pdf_hash: str, total_pages: Optional[int]) -> Dict[str, Any]:
+        return {
+            "source": pdf_path,
+            "pdf_name": Path(pdf_path).stem,
+            "version_id": version_id,
+            "source_sha256": pdf_hash,
+            "pdf_backend": self.backend.name,
+            "total_pages": total_pages
+        }
+
+    @staticmethod
+    def _default_output_path(pdf_stem: str, version_id: str) -> Path:
+        # 지정 경로 없으면 data/processed/{pdf이름}/{version_id}/{pdf이름}_parsed.yml로 저장
+        return Path("../../data/processed") / pdf_stem / version_id / f"{pdf_stem}_parsed.yml"
+
+    def _extractor_version(self) -> str:
+        """Version string that identifies how cached pages were produced"""
+        return f"step1-v{EXTRACTOR_VERSION}/{self.backend.version()}"
+
+    def _iter_extracted_pages(self, pdf_path: str, streaming: bool) -> Iterator[Dict[str, Any]]:
+        """Extract pages with the configured backend, serially or across worker processes"""
+        total_pages = self.backend.page_count(pdf_path)
+        print(f"  [INFO] Processing {total_pages} pages ({self.backend.name})...")
+
+        workers = min(self.workers, total_pages // MIN_PAGES_PER_WORKER)
+        if workers <= 1:
+            yield from self.backend.iter_range(pdf_path, 0, total_pages)
+        else:
+            if streaming:
+                # 작은 배치로 나눠 앞쪽 페이지가 먼저 도착하도록 함
+                ranges = _fixed_page_ranges(total_pages, MIN_PAGES_PER_WORKER)
+            else:
+                ranges = _split_page_range(total_pages, workers)
+            yield from self._iter_pages_parallel(pdf_path, ranges, workers)
+
+        print(f"  [OK] Text extraction completed")
+
+    def _iter_pages_parallel(self, pdf_path: str, ranges: List[Tuple[int, int]], workers: int) -> Iterator[Dict[str, Any]]:
+        """Extract page ranges across worker processes and yield results in page order"""
+        print(f"  [INFO] Parallel extraction: {workers} workers, {len(ranges)} page ranges")
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_extract_page_range, self.backend.name, pdf_path, start, end) for start, end in ranges]
+            # 범위가 연속적이므로 제출 순서대로 이어 붙이면 페이지 순서가 유지됨
+            for future in futures:
+                yield from future.result()
+
+
+# ============================================================================
+# Step 1 stream (JSONL) writer / reader
+# ============================================================================
+
+def step1_stream_path(output_path) -> Path:
+    """JSONL stream path that accompanies a step1 YAML output (step1.yml -> step1.jsonl)"""
+    return Path(output_path).with_suffix(".jsonl")
+
+
+class Step1StreamWriter:
+    """Append-only JSONL writer for streamed Step 1 output.
+
+    Record layout (one JSON object per line, flushed immediately):
+        {"metadata": {...}}
+        {"page": {"page_number": 1, "text": "..."}}
+        ...
+        {"end": {"total_pages": N, ...}}  # or {"error": "..."} if extraction failed
+
+    Values known only after the last page (e.g. boilerplate stats) go into end_info
+    and are merged into the step1.yml metadata.
+    """
+
+    def __init__(self, stream_path, metadata: Dict[str, Any]):
+        self.stream_path = Path(stream_path)
+        self.metadata = metadata
+        self.total_pages = 0
+        self.end_info: Dict[str, Any] = {}
+        self._file = None
+
+    def __enter__(self):
+        os.makedirs(self.stream_path.parent, exist_ok=True)
+        self._file = open(self.stream_path, 'w', encoding='utf-8')
+        self._write({"metadata": self.metadata})
+        return self
+
+    def write_page(self, page: Dict[str, Any]):
+        self._write({"page": page})
+        self.total_pages += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc is None:
+                self._write({"end": {"total_pages": self.total_pages, **self.end_info}})
+            else:
+                self._write({"error": str(exc) or exc_type.__name__})
+        finally:
+            self._file.close()
+        return False
+
+    def _write(self, record: Dict[str, Any]):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+
+class Step1StreamReader:
+    """Reader for Step 1 JSONL streams, optionally following a stream that is still being written.
+
+    Usage:
+        reader = Step1StreamReader("step1.jsonl", follow=True, is_producer_alive=thread.is_alive)
+        metadata = reader.read_metadata()
+        for page in reader.pages():
+            ...
+    """
+
+    def __init__(self, stream_path, follow: bool = False,
+                 is_producer_alive: Optional[Callable[[], bool]] = None, poll_interval: float = 0.2):
+        """
+        Args:
+            stream_path: step1.jsonl path
+            follow: Wait for new records until the end marker is written
+            is_producer_alive: Returns False once the writer has stopped (avoids waiting forever)
+            poll_interval: Seconds between polls while following
+        """
+        self.stream_path = Path(stream_path)
+        self.follow = follow
+        self.is_producer_alive = is_producer_alive
+        self.poll_interval = poll_interval
+        self.metadata: Optional[Dict[str, Any]] = None
+        self.total_pages: Optional[int] = None
+        self.end_info: Dict[str, Any] = {}
+        self._records = self._iter_records()
+
+    def read_metadata(self) -> Dict[str, Any]:
+        """Return the metadata record (the first record of the stream)"""
+        if self.metadata is None:
+            record = next(self._records, None)
+            if not record or "metadata" not in record:
+                raise ValueError(f"Invalid Step 1 stream (missing metadata): {self.stream_path}")
+            self.metadata = record["metadata"]
+        return self.metadata
+
+    def pages(self) -> Iterator[Dict[str, Any]]:
+        """Yield page records until the end marker"""
+        self.read_metadata()
+        for record in self._records:
+            if "page" in record:
+                yield record["page"]
+            elif "end" in record:
+                self.end_info = dict(record["end"])
+                self.total_pages = self.end_info.pop("total_pages", None)
+                return
+            elif "error" in record:
+                raise RuntimeError(f"Step 1 extraction failed: {record['error']}")
+        raise RuntimeError(f"Step 1 stream ended without completion marker: {self.stream_path}")
+
+    def _producer_stopped(self) -> bool:
+        return self.is_producer_alive is not None and not self.is_producer_alive()
+
+    def _wait(self) -> bool:
+        """Sleep one poll interval; return False if waiting is pointless"""
+        if not self.follow:
+            return False
+        time.sleep(self.poll_interval)
+        return True
+
+    def _iter_records(self) -> Iterator[Dict[str, Any]]:
+        # 스트림 파일이 아직 생성되지 않았으면 대기
+        while not self.stream_path.exists():
+            if self._producer_stopped() or not self._wait():
+                return
+
+        with open(self.stream_path, 'r', encoding='utf-8') as f:
+            partial = ""
+            while True:
+                line = f.readline()
+                if line.endswith("\n"):
+                    record = json.loads(partial + line)
+                    partial = ""
+                    yield record
+                    if "end" in record or "error" in record:
+                        return
+                    continue
+
+                # 줄이 아직 완전히 쓰이지 않음 → 쓰기가 끝날 때까지 대기
+                partial += line
+                if self._producer_stopped():
+                    # 마지막으로 남은 내용을 한 번 더 확인 후 종료
+                    rest = f.readline()
+                    if not rest:
+                        return
+                    partial += rest
+                    continue
+                if not self._wait():
+                    return
+
+
+def convert_stream_to_yaml(stream_path, yaml_path):
+    """Write the regular step1 YAML from a completed JSONL stream, one page at a time.
+
+    The output is equivalent to yaml.dump({"metadata": ..., "pages": [...]}) but
+    never holds more than one page in memory.
+    """
+    # 1st pass: total_pages 확인 (end 레코드)
+    counter = Step1StreamReader(stream_path)
+    metadata = dict(counter.read_metadata())
+    for _ in counter.pages():
+        pass
+    metadata["total_pages"] = counter.total_pages
+    metadata.update(counter.end_info)
+
+    # 2nd pass: metadata → pages 순서로 기록
+    reader = Step1StreamReader(stream_path)
+    with open(yaml_path, 'w', encoding='utf-8') as f:
+        yaml.dump({"metadata": metadata}, f, allow_unicode=True, sort_keys=False)
+        if not metadata["total_pages"]:
+            f.write("pages: []\n")
+            return
+        f.write("pages:\n")
+        for page in reader.pages():
+            yaml.dump([page], f, allow_unicode=True, sort_keys=False)
 
-            print(f"  [OK] Text extraction completed")
-            return pages_data
 
 def main():
     """Test runner"""
     import sys
     if len(sys.argv) < 2:
-        print("Usage: python step1_pdf_processing.py <pdf_path> [version_id]")
+        print("Usage: python step1_pdf_processing.py <pdf_path> [version_id] [workers] [backend] [--keep-boilerplate]")
         sys.exit(1)
 
-    pdf_path = sys.argv[1]
-    version_id = sys.argv[2] if len(sys.argv) >= 3 else None
-    PDFProcessor().process_pdf(pdf_path, version_id=version_id)
+    keep_boilerplate = "--keep-boilerplate" in sys.argv
+    argv = [arg for arg in sys.argv if arg != "--keep-boilerplate"]
+
+    pdf_path = argv[1]
+    version_id = argv[2] if len(argv) >= 3 else None
+    workers = int(argv[3]) if len(argv) >= 4 else 1
+    backend = argv[4] if len(argv) >= 5 else None
+    processor = PDFProcessor(workers=workers, cache=PDFProcessor.default_cache(), backend=backend,
+                             strip_boilerplate=not keep_boilerplate)
+    processor.process_pdf(pdf_path, version_id=version_id)
 
 
 if __name__ == "__main__":
@@ -4,9 +4,12 @@ Extract environment-independent abstract attack flow from KISA report
 Uses 2-stage extraction: overview → detailed flow
 """
 
+import asyncio
 import yaml
 import os
-from typing import Dict, List
+import re
+import difflib
+from typing import Dict, Iterable, Iterator, List, Optional
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -17,28 +20,129 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from modules.ai.factory import get_llm_client
+from modules.core.chunking import SemanticChunker, get_chunk_token_budget
+from modules.core.config import get_llm_provider
 from modules.prompts.manager import PromptManager
+from modules.steps.step1_pdf_processing import Step1StreamReader
+
+OVERVIEW_CHARS = 3000  # 개요 추출에 사용하는 앞부분 길이 (characters)
+
+# 청크 분석 방식: sequential = 이전 청크의 목표를 프롬프트에 포함하여 순차 분석,
+# map-reduce = 모든 청크를 동시에 분석한 뒤 중복 목표를 병합
+STEP2_MODES = ("sequential", "map-reduce")
+DEFAULT_LLM_WORKERS = 4
+# 같은 전술 내에서 목표 문장 유사도가 이 값 이상이면 중복으로 병합
+GOAL_SIMILARITY_THRESHOLD = 0.85
+
+# 청크 분할 방식: fixed = 8000자 고정 분할, semantic = 페이지/문단 경계 + 토큰 예산 기반
+STEP2_CHUNKERS = ("fixed", "semantic")
+
+
+class _PageTextStream:
+    """Lazily joins page texts (separated by a blank line) from a page iterator.
+
+    Produces the same overview head and fixed-size chunks as slicing the fully
+    joined text, but only pulls pages from the iterator as they are needed.
+    """
+
+    def __init__(self, pages: Iterable[Dict]):
+        self._pages = iter(pages)
+        self._buffer = ""
+        self.page_count = 0
+        self.text_length = 0
+        self._exhausted = False
+        self._pulled: Optional[List[Dict]] = []  # head()로 미리 읽은 페이지 (replay_pages용)
+
+    def _fill(self, size: int) -> bool:
+        """Pull pages until the buffer holds at least size characters; False when no more pages"""
+        while len(self._buffer) < size and not self._exhausted:
+            page = next(self._pages, None)
+            if page is None:
+                self._exhausted = True
+                break
+            if self._pulled is not None:
+                self._pulled.append(page)
+            text = page.get('text', '')
+            if self.page_count:
+                text = "\n\n" + text
+            self.page_count += 1
+            self.text_length += len(text)
+            self._buffer += text
+        return len(self._buffer) >= size
+
+    def head(self, size: int) -> str:
+        """First size characters of the joined text (not consumed)"""
+        self._fill(size)
+        return self._buffer[:size]
+
+    def replay_pages(self) -> Iterator[Dict]:
+        """Yield every page: those already pulled by head(), then the rest of the stream"""
+        pulled, self._pulled = self._pulled or [], None
+        yield from pulled
+        for page in self._pages:
+            self.page_count += 1
+            self.text_length += len(page.get('text', '')) + (2 if self.page_count > 1 else 0)
+            yield page
+
+    def chunks(self, size: int) -> Iterator[str]:
+        """Yield consecutive size-character chunks of the joined text"""
+        self._pulled = None
+        while True:
+            self._fill(size)
+            if not self._buffer:
+                return
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+            yield chunk
 
 
 class AbstractFlowExtractor:
-    def __init__(self):
+    def __init__(self, mode: str = "sequential", max_workers: int = DEFAULT_LLM_WORKERS,
+                 chunker: str = "fixed", chunk_tokens: Optional[int] = None, chunk_overlap: int = 0):
+        """
+        Args:
+            mode: Chunk analysis mode ('sequential' or 'map-reduce')
+            max_workers: Concurrent LLM calls in map-reduce mode
+            chunker: Chunking strategy ('fixed' 8000 characters or 'semantic')
+            chunk_tokens: Token budget per chunk for the semantic chunker (default: per provider)
+            chunk_overlap: Tokens repeated from the previous chunk (semantic chunker only)
+        """
+        if mode not in STEP2_MODES:
+            raise ValueError(f"Unknown Step 2 mode: {mode} (choose from {', '.join(STEP2_MODES)})")
+        if chunker not in STEP2_CHUNKERS:
+            raise ValueError(f"Unknown Step 2 chunker: {chunker} (choose from {', '.join(STEP2_CHUNKERS)})")
         self.llm = get_llm_client()
         self.prompt_manager = PromptManager()
         self.chunk_size = 8000  # 청크 크기 (characters)
-
-    def extract_abstract_flow(self, input_file: str, output_file: str = None, version_id: str = None):
+        self.mode = mode
+        self.max_workers = max(1, max_workers or 1)
+        self.chunker = chunker
+        self.chunk_tokens = chunk_tokens or get_chunk_token_budget(get_llm_provider())
+        self.chunk_overlap = chunk_overlap
+
+    def extract_abstract_flow(self, input_file: str, output_file: str = None, version_id: str = None,
+                              stream_reader: Optional[Step1StreamReader] = None):
         """Extract abstract attack flow from KISA report (PDF parsed data)
 
         2-stage process:
         1. Extract overview to understand attack theme
         2. Process detailed content in chunks to extract complete attack flow
+
+        input_file may be the step1 YAML or a step1 JSONL stream. With a JSONL
+        stream (or stream_reader following a running Step 1), chunks are analyzed
+        as soon as enough pages have arrived.
         """
         print("\n[Step 2] Abstract Attack Flow Extraction started...")
 
-        with open(input_file, 'r', encoding='utf-8') as f:
-            step1_data = yaml.safe_load(f)
+        if stream_reader is None and str(input_file).endswith(".jsonl"):
+            stream_reader = Step1StreamReader(input_file)
 
-        metadata = step1_data.get('metadata', {})
+        if stream_reader is not None:
+            metadata = stream_reader.read_metadata()
+            step1_data = None
+        else:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                step1_data = yaml.safe_load(f)
+            metadata = step1_data.get('metadata', {})
         # pdf_name, version_id 우선 추출 (경로 → 메타데이터 → 기본값)
         pdf_name = metadata.get('pdf_name')
         if not pdf_name:
@@ -54,24 +158,50 @@ class AbstractFlowExtractor:
         )
         version_id = derived_version or datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Extract pages text from step1
-        pages = step1_data.get('pages', [])
-
-        if not pages:
-            raise ValueError("No pages found in Step 1 output")
+        if step1_data is None:
+            # Streaming: 페이지가 도착하는 대로 개요/청크 분석 진행
+            text_stream = _PageTextStream(stream_reader.pages())
+            overview_source = text_stream.head(OVERVIEW_CHARS)
+            if not text_stream.page_count:
+                raise ValueError("No pages found in Step 1 output")
+            print("  Reading pages from Step 1 stream...")
 
-        # Combine all page texts
-        full_text = "\n\n".join([page.get('text', '') for page in pages])
+            overview = self._extract_overview(overview_source)
+            print(f"  Overview extracted: {len(overview)} characters")
 
-        print(f"  Total pages: {len(pages)}")
-        print(f"  Total text length: {len(full_text)} characters")
-
-        # Stage 1: Extract overview section for context
-        overview = self._extract_overview(full_text)
-        print(f"  Overview extracted: {len(overview)} characters")
+            if self.chunker == "semantic":
+                chunks = self._semantic_chunker().chunks(text_stream.replay_pages())
+            else:
+                chunks = text_stream.chunks(self.chunk_size)
+            abstract_flow = self._extract_flow_chunked(overview, chunks)
+            print(f"  Total pages: {text_stream.page_count}")
+            print(f"  Total text length: {text_stream.text_length} characters")
+        else:
+            # Extract pages text from step1
+            pages = step1_data.get('pages', [])
+
+            if not pages:
+                raise ValueError("No pages found in Step 1 output")
+
+            # Combine all page texts
+            full_text = "\n\n".join([page.get('text', '') for page in pages])
+
+            print(f"  Total pages: {len(pages)}")
+            print(f"  Total text length: {len(full_text)} characters")
+
+            # Stage 1: Extract overview section for context
+            overview = self._extract_overview(full_text)
+            print(f"  Overview extracted: {len(overview)} characters")
+
+            # Split full text into chunks
+            if self.chunker == "semantic":
+                chunks = list(self._semantic_chunker().chunks(pages))
+            else:
+                chunks = [full_text[i:i+self.chunk_size]
+                          for i in range(0, len(full_text), self.chunk_size)]
 
-        # Stage 2: Extract abstract attack flow from full content (chunked)
-        abstract_flow = self._extract_flow_chunked(overview, full_text)
+            # Stage 2: Extract abstract attack flow from full content (chunked)
+            abstract_flow = self._extract_flow_chunked(overview, chunks)
 
         # Save results
         output_data = {
@@ -98,12 +228,16 @@ class AbstractFlowExtractor:
         print(f"  - Version: {version_id}")
         self._print_summary(abstract_flow)
 
+    def _semantic_chunker(self) -> SemanticChunker:
+        print(f"  Chunker: semantic ({self.chunk_tokens} tokens/chunk, overlap {self.chunk_overlap} tokens)")
+        return SemanticChunker(self.chunk_tokens, overlap_tokens=self.chunk_overlap)
+
     def _extract_overview(self, full_text: str) -> str:
         """Stage 1: Extract overview section from report"""
         print("  [Stage 1: Extracting overview...]")
 
         # Take first 3000 characters for overview
-        overview_chunk = full_text[:3000]
+        overview_chunk = full_text[:OVERVIEW_CHARS]
 
         prompt = self.prompt_manager.render(
             "step2_overview.yaml",
@@ -114,24 +248,29 @@ class AbstractFlowExtractor:
         overview = self.llm.generate_text(prompt=prompt, max_tokens=1500)
         return overview.strip()
 
-    def _extract_flow_chunked(self, overview: str, full_text: str) -> Dict:
-        """Stage 2: Extract abstract attack flow by processing content iteratively in chunks"""
+    def _extract_flow_chunked(self, overview: str, chunks: Iterable[str]) -> Dict:
+        """Stage 2: Extract abstract attack flow by processing content iteratively in chunks
+
+        chunks may be a list or a lazy iterator (streaming input, total unknown → "?")
+        """
         print("  [Stage 2: Extracting abstract attack flow...]")
 
-        # Split full text into chunks
-        chunks = [full_text[i:i+self.chunk_size]
-                 for i in range(0, len(full_text), self.chunk_size)]
+        total_chunks = len(chunks) if isinstance(chunks, list) else "?"
+        print(f"  Total chunks: {total_chunks}")
 
-        print(f"  Total chunks: {len(chunks)}")
+        if self.mode == "map-reduce":
+            collected_goals = self._map_chunks(overview, chunks, total_chunks)
+            print(f"  [Synthesizing {len(collected_goals)} goals into abstract flow...]")
+            return self._synthesize_flow(overview, collected_goals)
 
         # Process chunks iteratively
         collected_goals = []
 
         for i, chunk in enumerate(chunks):
-            print(f"    Processing chunk {i+1}/{len(chunks)}...")
+            print(f"    Processing chunk {i+1}/{total_chunks}...")
 
             # Build prompt using template
-            prompt = self._build_chunk_prompt(overview, chunk, i+1, len(chunks), collected_goals)
+            prompt = self._build_chunk_prompt(overview, chunk, i+1, total_chunks, collected_goals)
 
             # Generate using LLM
             response_text = self.llm.generate_text(prompt=prompt, max_tokens=3000)
@@ -145,7 +284,7 @@ class AbstractFlowExtractor:
 
             # If report indicates completion, stop early
             if result.get('report_complete'):
-                print(f"  [OK] Report analysis complete at chunk {i+1}/{len(chunks)}")
+                print(f"  [OK] Report analysis complete at chunk {i+1}/{total_chunks}")
                 break
 
         # Final synthesis: combine all goals into structured flow
@@ -154,8 +293,119 @@ class AbstractFlowExtractor:
 
         return abstract_flow
 
+    def _map_chunks(self, overview: str, chunks: Iterable[str], total_chunks) -> List[Dict]:
+        """Map-reduce: analyze all chunks concurrently, then merge duplicate goals
+
+        Chunks are analyzed without "Previously Identified Goals" context, so the
+        same goal may be reported by several chunks; _merge_goals removes those.
+        Results are consumed in chunk order, so the first chunk reporting
+        report_complete ends the analysis exactly as in sequential mode.
+        """
+        print(f"  [Map-reduce: {self.max_workers} concurrent LLM calls]")
+
+        goal_lists = asyncio.run(self._amap_chunks(overview, chunks, total_chunks))
+
+        found = sum(len(goals) for goals in goal_lists)
+        collected_goals = self._merge_goals(goal_lists)
+        print(f"  [Reduce] {found} goals from {len(goal_lists)} chunks -> {len(collected_goals)} unique goals")
+        return collected_goals
+
+    async def _amap_chunks(self, overview: str, chunks: Iterable[str], total_chunks) -> List[List[Dict]]:
+        """Map step on one event loop: at most max_workers agenerate_text calls in flight
+
+        Returns:
+            List[List[Dict]]: new_goals of each analyzed chunk, in chunk order.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def submit_chunks():
+            iterator = iter(chunks)
+            chunk_num = 0
+            while True:
+                # 스트리밍 입력은 다음 청크가 도착할 때까지 블로킹되므로 스레드에서 읽음
+                chunk = await asyncio.to_thread(next, iterator, None)
+                if chunk is None:
+                    break
+                chunk_num += 1
+                task = asyncio.create_task(self._aanalyze_chunk(semaphore, overview, chunk, chunk_num, total_chunks))
+                await queue.put(task)
+            await queue.put(None)
+
+        producer = asyncio.create_task(submit_chunks())
+        goal_lists = []
+        try:
+            while True:
+                task = await queue.get()
+                if task is None:
+                    break
+                result = await task
+                goal_lists.append(result.get('new_goals') or [])
+
+                if result.get('report_complete'):
+                    print(f"  [OK] Report analysis complete at chunk {len(goal_lists)}/{total_chunks}")
+                    break
+        finally:
+            # report_complete 이후 또는 오류 시 나머지 청크 분석은 취소
+            producer.cancel()
+            pending = [producer]
+            while not queue.empty():
+                task = queue.get_nowait()
+                if task is not None:
+                    task.cancel()
+                    pending.append(task)
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return goal_lists
+
+    async def _aanalyze_chunk(self, semaphore: asyncio.Semaphore, overview: str, chunk: str,
+                              chunk_num: int, total_chunks) -> dict:
+        """Map step: analyze one chunk on its own (no previously identified goals)"""
+        prompt = self._build_chunk_prompt(overview, chunk, chunk_num, total_chunks, [])
+        async with semaphore:
+            response_text = await self.llm.agenerate_text(prompt=prompt, max_tokens=3000)
+        result = self._parse_chunk_response(response_text)
+        print(f"    Chunk {chunk_num}/{total_chunks}: {len(result.get('new_goals') or [])} goals")
+        return result
+
+    @staticmethod
+    def _normalize_goal_text(text) -> str:
+        return " ".join(re.sub(r"[^\w\s]", " ", str(text or "").lower()).split())
+
+    def _merge_goals(self, goal_lists: List[List[Dict]]) -> List[Dict]:
+        """Reduce step: merge goals in chunk order, dropping near-duplicates within the same tactic
+
+        The first occurrence is kept (discovery order is preserved); if a later
+        duplicate has a longer description, that description is kept instead.
+        """
+        merged: List[Dict] = []
+        keys: List[tuple] = []
+
+        for goals in goal_lists:
+            for goal in goals:
+                if not isinstance(goal, dict):
+                    continue
+                tactic = self._normalize_goal_text(goal.get('tactic')).replace(" ", "-")
+                text = self._normalize_goal_text(goal.get('goal'))
+
+                duplicate = None
+                for index, (known_tactic, known_text) in enumerate(keys):
+                    if known_tactic != tactic:
+                        continue
+                    if known_text == text or difflib.SequenceMatcher(None, known_text, text).ratio() >= GOAL_SIMILARITY_THRESHOLD:
+                        duplicate = index
+                        break
+
+                if duplicate is None:
+                    merged.append(dict(goal))
+                    keys.append((tactic, text))
+                elif len(str(goal.get('description') or '')) > len(str(merged[duplicate].get('description') or '')):
+                    merged[duplicate]['description'] = goal['description']
+
+        return merged
+
     def _build_chunk_prompt(self, overview: str, chunk: str, chunk_num: int,
-                           total_chunks: int, collected_goals: list) -> str:
+                           total_chunks, collected_goals: list) -> str:
         """Build prompt for chunk-by-chunk extraction"""
 
         previous_context = ""
@@ -254,7 +504,7 @@ class AbstractFlowExtractor:
 def main():
     """Test runner"""
     if len(sys.argv) < 2:
-        print("Usage: python step2_abstract_flow.py <input_yml> [output_yml] [version_id]")
+        print("Usage: python step2_abstract_flow.py <input_yml|input_jsonl> [output_yml] [version_id]")
         sys.exit(1)
 
     input_file = sys.argv[1]
@@ -6,7 +6,7 @@ Combine abstract flow + environment description (MD) → concrete attack flow (K
 import yaml
 import os
 import re
-import difflib
+import time
 from typing import Dict, List
 import sys
 from pathlib import Path
@@ -19,31 +19,48 @@ if str(PROJECT_ROOT) not in sys.path:
     
 from modules.ai.factory import get_llm_client
 from modules.prompts.manager import PromptManager
+from modules.core.config import get_mitre_bundle_path
+from modules.mitre.index import TechniqueIndex, node_query
+from modules.mitre.snapshot import load_techniques
 
-try:
-    from mitreattack.stix20 import MitreAttackData
-except ImportError:
-    print("[WARNING] mitreattack-python not installed. Run: pip install mitreattack-python==3.0.6")
-    MitreAttackData = None
+# Technique 자동 선택 방식: keyword = 토큰 교집합/부분 문자열 점수 + 유사도 fallback,
+# tfidf = TF-IDF 코사인 유사도 (flow의 모든 노드를 행렬 곱 한 번으로 순위화, numpy 필요)
+TECHNIQUE_RANKERS = ("keyword", "tfidf")
 
 
 class ConcreteFlowGenerator:
-    def __init__(self):
+    def __init__(self, technique_ranker: str = "keyword"):
+        """
+        Args:
+            technique_ranker: Technique ranking method ('keyword' or 'tfidf')
+        """
+        if technique_ranker not in TECHNIQUE_RANKERS:
+            raise ValueError(f"Unknown technique ranker: {technique_ranker} (choose from {', '.join(TECHNIQUE_RANKERS)})")
         self.llm = get_llm_client()
         self.prompt_manager = PromptManager()
-        self.mitre_data = None
+        self.technique_ranker = technique_ranker
+        self.technique_index = None
 
-        # Load MITRE ATT&CK data if available
-        if MitreAttackData:
-            try:
-                # 프로젝트 루트 기준 절대 경로로 지정해 상대 경로 오류 방지
-                mitre_path = PROJECT_ROOT / "data" / "mitre" / "enterprise-attack.json"
-                print(f"  [Loading MITRE ATT&CK data...] ({mitre_path})")
-                self.mitre_data = MitreAttackData(str(mitre_path))
-                print("  [OK] MITRE ATT&CK data loaded")
-            except Exception as e:
-                print(f"  [WARNING] Failed to load MITRE ATT&CK data: {e}")
-                self.mitre_data = None
+        # Load MITRE ATT&CK techniques (STIX 번들 대신 필요한 필드만 담은 스냅샷 사용)
+        mitre_path = get_mitre_bundle_path()
+        try:
+            print(f"  [Loading MITRE ATT&CK data...] ({mitre_path})")
+            records = load_techniques(mitre_path)
+            if technique_ranker == "tfidf":
+                try:
+                    # numpy는 tfidf 순위화를 선택한 경우에만 로드
+                    from modules.mitre.tfidf import TfidfTechniqueRanker
+                    self.technique_index = TfidfTechniqueRanker(records)
+                except ImportError as e:
+                    print(f"  [WARNING] {e} - falling back to keyword ranker")
+                    self.technique_ranker = "keyword"
+            if self.technique_index is None:
+                self.technique_index = TechniqueIndex(records)
+            print(f"  [OK] MITRE ATT&CK data loaded ({len(self.technique_index)} techniques indexed, "
+                  f"ranker: {self.technique_ranker})")
+        except Exception as e:
+            print(f"  [WARNING] Failed to load MITRE ATT&CK data: {e}")
+            self.technique_index = None
 
     def generate_concrete_flow(self, abstract_flow_file: str,
                               environment_md_file: str,
@@ -218,8 +235,8 @@ class ConcreteFlowGenerator:
 
 
     def _add_technique_ids(self, flow: Dict) -> Dict:
-        """Add MITRE ATT&CK Technique ID (best match) to nodes using mitreattack-python"""
-        if not self.mitre_data:
+        """Add MITRE ATT&CK Technique ID (best match) to nodes using the technique index"""
+        if not self.technique_index:
             print("  [WARNING] MITRE ATT&CK data not available, skipping technique ID assignment")
             return flow
 
@@ -228,15 +245,14 @@ class ConcreteFlowGenerator:
         nodes = flow.get('nodes', [])
         techniques_added = 0
         no_technique = 0
+        start_time = time.perf_counter()
 
-        for node in nodes:
-            tactic = node.get('tactic', '').lower().replace('-', '_')
-            name = node.get('name', '')
-            description = node.get('description', '')
+        queries = [node_query(node) for node in nodes]
 
-            # Get best matching technique (only 1)
-            candidates = self._find_technique_candidates(tactic, name, description, top_k=1)
+        # Rank all nodes at once (best match only)
+        ranked = self.technique_index.rank_nodes(queries, top_k=1)
 
+        for node, candidates in zip(nodes, ranked):
             if candidates:
                 # Assign the best technique directly
                 best_technique = candidates[0]
@@ -253,113 +269,17 @@ class ConcreteFlowGenerator:
                 }
                 no_technique += 1
 
-        print(f"  [OK] Nodes with techniques: {techniques_added}, No technique: {no_technique}")
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        print(f"  [OK] Nodes with techniques: {techniques_added}, No technique: {no_technique} ({elapsed_ms:.1f}ms)")
         return flow
 
     def _find_technique_candidates(self, tactic: str, name: str, description: str, top_k: int = 1) -> List[Dict]:
         """Find up to top_k matching MITRE ATT&CK techniques; if none, return empty (no forced multi-hit)"""
-        if not self.mitre_data:
+        if not self.technique_index:
             return []
 
-        # Normalize tactic name for MITRE ATT&CK
-        tactic_mapping = {
-            'initial_access': 'initial-access',
-            'execution': 'execution',
-            'persistence': 'persistence',
-            'privilege_escalation': 'privilege-escalation',
-            'defense_evasion': 'defense-evasion',
-            'credential_access': 'credential-access',
-            'discovery': 'discovery',
-            'lateral_movement': 'lateral-movement',
-            'collection': 'collection',
-            'command_and_control': 'command-and-control',
-            'exfiltration': 'exfiltration',
-            'impact': 'impact',
-            'reconnaissance': 'reconnaissance'
-        }
-
-        mitre_tactic = tactic_mapping.get(tactic, tactic)
-
-        # Get all techniques
-        techniques = self.mitre_data.get_techniques()
-
-        # Score all techniques matching the tactic (완화된 스코어링으로 T0000 남발 방지)
-        scored_techniques = []
-
-        for tech in techniques:
-            # Check if technique belongs to this tactic
-            tech_tactics = [phase['phase_name'] for phase in tech.get('kill_chain_phases', [])]
-
-            if mitre_tactic not in tech_tactics:
-                continue
-
-            tech_name = tech.get('name', '').lower()
-            tech_desc = tech.get('description', '').lower()
-
-            # Calculate matching score (단어 교집합 + 부분 포함 여부를 모두 반영)
-            score = 0
-            name_lower = name.lower()
-            desc_lower = description.lower()
-
-            name_tokens = set(re.findall(r"[a-z0-9]+", name_lower))
-            tech_name_tokens = set(re.findall(r"[a-z0-9]+", tech_name))
-            desc_tokens = set(re.findall(r"[a-z0-9]+", desc_lower))
-            tech_desc_tokens = set(re.findall(r"[a-z0-9]+", tech_desc))
-
-            # Check name similarity (higher weight)
-            name_overlap = len(name_tokens & tech_name_tokens)
-            score += name_overlap * 3
-
-            # Check description similarity (lower weight)
-            desc_overlap = len(desc_tokens & tech_desc_tokens)
-            score += min(desc_overlap, 5)
-
-            # Partial substring matches 보너스 (교집합이 적을 때 완화)
-            if name_lower and name_lower in tech_name:
-                score += 2
-            if tech_name and tech_name in name_lower:
-                score += 1
-            if name_lower and name_lower in tech_desc:
-                score += 1
-            if desc_lower and desc_lower in tech_desc:
-                score += 1
-
-            # Only include if score is reasonable
-            if score >= 1:
-                scored_techniques.append({
-                    'id': tech.get('external_references', [{}])[0].get('external_id', 'T0000'),
-                    'name': tech.get('name', 'Unknown'),
-                    'score': score
-                })
-
-        # Sort by score (descending) and return up to top_k (없으면 빈 리스트 그대로 반환)
-        scored_techniques.sort(key=lambda x: x['score'], reverse=True)
-        if scored_techniques:
-            return scored_techniques[:top_k]
-
-        # Fuzzy fallback: single best match within tactic based on sequence similarity (top 1 only)
-        best = None
-        best_ratio = 0
-        for tech in techniques:
-            tech_tactics = [phase['phase_name'] for phase in tech.get('kill_chain_phases', [])]
-            if mitre_tactic not in tech_tactics:
-                continue
-            tech_name_full = tech.get('name', '')
-            ratio_name = difflib.SequenceMatcher(None, name_lower, tech_name_full.lower()).ratio()
-            ratio_desc = difflib.SequenceMatcher(None, desc_lower, tech.get('description', '').lower()).ratio()
-            ratio = max(ratio_name, ratio_desc)
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best = {
-                    'id': tech.get('external_references', [{}])[0].get('external_id', 'T0000'),
-                    'name': tech.get('name', 'Unknown'),
-                    'score': ratio
-                }
-        # 최소 유사도 임계치 0.2로 너무 엉뚱한 매칭 방지
-        if best and best_ratio >= 0.2:
-            return [best]
-
-        return []
+        # 점수 규칙은 modules/mitre/index.py (keyword), modules/mitre/tfidf.py (tfidf) 참고
+        return self.technique_index.find_candidates(tactic, name, description, top_k=top_k)
 
     def _extract_yaml(self, text: str) -> str:
         """Extract YAML from response"""
@@ -17,15 +17,20 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from modules.ai.factory import get_llm_client
 from modules.prompts.manager import PromptManager
 
+# UUID namespace for deterministic UUID generation
+ABILITY_UUID_NAMESPACE = uuid.UUID('12345678-1234-5678-1234-567812345678')
+
+
+def node_ability_id(node_id: str, node_name: str) -> str:
+    """Step 3 노드에 대응하는 Ability ID (Deterministic UUID)"""
+    return str(uuid.uuid5(ABILITY_UUID_NAMESPACE, f"kisa_ttp_node_{node_id}_{node_name}"))
+
 
 class AbilityGenerator:
     def __init__(self):
         self.llm = get_llm_client()
         self.prompt_manager = PromptManager()
 
-        # UUID namespace for deterministic UUID generation
-        self.uuid_namespace = uuid.UUID('12345678-1234-5678-1234-567812345678')
-
         # Node type → Tactic 매핑
         self.type_to_tactic = {
             'initial_access': 'initial-access',
@@ -395,8 +400,7 @@ class AbilityGenerator:
 
     def _generate_uuid(self, node_id: str, node_name: str) -> str:
         """Deterministic UUID 생성"""
-        unique_string = f"kisa_ttp_node_{node_id}_{node_name}"
-        return str(uuid.uuid5(self.uuid_namespace, unique_string))
+        return node_ability_id(node_id, node_name)
 
     def _print_summary(self, abilities: List[Dict], adversaries: List[Dict]):
         """생성 요약 출력"""
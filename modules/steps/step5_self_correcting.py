@@ -12,16 +12,25 @@ Module 5: Offline Self-Correcting Engine
 import yaml
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from modules.ai.factory import get_llm_client
+from modules.core.config import get_classification_rules_path, get_correction_cache_path
+from modules.core.correction_cache import CorrectionCache
+from modules.core.failure_rules import CompiledRuleSet, RuleMatch
 from modules.prompts.manager import PromptManager
 
 
+# 실패 Ability 동시 수정 수 (1이면 순차 수정)
+DEFAULT_FIX_WORKERS = 4
+
+
 # ============================================================================
 # Data Models
 # ============================================================================
@@ -48,6 +57,7 @@ class FailedAbility:
     tactic: str = ""
     technique_id: str = ""
     technique_name: str = ""
+    evidence: Optional[Dict] = None
 
 
 @dataclass
@@ -60,32 +70,43 @@ class CorrectionResult:
     failure_type: FailureType
     success: bool
     reason: str = ""
+    evidence: Optional[Dict] = None
+    from_cache: bool = False
 
 
 # ============================================================================
 # Failure Classifier
 # ============================================================================
 
+@lru_cache(maxsize=4)
+def _compiled_rules(rules_path: str) -> CompiledRuleSet:
+    # 같은 규칙 파일은 프로세스에서 한 번만 컴파일 (재시도마다 OfflineCorrector를 새로 만들어도 재사용)
+    return CompiledRuleSet.from_yaml(rules_path)
+
+
 class FailureClassifier:
-    """실패 유형 분류"""
-
-    RULES = {
-        "syntax_error": ["syntax error", "parsererror", "parse error", "unexpected token"],
-        "missing_env": ["cannot find path", "connection refused", "not found", "invalid uri"],
-        "caldera_constraint": ["variable is not defined", "undefined variable", "cannot find variable"],
-        "dependency_error": ["access is denied", "access denied", "requires elevation", "privilege", "unauthorized"],
-        "unrecoverable": ["not recognized as cmdlet", "command not found", "is not installed"]
-    }
+    """실패 유형 분류 (config/classification_rules.yml 규칙 기반)"""
 
-    def classify(self, stderr: str, stdout: str) -> FailureType:
-        """실패 유형 분류"""
-        error_text = (stderr + "\n" + stdout).lower()
+    def __init__(self, rules_path: Optional[str] = None):
+        """
+        Args:
+            rules_path: 분류 규칙 YAML 경로 (기본: CLASSIFICATION_RULES_PATH 또는 config/classification_rules.yml)
+        """
+        self.rules = _compiled_rules(rules_path or get_classification_rules_path())
 
-        for rule_key, keywords in self.RULES.items():
-            if any(keyword in error_text for keyword in keywords):
-                return FailureType(rule_key)
+        known = {failure_type.value for failure_type in FailureType}
+        unknown = [rule for rule in self.rules.rules if rule not in known]
+        if unknown:
+            raise ValueError(f"알 수 없는 실패 유형 규칙: {', '.join(unknown)} (지원: {', '.join(sorted(known))})")
 
-        return FailureType.UNRECOVERABLE
+    def rank(self, stderr: str, stdout: str) -> List[RuleMatch]:
+        """모든 규칙의 매칭 근거를 점수 순으로 반환 (매칭 없으면 빈 목록)"""
+        return self.rules.classify((stderr or "") + "\n" + (stdout or ""))
+
+    def classify(self, stderr: str, stdout: str) -> FailureType:
+        """실패 유형 분류 (가장 높은 점수의 규칙, 매칭 없으면 UNRECOVERABLE)"""
+        ranking = self.rank(stderr, stdout)
+        return FailureType(ranking[0].rule) if ranking else FailureType.UNRECOVERABLE
 
 
 # ============================================================================
@@ -255,9 +276,16 @@ class AbilityFixer:
 class OfflineCorrector:
     """오프라인 Self-Correcting 엔진"""
 
-    def __init__(self):
+    def __init__(self, max_workers: int = DEFAULT_FIX_WORKERS, correction_cache: Optional[CorrectionCache] = None):
+        """
+        Args:
+            max_workers: 동시에 수정할 실패 ability 수 (1이면 순차 수정)
+            correction_cache: 수정 결과 캐시 (None이면 항상 LLM으로 수정)
+        """
         self.classifier = FailureClassifier()
         self.fixer = AbilityFixer()
+        self.max_workers = max(1, max_workers)
+        self.correction_cache = correction_cache
 
     def run(
         self,
@@ -307,6 +335,12 @@ class OfflineCorrector:
 
         print(f"[통계] 전체: {stats['total']}, 성공: {stats['success']}, 실패: {stats['failed']}")
 
+        # 이전에 캐시에 저장한 수정이 이번 실행에서 성공/실패했는지 기록
+        if self.correction_cache is not None:
+            verified, rejected = self.correction_cache.record_outcomes(operation_report, abilities)
+            if verified or rejected:
+                print(f"[수정 캐시] 재실행 결과 반영: 성공 {verified}, 실패 {rejected}")
+
         if not failed_abilities:
             print("\n[완료] 수정이 필요한 실패 ability가 없습니다!")
             return {"corrections": [], "summary": {"total_failed": 0, "corrected": 0, "skipped": 0}}
@@ -317,10 +351,14 @@ class OfflineCorrector:
         # 4. 각 실패한 Ability 처리
         print(f"\n[수정 단계] {len(failed_abilities)}개 실패 처리")
 
-        correction_results = []
-        modified_ids = set()
+        # 4-1 ~ 4-3: 분류/스킵 판단은 순서대로 처리하고, LLM 수정 대상만 모음
+        # (결과는 failed_abilities 순서의 슬롯에 기록하여 병렬 수정 시에도 출력 순서가 동일)
+        slots: List[Optional[CorrectionResult]] = [None] * len(failed_abilities)
+        jobs = []
+        fingerprints: Dict[int, str] = {}
+        cached_fixes: Dict[int, str] = {}
 
-        for failed in failed_abilities:
+        for index, failed in enumerate(failed_abilities):
             print(f"\n  [{failed.ability_name}]")
 
             # 이전 수정 이력 확인
@@ -331,21 +369,28 @@ class OfflineCorrector:
                     print(f"      - 시도 {h.get('attempt', 'N/A')}: {h.get('failure_type', 'Unknown')}")
 
             # 4-1. 실패 유형 분류
-            failed.failure_type = self.classifier.classify(failed.stderr, failed.stdout)
-            print(f"    실패 유형: {failed.failure_type.value}")
+            ranking = self.classifier.rank(failed.stderr, failed.stdout)
+            if ranking:
+                failed.failure_type = FailureType(ranking[0].rule)
+                failed.evidence = ranking[0].to_dict()
+                print(f"    실패 유형: {failed.failure_type.value} (근거: {', '.join(ranking[0].keywords + ranking[0].patterns)})")
+            else:
+                failed.failure_type = FailureType.UNRECOVERABLE
+                print(f"    실패 유형: {failed.failure_type.value} (일치하는 규칙 없음)")
 
             # 4-2. UNRECOVERABLE이면 스킵
             if failed.failure_type == FailureType.UNRECOVERABLE:
                 print(f"    [스킵] 복구 불가능한 에러")
-                correction_results.append(CorrectionResult(
+                slots[index] = CorrectionResult(
                     ability_id=failed.ability_id,
                     ability_name=failed.ability_name,
                     original_command=failed.command,
                     fixed_command="",
                     failure_type=failed.failure_type,
                     success=False,
-                    reason="복구 불가능한 에러 유형"
-                ))
+                    reason="복구 불가능한 에러 유형",
+                    evidence=failed.evidence
+                )
                 continue
 
             # 4-3. 원본 Ability 조회
@@ -354,34 +399,57 @@ class OfflineCorrector:
                 print(f"    [경고] 원본 ability를 찾을 수 없음")
                 continue
 
-            # 4-4. LLM으로 수정 (이력 정보 전달)
-            print(f"    LLM 수정 중...")
-            fixed_cmd, success = self.fixer.fix_ability(failed, original, env_description, history)
+            # 성공이 확인된 수정이 캐시에 있으면 LLM 호출 없이 재사용 (없거나 실패한 수정뿐이면 LLM 호출)
+            if self.correction_cache is not None:
+                fingerprints[index] = self.correction_cache.make_fingerprint(
+                    failed.command, failed.failure_type.value, failed.stderr)
+                proven = self.correction_cache.lookup(fingerprints[index])
+                if proven:
+                    print(f"    [수정 캐시] 검증된 수정 재사용")
+                    cached_fixes[index] = proven
+
+            jobs.append((index, failed, original, history))
+
+        # 4-4. LLM으로 수정 (이력 정보 전달)
+        llm_fixes = iter(self._fix_all([job for job in jobs if job[0] not in cached_fixes], env_description))
+        fixes = [(cached_fixes[job[0]], True) if job[0] in cached_fixes else next(llm_fixes) for job in jobs]
+
+        # 4-5. 수정 결과를 원래 순서대로 abilities에 반영
+        modified_ids = set()
+        for (index, failed, original, _), (fixed_cmd, success) in zip(jobs, fixes):
+            if success and fixed_cmd and index not in cached_fixes and index in fingerprints:
+                # 새 수정은 pending으로 저장 (다음 재실행 결과로 성공/실패 확정)
+                self.correction_cache.record_fix(
+                    fingerprints[index], fixed_cmd, failed.failure_type.value, failed.command)
 
             if success and fixed_cmd:
                 # abilities 리스트에서 해당 ability의 command 직접 수정
                 original['executors'][0]['command'] = fixed_cmd
                 modified_ids.add(failed.ability_id)
-                print(f"    [완료] {fixed_cmd[:60]}...")
 
-                correction_results.append(CorrectionResult(
+                slots[index] = CorrectionResult(
                     ability_id=failed.ability_id,
                     ability_name=failed.ability_name,
                     original_command=failed.command,
                     fixed_command=fixed_cmd,
                     failure_type=failed.failure_type,
-                    success=True
-                ))
+                    success=True,
+                    evidence=failed.evidence,
+                    from_cache=index in cached_fixes
+                )
             else:
-                correction_results.append(CorrectionResult(
+                slots[index] = CorrectionResult(
                     ability_id=failed.ability_id,
                     ability_name=failed.ability_name,
                     original_command=failed.command,
                     fixed_command="",
                     failure_type=failed.failure_type,
                     success=False,
-                    reason="LLM 수정 실패"
-                ))
+                    reason="LLM 수정 실패",
+                    evidence=failed.evidence
+                )
+
+        correction_results = [result for result in slots if result is not None]
 
         # 5. 수정된 abilities.yml 저장
         if output_dir:
@@ -419,6 +487,50 @@ class OfflineCorrector:
 
         return report
 
+    def _fix_all(self, jobs: List[Tuple], env_description: str) -> List[Tuple[str, bool]]:
+        """수정 대상 ability들을 LLM으로 수정 (max_workers > 1이면 동시 호출).
+
+        Args:
+            jobs: [(순번, FailedAbility, 원본 ability, 수정 이력), ...]
+            env_description: 환경 설명
+
+        Returns:
+            List[Tuple[str, bool]]: jobs 순서의 (수정된 명령어, 성공 여부)
+        """
+        if not jobs:
+            return []
+
+        def fix(job):
+            _, failed, original, history = job
+            return self.fixer.fix_ability(failed, original, env_description, history)
+
+        workers = min(self.max_workers, len(jobs))
+        if workers == 1:
+            fixes = []
+            for job in jobs:
+                print(f"\n  [{job[1].ability_name}] LLM 수정 중...")
+                fixes.append(fix(job))
+                self._print_fix(job[1], fixes[-1])
+            return fixes
+
+        print(f"\n  [병렬 수정] {len(jobs)}개 ability, {workers}개 동시 LLM 호출")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(fix, job) for job in jobs]
+            fixes = []
+            # 완료 순서와 무관하게 제출 순서대로 수집
+            for job, future in zip(jobs, futures):
+                fixes.append(future.result())
+                self._print_fix(job[1], fixes[-1])
+        return fixes
+
+    @staticmethod
+    def _print_fix(failed: FailedAbility, fix: Tuple[str, bool]):
+        fixed_cmd, success = fix
+        if success and fixed_cmd:
+            print(f"    [완료] {failed.ability_name}: {fixed_cmd[:60]}...")
+        else:
+            print(f"    [실패] {failed.ability_name}: LLM 수정 실패")
+
     def _load_yaml(self, file_path: str) -> List[Dict]:
         """YAML 로드"""
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -514,6 +626,8 @@ class OfflineCorrector:
                     "failure_type": r.failure_type.value,
                     "success": r.success,
                     "reason": r.reason,
+                    "evidence": r.evidence,
+                    "from_cache": r.from_cache,
                     "original_command": r.original_command,
                     "fixed_command": r.fixed_command if r.fixed_command else ""
                 }
@@ -522,6 +636,7 @@ class OfflineCorrector:
             "summary": {
                 "total_failed": len(results),
                 "corrected": len([r for r in results if r.success]),
+                "from_cache": len([r for r in results if r.from_cache]),
                 "skipped": len([r for r in results if not r.success])
             }
         }
@@ -601,6 +716,19 @@ def main():
         help="출력 디렉토리 (기본: abilities.yml과 같은 위치)"
     )
 
+    parser.add_argument(
+        "--fix-workers",
+        type=int,
+        default=DEFAULT_FIX_WORKERS,
+        help=f"실패 ability 동시 수정 수 (1이면 순차, 기본: {DEFAULT_FIX_WORKERS})"
+    )
+
+    parser.add_argument(
+        "--correction-cache",
+        action="store_true",
+        help="수정 결과 캐시 사용 (CORRECTION_CACHE_PATH, 검증된 수정은 LLM 호출 없이 재사용)"
+    )
+
     args = parser.parse_args()
 
     # Report 파일 확인
@@ -641,7 +769,8 @@ def main():
 
     # 실행
     try:
-        corrector = OfflineCorrector()
+        correction_cache = CorrectionCache(get_correction_cache_path()) if args.correction_cache else None
+        corrector = OfflineCorrector(max_workers=args.fix_workers, correction_cache=correction_cache)
         corrector.run(
             abilities_file=abilities_file,
             operation_report_file=args.report,
@@ -0,0 +1,119 @@
+"""
+Step 2 청커 비교 벤치마크
+고정 8000자 분할과 토큰 기반 의미 단위 분할의 청크 수, 총 입력 토큰, 경계 품질 비교
+
+총 입력 토큰 = Σ(청크 본문 토큰 + 청크 프롬프트 템플릿 토큰) (개요/이전 목표 컨텍스트는 제외)
+줄 중간 분할 = 청크 경계가 줄의 중간에 걸린 횟수
+
+사용 예:
+  python scripts/bench_chunking.py
+  python scripts/bench_chunking.py data/raw/KISA_TTPs_1.pdf --providers claude chatgpt --overlap 200
+"""
+
+import argparse
+import glob
+import os
+import sys
+from typing import Dict, List
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.core.chunking import CHUNK_TOKEN_BUDGETS, SemanticChunker, get_chunk_token_budget
+from modules.core.tokens import estimate_tokens
+from modules.prompts.manager import PromptManager
+from modules.steps.step1_pdf_processing import PDFProcessor, BoilerplateStripper
+
+FIXED_CHUNK_SIZE = 8000
+
+
+def template_overhead_tokens() -> int:
+    """청크 프롬프트 템플릿 자체의 토큰 수 (본문/개요 제외)"""
+    prompt = PromptManager().render(
+        "step2_chunk.yaml",
+        overview="",
+        previous_context="",
+        chunk_num=1,
+        total_chunks=1,
+        chunk=""
+    )
+    return estimate_tokens(prompt)
+
+
+def load_pages(pdf_path: str) -> List[Dict]:
+    """Step 1과 동일하게 추출 후 boilerplate 제거"""
+    processor = PDFProcessor(cache=PDFProcessor.default_cache())
+    pages = list(processor.iter_pages(pdf_path, streaming=False))
+    return BoilerplateStripper().strip(pages)
+
+
+def mid_line_breaks(chunks: List[str], source_lines: set) -> int:
+    """청크 경계가 줄 중간에 걸린 횟수 (경계 양쪽 줄이 원문의 완전한 줄이 아니면 중간 분할)"""
+    breaks = 0
+    for prev, nxt in zip(chunks, chunks[1:]):
+        last_line = prev.rsplit("\n", 1)[-1]
+        first_line = nxt.split("\n", 1)[0]
+        if (last_line and last_line not in source_lines) or (first_line and first_line not in source_lines):
+            breaks += 1
+    return breaks
+
+
+def summarize(chunks: List[str], overhead: int, source_lines: set) -> Dict:
+    tokens = [estimate_tokens(chunk) for chunk in chunks]
+    return {
+        "chunks": len(chunks),
+        "input_tokens": sum(tokens) + overhead * len(chunks),
+        "max_chunk_tokens": max(tokens) if tokens else 0,
+        "mid_line": mid_line_breaks(chunks, source_lines),
+    }
+
+
+def benchmark(pdf_files: List[str], providers: List[str], overlap: int):
+    overhead = template_overhead_tokens()
+    rows = []
+
+    for pdf_path in pdf_files:
+        pages = load_pages(pdf_path)
+        full_text = "\n\n".join(page.get('text', '') for page in pages)
+        name = os.path.basename(pdf_path)
+        source_lines = set(full_text.split("\n"))
+
+        fixed = [full_text[i:i + FIXED_CHUNK_SIZE] for i in range(0, len(full_text), FIXED_CHUNK_SIZE)]
+        rows.append({"pdf": name, "chunker": f"fixed {FIXED_CHUNK_SIZE} chars", **summarize(fixed, overhead, source_lines)})
+
+        for provider in providers:
+            budget = get_chunk_token_budget(provider)
+            chunks = list(SemanticChunker(budget, overlap_tokens=overlap).chunks(pages))
+            rows.append({"pdf": name, "chunker": f"semantic {provider} ({budget} tok)", **summarize(chunks, overhead, source_lines)})
+
+    print("\n" + "=" * 92)
+    print("Step 2 청커 비교")
+    print(f"  템플릿 토큰/청크: {overhead}, overlap: {overlap} tokens")
+    print("=" * 92)
+    print(f"{'PDF':<20} {'chunker':<30} {'chunks':>7} {'input tokens':>13} {'max/chunk':>10} {'mid-line':>9}")
+    print("-" * 92)
+    for row in rows:
+        print(f"{row['pdf']:<20} {row['chunker']:<30} {row['chunks']:>7} {row['input_tokens']:>13,} "
+              f"{row['max_chunk_tokens']:>10,} {row['mid_line']:>9}")
+    print("=" * 92)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Step 2 청커 비교 (고정 길이 vs 토큰 기반 의미 단위)")
+    parser.add_argument("pdfs", nargs="*", help="PDF 파일 경로 (기본: data/raw/KISA_TTPs_*.pdf)")
+    parser.add_argument("--providers", nargs="+", default=sorted(CHUNK_TOKEN_BUDGETS),
+                        help="토큰 예산을 비교할 공급자 (기본: 전체)")
+    parser.add_argument("--overlap", type=int, default=0, help="semantic 청커 겹침 토큰 수 (기본: 0)")
+
+    args = parser.parse_args()
+
+    pdf_files = args.pdfs or sorted(glob.glob("data/raw/KISA_TTPs_*.pdf"))
+    if not pdf_files:
+        print("[ERROR] 벤치마크할 PDF가 없습니다 (data/raw/KISA_TTPs_*.pdf)")
+        sys.exit(1)
+
+    benchmark(pdf_files, args.providers, args.overlap)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Step 5 실패 분류기 처리량 벤치마크
+과거 Operation 리포트의 실패 stderr/stdout 샘플로 다음을 비교:
+  - legacy: 기존 하드코딩 RULES + 중첩 any() 검사
+  - naive: classification_rules.yml을 키워드/패턴마다 따로 검사 (컴파일 분류기의 기준 구현)
+  - compiled (scan / aho-corasick): CompiledRuleSet
+
+컴파일 분류기 결과가 기준 구현과 같은지(규칙 순위, 근거)와 legacy와의 top-1 일치율도 출력
+
+사용 예:
+  python scripts/bench_failure_classifier.py
+  python scripts/bench_failure_classifier.py "data/processed/**/operation_report*.json" --samples 20000
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.core.config import get_classification_rules_path
+from modules.core import failure_rules
+from modules.core.failure_rules import CompiledRuleSet
+
+DEFAULT_PATTERN = "data/processed/**/operation_report*.json"
+
+# 기존 step5 FailureClassifier.RULES (비교용)
+LEGACY_RULES = {
+    "syntax_error": ["syntax error", "parsererror", "parse error", "unexpected token"],
+    "missing_env": ["cannot find path", "connection refused", "not found", "invalid uri"],
+    "caldera_constraint": ["variable is not defined", "undefined variable", "cannot find variable"],
+    "dependency_error": ["access is denied", "access denied", "requires elevation", "privilege", "unauthorized"],
+    "unrecoverable": ["not recognized as cmdlet", "command not found", "is not installed"]
+}
+
+# 리포트가 없을 때 쓰는 합성 샘플 재료 (PowerShell 에러 출력 형태)
+FILLER = [
+    "At line:1 char:{n}", "+ CategoryInfo          : ObjectNotFound: (:) [], CommandNotFoundException",
+    "+ FullyQualifiedErrorId : {word}", "    + ~~~~~~~~~~~~~~~~~~~~~", "PS C:\\Users\\victim> ",
+    "Exception calling \"Invoke\" with \"0\" argument(s)", "$result = Get-Item {path}",
+    "Connecting to 192.168.56.{n}:445", "HResult 0x{hex}", "",
+]
+
+
+def load_samples(patterns: List[str]) -> List[str]:
+    """Operation 리포트들의 실패 결과에서 stderr + stdout 텍스트 수집"""
+    samples = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    report = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"  [WARNING] {path}: {e}")
+                continue
+            for result in report.get('results', []):
+                if result.get('status', 0) != 0:
+                    samples.append((result.get('stderr') or "") + "\n" + (result.get('stdout') or ""))
+    return samples
+
+
+def synthetic_samples(rules: Dict, count: int, seed: int = 0) -> List[str]:
+    """규칙 키워드 0~2개와 PowerShell 에러 형태의 줄을 섞은 합성 샘플"""
+    rng = random.Random(seed)
+    keywords = [k for spec in rules.values() for k in (spec or {}).get('keywords') or []]
+    samples = []
+    for _ in range(count):
+        lines = []
+        for _ in range(rng.randint(3, 12)):
+            lines.append(rng.choice(FILLER).format(
+                n=rng.randint(1, 255), word=rng.choice(["Foo", "Bar", "Invoke-X"]),
+                path=rng.choice(["C:\\Temp\\a.txt", "TARGET_PATH"]), hex=f"{rng.getrandbits(32):08X}"))
+        for _ in range(rng.choice([0, 1, 1, 2])):
+            keyword = rng.choice(keywords)
+            lines.insert(rng.randint(0, len(lines)), f"Error: {keyword.upper() if rng.random() < 0.2 else keyword}.")
+        samples.append("\n".join(lines))
+    return samples
+
+
+def legacy_classify(text: str) -> str:
+    error_text = text.lower()
+    for rule_key, keywords in LEGACY_RULES.items():
+        if any(keyword in error_text for keyword in keywords):
+            return rule_key
+    return "unrecoverable"
+
+
+class NaiveClassifier:
+    """classification_rules.yml을 키워드/패턴마다 따로 검사하는 기준 구현 (CompiledRuleSet과 같은 의미)"""
+
+    def __init__(self, rules: Dict):
+        self.rules = rules
+        self.order = {name: index for index, name in enumerate(rules)}
+
+    def classify(self, text: str) -> List[Tuple[str, float, Tuple[str, ...], Tuple[str, ...]]]:
+        lowered = text.lower()
+        spans = []
+        for name, spec in self.rules.items():
+            for keyword in (spec or {}).get('keywords') or []:
+                keyword = str(keyword).lower()
+                start = lowered.find(keyword)
+                while start != -1:
+                    spans.append((start, start + len(keyword), keyword))
+                    start = lowered.find(keyword, start + 1)
+        spans.sort(key=lambda span: (span[0], -span[1]))
+        found, covered_end = [], -1
+        for start, end, keyword in spans:
+            if end > covered_end:
+                covered_end = end
+                if keyword not in found:
+                    found.append(keyword)
+
+        results = {}
+        for name, spec in self.rules.items():
+            spec = spec or {}
+            keywords = [k for k in found if k in {str(x).lower() for x in spec.get('keywords') or []}]
+            if not keywords:
+                continue
+            patterns = [p for p in spec.get('patterns') or [] if re.search(p, text, re.IGNORECASE)]
+            score = failure_rules.KEYWORD_WEIGHT * len(keywords) + failure_rules.PATTERN_WEIGHT * len(patterns)
+            if score:
+                results[name] = (name, score, tuple(sorted(keywords)), tuple(sorted(patterns)))
+        return sorted(results.values(), key=lambda r: (-r[1], self.order[r[0]]))
+
+
+def as_comparable(matches) -> List[Tuple[str, float, Tuple[str, ...], Tuple[str, ...]]]:
+    return [(m.rule, m.score, tuple(sorted(m.keywords)), tuple(sorted(m.patterns))) for m in matches]
+
+
+def throughput(classify: Callable[[str], object], samples: List[str], repeat: int) -> float:
+    """초당 분류 샘플 수 (repeat회 중 최고)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in samples:
+            classify(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(samples) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Step 5 failure classification throughput")
+    parser.add_argument("patterns", nargs="*", help=f"Operation report glob patterns (default: {DEFAULT_PATTERN})")
+    parser.add_argument("--rules", default=None, help="Classification rules YAML (default: CLASSIFICATION_RULES_PATH)")
+    parser.add_argument("--samples", type=int, default=5000,
+                        help="Samples to classify; historical samples are repeated to reach this count (default: 5000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per classifier (best is reported)")
+    args = parser.parse_args()
+
+    rules_path = args.rules or get_classification_rules_path()
+    with open(rules_path, 'r', encoding='utf-8') as f:
+        rules = yaml.safe_load(f) or {}
+
+    samples = load_samples(args.patterns or [DEFAULT_PATTERN])
+    source = f"{len(samples)} historical failures"
+    if not samples:
+        print("[WARNING] 실패 결과가 있는 Operation 리포트가 없어 합성 샘플을 사용합니다.")
+        samples = synthetic_samples(rules, args.samples)
+        source = "synthetic"
+    samples = (samples * (args.samples // len(samples) + 1))[:args.samples]
+    avg_chars = sum(len(s) for s in samples) / len(samples)
+    print(f"Samples: {len(samples)} ({source}, avg {avg_chars:.0f} chars), rules: {rules_path}\n")
+
+    naive = NaiveClassifier(rules)
+    classifiers: Dict[str, Callable[[str], object]] = {
+        "legacy (hard-coded any)": legacy_classify,
+        "naive (yaml, per rule)": naive.classify,
+    }
+    compiled: Dict[str, Optional[CompiledRuleSet]] = {"scan": CompiledRuleSet(rules, keyword_backend="scan")}
+    try:
+        compiled["aho-corasick"] = CompiledRuleSet(rules, keyword_backend="aho-corasick")
+    except ImportError:
+        print("[INFO] pyahocorasick 미설치: aho-corasick 백엔드 생략\n")
+    for backend, ruleset in compiled.items():
+        classifiers[f"compiled ({backend})"] = ruleset.classify
+
+    rates = {label: throughput(classify, samples, args.repeat) for label, classify in classifiers.items()}
+    for label, rate in rates.items():
+        print(f"  {label:<26}{rate:>12,.0f} samples/s  ({rate / rates['naive (yaml, per rule)']:.1f}x vs naive)")
+
+    unique = list(dict.fromkeys(samples))
+    expected = [naive.classify(text) for text in unique]
+    print()
+    for backend, ruleset in compiled.items():
+        same = sum(as_comparable(ruleset.classify(text)) == reference for text, reference in zip(unique, expected))
+        print(f"  compiled ({backend}) identical to naive: {same}/{len(unique)}")
+
+    def top1(text: str) -> str:
+        ranking = compiled["scan"].classify(text)
+        return ranking[0].rule if ranking else "unrecoverable"
+
+    agree = sum(top1(text) == legacy_classify(text) for text in unique)
+    print(f"  top-1 agreement with legacy: {agree}/{len(unique)} ({agree / len(unique):.1%})")
+
+
+if __name__ == "__main__":
+    main()
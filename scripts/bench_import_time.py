@@ -0,0 +1,123 @@
+"""
+main.py 기동 시 임포트 시간 벤치마크 (python -X importtime)
+시나리오별로 새 인터프리터에서 임포트 시간을 측정하고, 해당 시나리오에서 로드되면 안 되는 무거운 모듈
+(LLM SDK, paramiko, PDF 라이브러리 등)이 로드되었는지 확인
+
+기준값 파일을 지정하면 허용 범위를 넘는 증가나 금지 모듈 로드 시 종료 코드 1 반환 (회귀 감지)
+
+사용 예:
+  python scripts/bench_import_time.py
+  python scripts/bench_import_time.py --save-baseline data/cache/import_time.json
+  python scripts/bench_import_time.py --baseline data/cache/import_time.json --tolerance 0.3
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Set, Tuple
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+LLM_SDKS = ("anthropic", "openai", "google.generativeai")
+PDF_LIBS = ("pdfplumber", "pymupdf", "fitz")
+
+# 시나리오 이름 → (실행할 코드, 로드되면 안 되는 모듈)
+SCENARIOS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "main": ("import main",
+             LLM_SDKS + PDF_LIBS + ("paramiko", "mitreattack", "numpy", "requests", "jinja2")),
+    "step1": ("import main, modules.steps.step1_pdf_processing",
+              LLM_SDKS + PDF_LIBS + ("paramiko", "mitreattack", "numpy", "requests", "jinja2")),
+    "step2": ("import main, modules.steps.step2_abstract_flow",
+              LLM_SDKS + PDF_LIBS + ("paramiko", "mitreattack", "numpy", "requests", "jinja2")),
+    "step3": ("import main, modules.steps.step3_concrete_flow",
+              LLM_SDKS + PDF_LIBS + ("paramiko", "mitreattack", "numpy", "requests", "jinja2")),
+    "step5": ("import main, modules.steps.step5_self_correcting, modules.caldera.uploader, "
+              "modules.caldera.executor, modules.caldera.reporter, modules.caldera.agent_manager",
+              LLM_SDKS + PDF_LIBS + ("mitreattack", "numpy", "jinja2")),
+}
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def run_importtime(code: str) -> List[Tuple[int, int, str]]:
+    """새 인터프리터에서 code를 실행하고 (self us, cumulative us, 들여쓰기 포함 모듈명) 목록 반환"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"'{code}' 실행 실패:\n{result.stderr[-2000:]}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            entries.append((int(match.group(1)), int(match.group(2)), match.group(3) + match.group(4)))
+    return entries
+
+
+def measure(code: str, startup: Set[str]) -> Tuple[float, Set[str], List[Tuple[int, str]]]:
+    """code가 새로 임포트한 모듈의 총 시간 (ms), 로드된 모듈 집합, 최상위 임포트별 누적 시간"""
+    entries = run_importtime(code)
+    modules = {name.strip() for _, _, name in entries}
+    # 들여쓰기 1칸 = 최상위 임포트 (인터프리터 기동 시 로드되는 모듈은 제외)
+    top_level = [(cumulative, name.strip()) for _, cumulative, name in entries
+                 if len(name) - len(name.lstrip()) == 1 and name.strip() not in startup]
+    total_ms = sum(cumulative for cumulative, _ in top_level) / 1000
+    return total_ms, modules, sorted(top_level, reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Track import-time regressions of main.py and step modules")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario (best time is reported)")
+    parser.add_argument("--top", type=int, default=5, help="Slowest top-level imports to show per scenario")
+    parser.add_argument("--baseline", default=None, help="Compare against a saved baseline JSON")
+    parser.add_argument("--save-baseline", default=None, help="Write measured times to a baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown vs baseline (default: 0.25 = +25%%)")
+    args = parser.parse_args()
+
+    startup = {name.strip() for _, _, name in run_importtime("pass")}
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {}
+    failed = False
+    print(f"{'scenario':<10}{'import (ms)':>13}{'baseline':>11}  status")
+    for name in args.scenarios:
+        code, forbidden = SCENARIOS[name]
+        runs = [measure(code, startup) for _ in range(args.repeat)]
+        total_ms, modules, top_level = min(runs, key=lambda run: run[0])
+        results[name] = round(total_ms, 1)
+
+        problems = [f"loaded {module}" for module in forbidden if module in modules]
+        base_ms = baseline.get(name)
+        if base_ms is not None and total_ms > base_ms * (1 + args.tolerance):
+            problems.append(f"+{(total_ms / base_ms - 1) * 100:.0f}% vs baseline")
+        failed = failed or bool(problems)
+
+        base_text = f"{base_ms:.1f}" if base_ms is not None else "-"
+        print(f"{name:<10}{total_ms:>13.1f}{base_text:>11}  {'; '.join(problems) or 'OK'}")
+        for cumulative, module in top_level[:args.top]:
+            print(f"{'':<12}{cumulative / 1000:>8.1f} ms  {module}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n[OK] Baseline saved: {args.save_baseline}")
+
+    if failed:
+        print("\n[WARNING] Import-time regression detected")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
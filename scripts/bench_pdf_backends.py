@@ -0,0 +1,150 @@
+"""
+Step 1 PDF 백엔드 비교 벤치마크
+PyMuPDF / pdfplumber 백엔드의 처리 속도(pages/sec), 최대 메모리(peak RSS), 추출 텍스트 일치도 비교
+
+각 백엔드는 별도 프로세스에서 실행하여 peak RSS가 서로 섞이지 않도록 측정합니다.
+
+사용 예:
+  python scripts/bench_pdf_backends.py
+  python scripts/bench_pdf_backends.py data/raw/KISA_TTPs_1.pdf --backends pymupdf pdfplumber
+"""
+
+import argparse
+import difflib
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def run_child(backend: str, pdf_path: str):
+    """자식 프로세스: 단일 백엔드로 추출 후 결과를 JSON으로 stdout에 출력"""
+    from modules.steps.step1_pdf_processing import PDF_BACKENDS
+
+    extractor = PDF_BACKENDS[backend]()
+    start = time.perf_counter()
+    total_pages = extractor.page_count(pdf_path)
+    pages = extractor.extract_range(pdf_path, 0, total_pages)
+    elapsed = time.perf_counter() - start
+
+    peak_rss_mb = None
+    if resource is not None:
+        # Linux: KB 단위, macOS: byte 단위
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak_rss_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+    json.dump({
+        "seconds": elapsed,
+        "total_pages": total_pages,
+        "peak_rss_mb": peak_rss_mb,
+        "pages": pages,
+    }, sys.stdout, ensure_ascii=False)
+
+
+def measure(backend: str, pdf_path: str) -> Dict:
+    """백엔드를 별도 프로세스로 실행하여 측정값 수집"""
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", backend, pdf_path],
+        capture_output=True, text=True, encoding="utf-8"
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{backend} 실행 실패: {proc.stderr.strip()[-500:]}")
+    return json.loads(proc.stdout)
+
+
+def _normalized(text: str) -> str:
+    return " ".join(text.split())
+
+
+def compare_pages(reference: List[Dict], candidate: List[Dict]) -> Dict:
+    """페이지 단위 텍스트 비교 (정확 일치 수 + 공백 정규화 후 평균 유사도)"""
+    ref_by_page = {p["page_number"]: p["text"] for p in reference}
+    cand_by_page = {p["page_number"]: p["text"] for p in candidate}
+    page_numbers = sorted(set(ref_by_page) | set(cand_by_page))
+
+    exact = 0
+    ratios = []
+    for page_number in page_numbers:
+        ref_text = ref_by_page.get(page_number, "")
+        cand_text = cand_by_page.get(page_number, "")
+        if ref_text == cand_text:
+            exact += 1
+        ratios.append(difflib.SequenceMatcher(None, _normalized(ref_text), _normalized(cand_text)).ratio())
+
+    return {
+        "pages": len(page_numbers),
+        "exact": exact,
+        "similarity": sum(ratios) / len(ratios) if ratios else 1.0,
+    }
+
+
+def benchmark(pdf_files: List[str], backends: List[str]):
+    """PDF별 백엔드 비교 결과 출력 (첫 번째 백엔드를 텍스트 비교 기준으로 사용)"""
+    rows = []
+
+    for pdf_path in pdf_files:
+        results = {backend: measure(backend, pdf_path) for backend in backends}
+        reference = results[backends[0]]
+
+        for backend in backends:
+            result = results[backend]
+            comparison = compare_pages(reference["pages"], result["pages"])
+            rows.append({
+                "pdf": os.path.basename(pdf_path),
+                "backend": backend,
+                "pages": result["total_pages"],
+                "seconds": result["seconds"],
+                "pages_per_sec": result["total_pages"] / result["seconds"] if result["seconds"] > 0 else 0.0,
+                "peak_rss_mb": result["peak_rss_mb"],
+                "exact": f"{comparison['exact']}/{comparison['pages']}",
+                "similarity": comparison["similarity"],
+            })
+
+    print("\n" + "=" * 96)
+    print("Step 1 PDF 백엔드 비교")
+    print(f"  텍스트 비교 기준: {backends[0]} (exact: 페이지 단위 정확 일치, similarity: 공백 정규화 후 평균 유사도)")
+    print("=" * 96)
+    print(f"{'PDF':<20} {'backend':<12} {'pages':>6} {'seconds':>9} {'pages/s':>9} "
+          f"{'peak RSS':>10} {'exact':>8} {'similarity':>11}")
+    print("-" * 96)
+    for row in rows:
+        rss = f"{row['peak_rss_mb']:.1f}MB" if row["peak_rss_mb"] is not None else "n/a"
+        print(f"{row['pdf']:<20} {row['backend']:<12} {row['pages']:>6} {row['seconds']:>9.2f} "
+              f"{row['pages_per_sec']:>9.1f} {rss:>10} {row['exact']:>8} {row['similarity']:>10.1%}")
+    print("=" * 96)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Step 1 PDF 백엔드 비교 (속도, 메모리, 텍스트 일치도)")
+    parser.add_argument("pdfs", nargs="*", help="PDF 파일 경로 (기본: data/raw/KISA_TTPs_*.pdf)")
+    parser.add_argument("--backends", nargs="+", default=["pdfplumber", "pymupdf"],
+                        help="비교할 백엔드 (첫 번째가 텍스트 비교 기준, 기본: pdfplumber pymupdf)")
+    parser.add_argument("--child", nargs=2, metavar=("BACKEND", "PDF"), help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    pdf_files = args.pdfs or sorted(glob.glob("data/raw/KISA_TTPs_*.pdf"))
+    if not pdf_files:
+        print("[ERROR] 벤치마크할 PDF가 없습니다 (data/raw/KISA_TTPs_*.pdf)")
+        sys.exit(1)
+
+    benchmark(pdf_files, args.backends)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Step 1 PDF 추출 벤치마크
+순차 추출과 멀티 프로세스 추출의 실행 시간을 비교
+
+사용 예:
+  python scripts/bench_pdf_extraction.py
+  python scripts/bench_pdf_extraction.py --workers 1 2 4 --repeat 3 data/raw/KISA_TTPs_1.pdf
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from typing import Dict, List
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.steps.step1_pdf_processing import PDFProcessor
+
+
+def run_extraction(pdf_path: str, workers: int, repeat: int, backend: str = None) -> Dict:
+    """지정한 워커 수로 repeat회 추출하여 최단 시간과 결과 반환"""
+    # 캐시 없이 매번 실제로 추출
+    processor = PDFProcessor(workers=workers, cache=None, backend=backend)
+    best = None
+    pages = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pages = list(processor.iter_pages(pdf_path, streaming=False))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return {"seconds": best, "pages": pages}
+
+
+def benchmark(pdf_files: List[str], worker_counts: List[int], repeat: int, backend: str = None):
+    """PDF별 / 워커 수별 추출 시간 비교 출력"""
+    rows = []
+
+    for pdf_path in pdf_files:
+        baseline = None
+        for workers in worker_counts:
+            result = run_extraction(pdf_path, workers, repeat, backend)
+
+            if baseline is None:
+                baseline = result
+            # 병렬 결과가 순차 결과와 동일한지 확인 (페이지 순서 포함)
+            identical = result["pages"] == baseline["pages"]
+
+            rows.append({
+                "pdf": os.path.basename(pdf_path),
+                "workers": workers,
+                "pages": len(result["pages"]),
+                "seconds": result["seconds"],
+                "speedup": baseline["seconds"] / result["seconds"] if result["seconds"] > 0 else 0.0,
+                "identical": identical,
+            })
+
+    print("\n" + "=" * 80)
+    print("Step 1 PDF 추출 벤치마크")
+    print(f"  CPU: {os.cpu_count()}개, 반복: {repeat}회 (최단 시간 기준)")
+    print("=" * 80)
+    print(f"{'PDF':<22} {'workers':>8} {'pages':>7} {'seconds':>10} {'speedup':>9} {'identical':>10}")
+    print("-" * 80)
+    for row in rows:
+        print(f"{row['pdf']:<22} {row['workers']:>8} {row['pages']:>7} "
+              f"{row['seconds']:>10.2f} {row['speedup']:>8.2f}x {str(row['identical']):>10}")
+    print("=" * 80)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Step 1 PDF 추출 벤치마크 (순차 vs 병렬)")
+    parser.add_argument("pdfs", nargs="*", help="PDF 파일 경로 (기본: data/raw/KISA_TTPs_*.pdf)")
+    parser.add_argument("--workers", type=int, nargs="+", default=None,
+                        help="비교할 워커 수 목록 (기본: 1, 2, CPU 수)")
+    parser.add_argument("--repeat", type=int, default=1, help="반복 횟수 (기본: 1)")
+    parser.add_argument("--backend", type=str, default=None, help="PDF 백엔드 (pymupdf/pdfplumber, 기본: pymupdf)")
+
+    args = parser.parse_args()
+
+    pdf_files = args.pdfs or sorted(glob.glob("data/raw/KISA_TTPs_*.pdf"))
+    if not pdf_files:
+        print("[ERROR] 벤치마크할 PDF가 없습니다 (data/raw/KISA_TTPs_*.pdf)")
+        sys.exit(1)
+
+    worker_counts = args.workers or sorted({1, 2, os.cpu_count() or 1})
+    if worker_counts[0] != 1:
+        worker_counts = [1] + worker_counts
+
+    benchmark(pdf_files, worker_counts, args.repeat, args.backend)
+
+
+if __name__ == "__main__":
+    main()
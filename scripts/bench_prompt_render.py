@@ -0,0 +1,95 @@
+"""
+PromptManager 렌더링 처리량 마이크로벤치마크
+템플릿을 매번 읽는 방식(캐시 없음)과 캐시된 str.format / 사전 컴파일된 Jinja2 렌더링 비교
+
+Jinja2 결과는 format 템플릿을 같은 의미의 Jinja2 문법으로 변환한 임시 템플릿으로 측정하며,
+출력이 format 결과와 같은지도 확인합니다.
+
+사용 예:
+  python scripts/bench_prompt_render.py
+  python scripts/bench_prompt_render.py --template step5_fix_ability.yaml --iterations 5000
+"""
+
+import argparse
+import os
+import string
+import sys
+import tempfile
+import time
+from typing import Callable, Dict
+
+import yaml
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.prompts.manager import PromptManager, clear_template_cache
+
+
+def format_to_jinja(prompt: str) -> str:
+    """str.format 템플릿을 같은 출력을 내는 Jinja2 템플릿으로 변환 (단순 {변수} 치환만 지원)"""
+    parts = []
+    for literal, field, _, _ in string.Formatter().parse(prompt):
+        if literal:
+            parts.append("{% raw %}" + literal + "{% endraw %}" if any(t in literal for t in ("{{", "{%", "{#")) else literal)
+        if field is not None:
+            parts.append("{{ " + field + " }}")
+    return "".join(parts)
+
+
+def sample_variables(prompt: str) -> Dict[str, str]:
+    """템플릿 변수마다 실제 크기에 가까운 더미 값 (본문류는 8000자)"""
+    fields = {field for _, field, _, _ in string.Formatter().parse(prompt) if field}
+    return {field: ("x" * 8000 if field in ("chunk", "text", "content") else f"<{field}>") for field in fields}
+
+
+def throughput(render: Callable[[], str], iterations: int) -> float:
+    """초당 렌더링 횟수"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    return iterations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure PromptManager render throughput")
+    parser.add_argument("--template", default="step2_chunk.yaml", help="Template file name (default: step2_chunk.yaml)")
+    parser.add_argument("--iterations", type=int, default=2000, help="Renders per mode (default: 2000)")
+    args = parser.parse_args()
+
+    manager = PromptManager()
+    data = manager.load_template(args.template)
+    variables = sample_variables(data.get('prompt', ''))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jinja_data = dict(data, engine="jinja2", prompt=format_to_jinja(data.get('prompt', '')))
+        with open(os.path.join(tmp_dir, args.template), 'w', encoding='utf-8') as f:
+            yaml.safe_dump(jinja_data, f, allow_unicode=True, sort_keys=False)
+        jinja_manager = PromptManager(template_dir=tmp_dir)
+
+        def render_uncached():
+            # 기존 동작: 매 렌더링마다 파일을 열고 YAML 파싱
+            clear_template_cache()
+            return manager.render(args.template, **variables)
+
+        modes = {
+            "uncached (load every render)": render_uncached,
+            "cached str.format": lambda: manager.render(args.template, **variables),
+            "cached jinja2 (precompiled)": lambda: jinja_manager.render(args.template, **variables),
+        }
+
+        same = manager.render(args.template, **variables) == jinja_manager.render(args.template, **variables)
+
+        print(f"Template: {args.template} ({len(data.get('prompt', ''))} chars, {len(variables)} variables)\n")
+        baseline = None
+        for label, render in modes.items():
+            render()  # 캐시 준비
+            rate = throughput(render, args.iterations)
+            baseline = baseline or rate
+            print(f"  {label:<30}{rate:>12,.0f} renders/s  ({rate / baseline:.1f}x)")
+
+    print(f"\nJinja2 output identical to str.format: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Step 3 Technique 순위화 벤치마크
+키워드 인덱스(노드별 find_candidates)와 TF-IDF 순위화(flow별 rank_nodes 한 번)의
+소요 시간과 top-1 일치율 비교
+
+사용 예:
+  python scripts/bench_technique_ranker.py
+  python scripts/bench_technique_ranker.py data/processed/KISA_TTPs_1/*/step3.yml --repeat 5
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import yaml
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.mitre.index import TechniqueIndex, node_query
+from modules.mitre.snapshot import load_techniques
+from modules.mitre.tfidf import TfidfTechniqueRanker
+
+DEFAULT_PATTERN = "data/processed/*/*/step3.yml"
+
+
+def load_queries(step3_file: str) -> List[Tuple[str, str, str]]:
+    """step3.yml 노드를 (tactic, name, description) 질의로 변환 (Step 3와 동일한 전술 정규화)"""
+    with open(step3_file, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+    flow = data.get('concrete_flow') or {}
+    return [node_query(node) for node in flow.get('nodes', [])]
+
+
+def time_ranker(ranker, flows: List[List[Tuple[str, str, str]]], repeat: int, batch: bool) -> Tuple[float, List]:
+    """전체 flow 순위화 시간 (repeat회 중 최소, 초)과 마지막 결과"""
+    best = float('inf')
+    results = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if batch:
+            results = [ranker.rank_nodes(queries, top_k=1) for queries in flows]
+        else:
+            results = [[ranker.find_candidates(*query, top_k=1) for query in queries] for queries in flows]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def top1_ids(results: List) -> List[str]:
+    return [candidates[0]['id'] if candidates else 'T0000' for flow in results for candidates in flow]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare keyword and TF-IDF technique rankers on step3 outputs")
+    parser.add_argument("files", nargs="*", help=f"step3.yml files (default: {DEFAULT_PATTERN})")
+    parser.add_argument("--bundle", default=None, help="MITRE ATT&CK STIX bundle (default: MITRE_ATTACK_PATH)")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per ranker (best time is reported)")
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(DEFAULT_PATTERN))
+    if not files:
+        print(f"[ERROR] step3 출력 파일이 없습니다: {DEFAULT_PATTERN}")
+        sys.exit(1)
+
+    flows = [load_queries(path) for path in files]
+    node_count = sum(len(queries) for queries in flows)
+    records = load_techniques(args.bundle)
+    print(f"Flows: {len(flows)}, Nodes: {node_count}, Techniques: {len(records)}\n")
+
+    rows: Dict[str, Dict] = {}
+    for label, cls, batch in (("keyword", TechniqueIndex, False), ("tfidf", TfidfTechniqueRanker, True)):
+        start = time.perf_counter()
+        ranker = cls(records)
+        build = time.perf_counter() - start
+        elapsed, results = time_ranker(ranker, flows, args.repeat, batch)
+        ids = top1_ids(results)
+        rows[label] = {'build': build, 'rank': elapsed, 'ids': ids, 'unknown': ids.count('T0000')}
+
+    print(f"{'ranker':<10}{'build (ms)':>12}{'rank (ms)':>12}{'per node (us)':>15}{'T0000':>8}")
+    for label, row in rows.items():
+        per_node = row['rank'] / node_count * 1e6 if node_count else 0
+        print(f"{label:<10}{row['build'] * 1000:>12.1f}{row['rank'] * 1000:>12.1f}{per_node:>15.1f}{row['unknown']:>8}")
+
+    agree = sum(a == b for a, b in zip(rows['keyword']['ids'], rows['tfidf']['ids']))
+    if node_count:
+        print(f"\nTop-1 agreement: {agree}/{node_count} ({agree / node_count * 100:.1f}%)")
+        print(f"Speedup (rank): {rows['keyword']['rank'] / max(rows['tfidf']['rank'], 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
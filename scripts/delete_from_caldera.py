@@ -7,104 +7,16 @@ Caldera API - Delete Abilities and Adversaries
 3. 추적된 Abilities 삭제 (나중)
 """
 
-import requests
 import yaml
 from pathlib import Path
-from typing import List
 import sys
 import os
 
 # 프로젝트 루트를 경로에 추가
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from modules.core.config import get_caldera_url, get_caldera_api_key
-
-
-class CalderaDeleter:
-    def __init__(self):
-        self.base_url = get_caldera_url()
-        self.api_key = get_caldera_api_key()
-        self.session = requests.Session()
-        self.session.headers.update({'KEY': api_key})
-
-        # 삭제 통계
-        self.deleted_abilities = 0
-        self.deleted_adversaries = 0
-        self.failed_abilities = 0
-        self.failed_adversaries = 0
-
-    def delete_adversaries(self, adversary_ids: List[str]):
-        """Adversaries 삭제 (먼저 삭제해야 함)"""
-        if not adversary_ids:
-            print("\n  No adversaries to delete")
-            return
-
-        print("\n" + "="*70)
-        print("Adversaries 삭제 시작")
-        print("="*70)
-        print(f"  Total adversaries to delete: {len(adversary_ids)}")
-
-        for i, adversary_id in enumerate(adversary_ids, 1):
-            print(f"\n  [{i}/{len(adversary_ids)}] Deleting adversary: {adversary_id[:8]}...")
-
-            url = f"{self.base_url}/api/v2/adversaries/{adversary_id}"
-            response = self.session.delete(url)
-
-            if response.status_code == 200:
-                print(f"    [OK] Deleted successfully")
-                self.deleted_adversaries += 1
-            elif response.status_code == 404:
-                print(f"    [WARNING] Not found (already deleted?)")
-                self.deleted_adversaries += 1
-            else:
-                print(f"    [FAILED] Status: {response.status_code}")
-                print(f"    Error: {response.text[:200]}")
-                self.failed_adversaries += 1
-
-        print(f"\n{'='*70}")
-        print(f"Adversaries 삭제 완료: {self.deleted_adversaries} 성공, {self.failed_adversaries} 실패")
-        print(f"{'='*70}")
-
-    def delete_abilities(self, ability_ids: List[str]):
-        """Abilities 삭제"""
-        if not ability_ids:
-            print("\n  No abilities to delete")
-            return
-
-        print("\n" + "="*70)
-        print("Abilities 삭제 시작")
-        print("="*70)
-        print(f"  Total abilities to delete: {len(ability_ids)}")
-
-        for i, ability_id in enumerate(ability_ids, 1):
-            print(f"\n  [{i}/{len(ability_ids)}] Deleting ability: {ability_id[:8]}...")
-
-            url = f"{self.base_url}/api/v2/abilities/{ability_id}"
-            response = self.session.delete(url)
-
-            if response.status_code == 200:
-                print(f"    [OK] Deleted successfully")
-                self.deleted_abilities += 1
-            elif response.status_code == 404:
-                print(f"    [WARNING] Not found (already deleted?)")
-                self.deleted_abilities += 1
-            else:
-                print(f"    [FAILED] Status: {response.status_code}")
-                print(f"    Error: {response.text[:200]}")
-                self.failed_abilities += 1
-
-        print(f"\n{'='*70}")
-        print(f"Abilities 삭제 완료: {self.deleted_abilities} 성공, {self.failed_abilities} 실패")
-        print(f"{'='*70}")
-
-    def print_summary(self):
-        """삭제 요약 출력"""
-        print("\n" + "="*70)
-        print("삭제 요약")
-        print("="*70)
-        print(f"  Adversaries: {self.deleted_adversaries} 삭제, {self.failed_adversaries} 실패")
-        print(f"  Abilities: {self.deleted_abilities} 삭제, {self.failed_abilities} 실패")
-        print("="*70)
+from modules.caldera.bulk import DEFAULT_BULK_WORKERS, DEFAULT_ITEM_RETRIES
+from modules.caldera.deleter import CalderaDeleter
 
 
 def main():
@@ -116,6 +28,10 @@ def main():
     parser.add_argument("tracking_file_pos", nargs="?", help="Path to uploaded_ids.yml file (positional)")
     parser.add_argument("--caldera-dir", type=str, help="Caldera output directory (e.g., data/processed/20251203_142900/caldera)")
     parser.add_argument("--tracking-file", type=str, dest="tracking_file_named", help="Path to uploaded_ids.yml file")
+    parser.add_argument("--workers", type=int, default=DEFAULT_BULK_WORKERS,
+                        help=f"Concurrent delete requests (1 = sequential, default: {DEFAULT_BULK_WORKERS})")
+    parser.add_argument("--retries", type=int, default=DEFAULT_ITEM_RETRIES,
+                        help=f"Extra attempts per item on connection errors or 429/5xx (default: {DEFAULT_ITEM_RETRIES})")
 
     args = parser.parse_args()
 
@@ -166,13 +82,10 @@ def main():
         sys.exit(0)
 
     # Deleter 생성
-    deleter = CalderaDeleter()
+    deleter = CalderaDeleter(max_workers=args.workers, retries=args.retries)
 
-    # 순서 중요: Adversaries 먼저 삭제 (Abilities를 참조하므로)
-    deleter.delete_adversaries(adversary_ids)
-
-    # Abilities 삭제
-    deleter.delete_abilities(ability_ids)
+    # 순서 중요: Adversaries를 모두 삭제한 뒤 Abilities 삭제 (Adversary가 Ability를 참조하므로)
+    deleter.delete_all(adversary_ids, ability_ids)
 
     # 요약 출력
     deleter.print_summary()
@@ -0,0 +1,167 @@
+"""
+Step 3 Technique 일괄 재매핑
+MITRE ATT&CK 데이터가 갱신된 뒤 기존 step3.yml 결과들의 노드 technique를 공유 인덱스 하나로 다시 선택하고
+파일을 제자리에서 갱신 (변경된 ID 요약 출력)
+
+사용 예:
+  python scripts/remap_techniques.py --dry-run
+  python scripts/remap_techniques.py "data/processed/KISA_TTPs_1/*/step3.yml" --ranker tfidf
+"""
+
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Dict, Iterator, List, Tuple
+
+import yaml
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.mitre.index import TechniqueIndex, node_query
+from modules.mitre.snapshot import load_techniques
+from modules.mitre.tfidf import TfidfTechniqueRanker
+
+DEFAULT_PATTERN = "data/processed/*/*/step3.yml"
+# 한 번에 순위화할 최대 노드 수 (이만큼 모이면 순위화 후 파일 기록, 메모리 사용량 제한)
+DEFAULT_BATCH_NODES = 2000
+
+UNKNOWN_TECHNIQUE = {'id': 'T0000', 'name': 'Unknown'}
+
+
+def iter_step3_files(patterns: List[str]) -> Iterator[Tuple[str, Dict]]:
+    """패턴에 맞는 step3.yml을 하나씩 읽어 (경로, 데이터) 반환 (읽을 수 없는 파일은 건너뜀)"""
+    seen = set()
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            if path in seen:
+                continue
+            seen.add(path)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = yaml.safe_load(f) or {}
+            except (OSError, yaml.YAMLError) as e:
+                print(f"  [WARNING] {path}: {e}")
+                continue
+            if not isinstance(data, dict) or not isinstance(data.get('concrete_flow'), dict):
+                print(f"  [WARNING] {path}: concrete_flow가 없어 건너뜀")
+                continue
+            yield path, data
+
+
+def write_step3(path: str, data: Dict):
+    """Step 3와 같은 형식으로 기록 (임시 파일 작성 후 원자적 교체)"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            yaml.dump(data, f, allow_unicode=True, sort_keys=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class TechniqueRemapper:
+    """여러 step3 파일의 노드를 배치로 모아 한 번에 순위화하고 technique를 갱신."""
+
+    def __init__(self, ranker, dry_run: bool = False, batch_nodes: int = DEFAULT_BATCH_NODES):
+        self.ranker = ranker
+        self.dry_run = dry_run
+        self.batch_nodes = batch_nodes
+        self.files = 0
+        self.files_changed = 0
+        self.nodes = 0
+        self.transitions: Counter = Counter()
+        self._pending: List[Tuple[str, Dict]] = []
+        self._pending_nodes = 0
+
+    def add(self, path: str, data: Dict):
+        self._pending.append((path, data))
+        self._pending_nodes += len(data['concrete_flow'].get('nodes') or [])
+        if self._pending_nodes >= self.batch_nodes:
+            self.flush()
+
+    def flush(self):
+        """대기 중인 파일의 노드를 한 번에 순위화하고 변경된 파일 기록"""
+        if not self._pending:
+            return
+
+        nodes = [node for _, data in self._pending for node in data['concrete_flow'].get('nodes') or []]
+        ranked = iter(self.ranker.rank_nodes([node_query(node) for node in nodes], top_k=1))
+
+        for path, data in self._pending:
+            changes = []
+            dirty = False
+            for node in data['concrete_flow'].get('nodes') or []:
+                candidates = next(ranked)
+                new = {'id': candidates[0]['id'], 'name': candidates[0]['name']} if candidates else dict(UNKNOWN_TECHNIQUE)
+                old_id = (node.get('technique') or {}).get('id', 'T0000')
+                if node.get('technique') != new:
+                    node['technique'] = new
+                    dirty = True
+                    if old_id != new['id']:
+                        changes.append((node.get('id', node.get('name', '?')), old_id, new['id']))
+                        self.transitions[(old_id, new['id'])] += 1
+                self.nodes += 1
+
+            self.files += 1
+            if changes:
+                self.files_changed += 1
+                print(f"  {path}: {len(changes)} changed")
+                for node_id, old_id, new_id in changes:
+                    print(f"    - {node_id}: {old_id} → {new_id}")
+            if dirty and not self.dry_run:
+                write_step3(path, data)
+
+        self._pending = []
+        self._pending_nodes = 0
+
+    def print_summary(self, elapsed: float):
+        changed = sum(self.transitions.values())
+        print("\n" + "=" * 70)
+        print(f"Files: {self.files} (changed: {self.files_changed}), Nodes: {self.nodes} (changed: {changed}), "
+              f"{elapsed:.2f}s")
+        if self.transitions:
+            print("\n[Technique ID changes]")
+            for (old_id, new_id), count in self.transitions.most_common():
+                print(f"  {old_id} → {new_id}: {count}")
+        if self.dry_run:
+            print("\n[DRY RUN] 파일을 수정하지 않았습니다.")
+        print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-assign MITRE techniques in existing step3 outputs")
+    parser.add_argument("patterns", nargs="*", help=f"step3.yml glob patterns (default: {DEFAULT_PATTERN})")
+    parser.add_argument("--ranker", choices=["keyword", "tfidf"], default="keyword",
+                        help="Technique ranker (default: keyword, same as Step 3)")
+    parser.add_argument("--bundle", default=None, help="MITRE ATT&CK STIX bundle (default: MITRE_ATTACK_PATH)")
+    parser.add_argument("--batch-nodes", type=int, default=DEFAULT_BATCH_NODES,
+                        help=f"Nodes ranked per batch (default: {DEFAULT_BATCH_NODES})")
+    parser.add_argument("--dry-run", action="store_true", help="Only print changes, do not modify files")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    records = load_techniques(args.bundle)
+    ranker = TfidfTechniqueRanker(records) if args.ranker == "tfidf" else TechniqueIndex(records)
+    print(f"[INFO] {len(records)} techniques indexed (ranker: {args.ranker})")
+
+    remapper = TechniqueRemapper(ranker, dry_run=args.dry_run, batch_nodes=args.batch_nodes)
+    for path, data in iter_step3_files(args.patterns or [DEFAULT_PATTERN]):
+        remapper.add(path, data)
+    remapper.flush()
+
+    if not remapper.files:
+        print(f"[ERROR] step3 출력 파일이 없습니다: {', '.join(args.patterns or [DEFAULT_PATTERN])}")
+        sys.exit(1)
+
+    remapper.print_summary(time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
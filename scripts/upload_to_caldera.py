@@ -2,122 +2,29 @@
 Caldera API - Upload Abilities and Adversaries
 
 기능:
-1. abilities.yml 파싱 → Caldera API 업로드 (upsert)
+1. abilities.yml 파싱 → Caldera API 업로드 (upsert, 마지막 업로드 이후 변경된 ability만)
 2. adversaries.yml 파싱 → Caldera API 업로드 (upsert)
 3. 수정된 ability만 업데이트 (--update-corrected)
 """
 
 import sys
 import argparse
-import requests
 import yaml
 import json
 from pathlib import Path
 from typing import List
-import sys
 import os
 
 # 프로젝트 루트를 경로에 추가
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from modules.core.config import get_caldera_url, get_caldera_api_key
-
-
-class CalderaUploader:
-    def __init__(self):
-        self.base_url = get_caldera_url()
-        self.api_key = get_caldera_api_key()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'KEY': api_key,
-            'Content-Type': 'application/json'
-        })
-        self.uploaded_ability_ids = []
-        self.uploaded_adversary_ids = []
-
-    def _upsert(self, endpoint: str, item_id: str, data: dict) -> tuple[bool, str]:
-        """공통 upsert 로직: 존재하면 PUT, 없으면 POST"""
-        check_url = f"{self.base_url}/api/v2/{endpoint}/{item_id}"
-        exists = self.session.get(check_url).status_code == 200
-
-        if exists:
-            response = self.session.put(check_url, data=json.dumps(data))
-            action = "UPDATE"
-        else:
-            url = f"{self.base_url}/api/v2/{endpoint}"
-            response = self.session.post(url, data=json.dumps(data))
-            action = "CREATE"
-
-        return response.status_code == 200, action
-
-    def upload_abilities(self, abilities_file: str) -> List[str]:
-        """Abilities 업로드 (upsert)"""
-        print("\n" + "="*70)
-        print("Abilities 업로드")
-        print("="*70)
+from modules.caldera.bulk import DEFAULT_BULK_WORKERS, DEFAULT_ITEM_RETRIES
+from modules.caldera.uploader import CalderaUploader as BaseCalderaUploader, ability_content_hash, manifest_path_for
 
-        with open(abilities_file, 'r', encoding='utf-8') as f:
-            abilities = yaml.safe_load(f) or []
-
-        if not abilities:
-            print("  [ERROR] No abilities found")
-            return []
-
-        uploaded_ids = []
-        created, updated = 0, 0
-
-        for i, ability in enumerate(abilities, 1):
-            ability_id = ability.get('ability_id')
-            print(f"  [{i}/{len(abilities)}] {ability.get('name', 'Unknown')}")
-
-            success, action = self._upsert('abilities', ability_id, ability)
-            if success:
-                print(f"    [OK] {action}")
-                uploaded_ids.append(ability_id)
-                self.uploaded_ability_ids.append(ability_id)
-                created += 1 if action == "CREATE" else 0
-                updated += 1 if action == "UPDATE" else 0
-            else:
-                print(f"    [FAILED]")
-
-        print(f"\n  완료: {len(uploaded_ids)}/{len(abilities)} (신규: {created}, 수정: {updated})")
-        return uploaded_ids
-
-    def upload_adversaries(self, adversaries_file: str) -> List[str]:
-        """Adversaries 업로드 (upsert)"""
-        print("\n" + "="*70)
-        print("Adversaries 업로드")
-        print("="*70)
-
-        with open(adversaries_file, 'r', encoding='utf-8') as f:
-            adversaries = yaml.safe_load(f) or []
-
-        if not adversaries:
-            print("  [ERROR] No adversaries found")
-            return []
-
-        uploaded_ids = []
-        created, updated = 0, 0
-
-        for i, adversary in enumerate(adversaries, 1):
-            adversary_id = adversary.get('adversary_id')
-            print(f"  [{i}/{len(adversaries)}] {adversary.get('name', 'Unknown')}")
-
-            success, action = self._upsert('adversaries', adversary_id, adversary)
-            if success:
-                print(f"    [OK] {action}")
-                uploaded_ids.append(adversary_id)
-                self.uploaded_adversary_ids.append(adversary_id)
-                created += 1 if action == "CREATE" else 0
-                updated += 1 if action == "UPDATE" else 0
-            else:
-                print(f"    [FAILED]")
-
-        print(f"\n  완료: {len(uploaded_ids)}/{len(adversaries)} (신규: {created}, 수정: {updated})")
-        return uploaded_ids
 
+class CalderaUploader(BaseCalderaUploader):
     def update_corrected_abilities(self, abilities_file: str, correction_report: str) -> List[str]:
-        """수정된 Ability만 업데이트"""
+        """수정된 Ability만 업데이트 (업로드 매니페스트의 내용 해시도 갱신)"""
         print("\n" + "="*70)
         print("수정된 Abilities 업데이트")
         print("="*70)
@@ -138,34 +45,28 @@ class CalderaUploader:
             abilities = yaml.safe_load(f) or []
 
         to_update = [a for a in abilities if a.get('ability_id') in corrected_ids]
-        updated_ids = []
-
-        for i, ability in enumerate(to_update, 1):
-            ability_id = ability.get('ability_id')
-            print(f"  [{i}/{len(to_update)}] {ability.get('name', 'Unknown')}")
 
-            url = f"{self.base_url}/api/v2/abilities/{ability_id}"
-            response = self.session.put(url, data=json.dumps(ability))
-
-            if response.status_code == 200:
-                print(f"    [OK] Updated")
-                updated_ids.append(ability_id)
-            else:
-                print(f"    [FAILED]")
+        # 서버에서 삭제된 ability는 다시 생성 (목록 조회 실패 시 항목별 GET으로 확인)
+        existing = self._fetch_existing_ids('abilities', 'ability_id')
+        items = [(a.get('ability_id'), a, None if existing is None else a.get('ability_id') in existing)
+                 for a in to_update]
+        summary = self._upload_items('abilities', 'ability', items)
+        updated_ids = [result.item_id for result in summary.succeeded]
+
+        # 다음 전체 업로드에서 같은 내용을 다시 올리지 않도록 매니페스트 갱신
+        manifest_file = manifest_path_for(abilities_file)
+        hashes = self._load_manifest(manifest_file, self.base_url)
+        content_hashes = {a.get('ability_id'): ability_content_hash(a) for a in to_update}
+        for ability_id in updated_ids:
+            hashes[ability_id] = content_hashes[ability_id]
+        for result in summary.failed:
+            hashes.pop(result.item_id, None)
+        self._save_manifest(manifest_file, self.base_url, hashes)
 
         print(f"\n  완료: {len(updated_ids)}/{len(to_update)}")
+        summary.print_summary()
         return updated_ids
 
-    def save_tracking_file(self, output_file: str):
-        """업로드된 ID 추적 파일 저장"""
-        tracking_data = {
-            'abilities': self.uploaded_ability_ids,
-            'adversaries': self.uploaded_adversary_ids
-        }
-        with open(output_file, 'w', encoding='utf-8') as f:
-            yaml.dump(tracking_data, f, allow_unicode=True, sort_keys=False)
-        print(f"\n[OK] Tracking file: {output_file}")
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -182,6 +83,10 @@ def main():
     )
     parser.add_argument("--caldera-dir", type=str, required=True, help="Caldera output directory")
     parser.add_argument("--update-corrected", action="store_true", help="수정된 ability만 업데이트")
+    parser.add_argument("--workers", type=int, default=DEFAULT_BULK_WORKERS,
+                        help=f"동시 업로드 요청 수 (1이면 순차, 기본: {DEFAULT_BULK_WORKERS})")
+    parser.add_argument("--retries", type=int, default=DEFAULT_ITEM_RETRIES,
+                        help=f"항목별 추가 시도 횟수 (연결 오류, 429/5xx, 기본: {DEFAULT_ITEM_RETRIES})")
 
     args = parser.parse_args()
     caldera_dir = Path(args.caldera_dir)
@@ -191,7 +96,7 @@ def main():
     adversaries_file = caldera_dir / "adversaries.yml"
     correction_report = caldera_dir / "correction_report.json"
 
-    uploader = CalderaUploader()
+    uploader = CalderaUploader(max_workers=args.workers, retries=args.retries)
 
     # 모드 1: 수정된 ability만 업데이트
     if args.update_corrected:
@@ -214,8 +119,8 @@ def main():
         print(f"[ERROR] File not found: {adversaries_file}")
         sys.exit(1)
 
-    uploader.upload_abilities(str(abilities_file))
-    uploader.upload_adversaries(str(adversaries_file))
+    # Abilities를 모두 업로드한 뒤 Adversaries 업로드
+    uploader.upload_all(str(abilities_file), str(adversaries_file))
 
     tracking_file = caldera_dir / "uploaded_ids.yml"
     uploader.save_tracking_file(str(tracking_file))